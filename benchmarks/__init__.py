@@ -0,0 +1 @@
+""" Benchmarks for the performance-sensitive parts of Elisio; run them as e.g. python -m benchmarks.bench_layer """
@@ -0,0 +1,59 @@
+"""
+The accents and Zeleny scores of many scanned verses: computed by the methods of every Verse,
+or by elisio.parser.analytics for all verses at once, from the columns of a VerseStore. Needs NumPy.
+The scanned verses of the corpus are repeated, as the analytics are meant for a corpus of thousands of verses.
+"""
+import os
+import tempfile
+import timeit
+
+from elisio.parser import analytics
+from elisio.parser.verse import Verse
+from elisio.parser.versefactory import VerseFactory, VerseType
+from elisio.parser.versestore import VerseStore
+
+from .corpus import ELEGIACS, HEXAMETERS
+
+REPEAT = 5
+NUMBER = 10
+COPIES = 200
+
+
+def per_verse(verses: list[Verse]) -> list[list[int]]:
+    scores = []
+    for verse in verses:
+        verse.add_accents()
+        scores.append(verse.get_zeleny_score())
+    return scores
+
+
+def bulk(columns: analytics.Columns) -> list[list[int]]:
+    stressed = analytics.get_accents(columns.weights, columns.word_syllable_start)
+    return analytics.to_lists(*analytics.get_zeleny_scores(columns.weights, stressed, columns.verse_syllable_start))
+
+
+def time_bulk(store: VerseStore, verses: list[Verse]) -> float:
+    # the arrays must not hold the columns of the store when it is closed: they are released on return
+    columns = analytics.Columns.of(store)
+    assert bulk(columns) == per_verse(verses)
+    return min(timeit.repeat(lambda: bulk(columns), repeat=REPEAT, number=NUMBER))
+
+
+def main() -> None:
+    results = VerseFactory.create_many(HEXAMETERS + ELEGIACS, creators=VerseType.UNKNOWN, workers=1)
+    verses = [result for result in results if isinstance(result, Verse)] * COPIES
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "verses.bin")
+        VerseStore.write(path, verses)
+        with VerseStore(path) as store:
+            timings = {
+                'per verse': min(timeit.repeat(lambda: per_verse(verses), repeat=REPEAT, number=NUMBER)),
+                'bulk': time_bulk(store, verses),
+            }
+    print(f"{len(verses)} verses")
+    for name, timing in timings.items():
+        print(f"{name:10} {timing / NUMBER / len(verses) * 1e6:8.2f} us/verse")
+
+
+if __name__ == '__main__':
+    main()
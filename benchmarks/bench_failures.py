@@ -0,0 +1,58 @@
+"""
+Scanning verses with verse types that do not fit them, so that all candidate scansions fail:
+the verses of the corpus that cannot be scanned as hexameters, pentameters, hendecasyllables,
+or hexameters or pentameters.
+VersePreprocessor.scan keeps every failed candidate as a ScanFailure, without its traceback;
+this compares it with VersePreprocessor.create_verse, which raises the failures again at the public API.
+The words are analyzed before timing, so only the candidates are timed.
+"""
+import timeit
+from typing import Optional
+
+from elisio.exceptions import ScansionException
+from elisio.parser.verse import Verse
+from elisio.parser.versefactory import VersePreprocessor, VerseType
+
+from .corpus import ELEGIACS, HEXAMETERS
+
+REPEAT = 5
+NUMBER = 10
+VERSE_TYPES = [VerseType.HEXAMETER, VerseType.PENTAMETER, VerseType.HENDECASYLLABUS, VerseType.UNKNOWN]
+
+
+def prepare() -> list[VersePreprocessor]:
+    preprocessors = [VersePreprocessor(line, creators=verse_type)
+                     for verse_type in VERSE_TYPES for line in HEXAMETERS + ELEGIACS]
+    return [preprocessor for preprocessor in preprocessors if not preprocessor.scan().ok]
+
+
+PREPROCESSORS = prepare()
+
+
+def create(preprocessor: VersePreprocessor) -> Optional[Verse]:
+    try:
+        return preprocessor.create_verse(0)
+    except ScansionException:
+        return None
+
+
+def raising() -> list[Optional[Verse]]:
+    return [create(preprocessor) for preprocessor in PREPROCESSORS]
+
+
+def results() -> list[Optional[Verse]]:
+    return [preprocessor.scan().verse for preprocessor in PREPROCESSORS]
+
+
+def main() -> None:
+    assert raising() == results() == [None] * len(PREPROCESSORS)
+    candidates = sum(len(preprocessor.scan().failures) for preprocessor in PREPROCESSORS)
+    print(f"{len(PREPROCESSORS)} verses, {candidates / len(PREPROCESSORS):.1f} failed candidates per verse")
+    for function_name in ("raising", "results"):
+        timer = timeit.Timer(f"{function_name}()", globals=globals())
+        best = min(timer.repeat(REPEAT, NUMBER)) / NUMBER * 1e6 / len(PREPROCESSORS)
+        print(f"{function_name:12} {best:10.1f} us/verse")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Scanning mixed-meter input with VerseType.UNKNOWN tries the hexameter creator before the pentameter creator.
+VerseFactory.create analyzes the words of a verse once, however many creators are tried;
+this compares it with creating the verse for one verse type after the other, which analyzes them again every time.
+"""
+import timeit
+from typing import Optional
+
+import elisio
+from elisio.exceptions import ScansionException
+from elisio.parser.verse import Verse
+from elisio.parser.versefactory import VerseFactory, VerseType
+
+from .corpus import ELEGIACS
+
+REPEAT = 5
+NUMBER = 10
+VERSE_TYPES = [VerseType.HEXAMETER, VerseType.PENTAMETER]  # the creators of VerseType.UNKNOWN, in order
+
+
+def create(line: str) -> Optional[Verse]:
+    try:
+        return VerseFactory.create(line, creators=[VerseType.UNKNOWN])
+    except ScansionException:
+        return None
+
+
+def create_per_type(line: str) -> Optional[Verse]:
+    for verse_type in VERSE_TYPES:
+        try:
+            return VerseFactory.create(line, creators=[verse_type])
+        except ScansionException:
+            continue
+    return None
+
+
+def shared() -> list[Optional[Verse]]:
+    return [create(line) for line in ELEGIACS]
+
+
+def per_creator() -> list[Optional[Verse]]:
+    return [create_per_type(line) for line in ELEGIACS]
+
+
+def run(function_name: str) -> float:
+    """ the best time per verse in microseconds """
+    globals()[function_name]()  # warm up: Whitaker's Words is loaded lazily
+    timer = timeit.Timer(f"{function_name}()", globals=globals())
+    return min(timer.repeat(REPEAT, NUMBER)) / NUMBER * 1e6 / len(ELEGIACS)
+
+
+def main() -> None:
+    # without the word caches, every analysis of a word costs what it would cost the first time
+    elisio.configure(whitaker_cache_size=0, word_cache_size=0)
+    assert [verse and verse.feet for verse in shared()] == [verse and verse.feet for verse in per_creator()]
+    for function_name in ("per_creator", "shared"):
+        print(f"{function_name:12} {run(function_name):10.1f} us/verse")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Opening a Lexicon file and looking up word forms in it, compared with loading the same lexicon
+from JSON into the dict of a LocalDictionaryBridge.
+"""
+import json
+import os
+import random
+import tempfile
+import timeit
+import tracemalloc
+
+from elisio.bridge import LexiconBridge, LocalDictionaryBridge
+
+FORMS = 300000
+LOOKUPS = 100000
+
+
+def make_entries() -> dict[str, list[str]]:
+    rnd = random.Random(14)
+    letters = "abcdefghilmnopqrstuv"
+    entries = {}
+    while len(entries) < FORMS:
+        form = ''.join(rnd.choice(letters) for _ in range(rnd.randint(2, 12)))
+        entries[form] = [''.join(rnd.choice("123") for _ in range(len(form) // 3 + 1))]
+    return entries
+
+
+def measure(name: str, load, words: list[str]) -> None:
+    tracemalloc.start()
+    start = timeit.default_timer()
+    bridge = load()
+    opened = timeit.default_timer() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    lookups = timeit.timeit(lambda: [bridge.use_dictionary(word) for word in words], number=1)
+    print(f"{name:10} open {opened * 1e3:8.1f} ms  {allocated / 2 ** 20:8.1f} MiB  "
+          f"lookup {lookups * 1e6 / len(words):6.2f} us")
+    bridge.close()
+
+
+def main() -> None:
+    entries = make_entries()
+    rnd = random.Random(1)
+    words = rnd.sample(sorted(entries), LOOKUPS // 2) + [f"{word}x" for word in rnd.sample(sorted(entries), 10)]
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "lexicon.json")
+        lexicon_path = os.path.join(directory, "lexicon.bin")
+        with open(json_path, 'w') as file:
+            json.dump(entries, file)
+        LocalDictionaryBridge(entries).write_lexicon(lexicon_path)
+        del entries
+
+        def load_json() -> LocalDictionaryBridge:
+            with open(json_path) as file:
+                bridge = LocalDictionaryBridge(json.load(file))
+            # LocalDictionaryBridge raises for unknown words; misses are only looked up in the lexicon
+            bridge.cache.update((word, []) for word in words if word not in bridge.cache)
+            return bridge
+
+        measure("json+dict", load_json, words)
+        measure("lexicon", lambda: LexiconBridge(lexicon_path), words)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""
+The memory that the scanned verses of the corpus keep alive, and the memory allocated while scanning them,
+measured with tracemalloc. Most of it is taken by the syllables of the words of the verses.
+"""
+import tracemalloc
+
+import elisio
+from elisio.parser.versefactory import VersePreprocessor, VerseType
+
+from .corpus import ELEGIACS, HEXAMETERS
+
+
+def scan() -> list[VersePreprocessor]:
+    """ the analyzed verses, with their words and syllables """
+    preprocessors = [VersePreprocessor(line, creators=VerseType.UNKNOWN) for line in HEXAMETERS + ELEGIACS]
+    for preprocessor in preprocessors:
+        preprocessor.scan()
+    return preprocessors
+
+
+def main() -> None:
+    # without the word caches, every word makes its own syllables
+    elisio.configure(whitaker_cache_size=0, word_cache_size=0)
+    scan()  # warm up: Whitaker's Words is loaded lazily
+    tracemalloc.start()
+    preprocessors = scan()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    syllables = sum(len(word.syllables) for preprocessor in preprocessors for word in preprocessor.words)
+    print(f"{len(preprocessors)} verses, {syllables} syllables")
+    print(f"kept      {current / len(preprocessors):10.0f} bytes/verse")
+    print(f"peak      {peak / len(preprocessors):10.0f} bytes/verse")
+
+
+if __name__ == '__main__':
+    main()
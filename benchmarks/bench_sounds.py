@@ -0,0 +1,28 @@
+"""
+Finding the sounds of every token of the corpus, with the table-driven tokenizer
+and with the reference implementation that creates sounds one window of 3 letters at a time.
+"""
+import re
+import timeit
+
+from elisio.sound import SoundFactory
+
+from .corpus import ELEGIACS, HEXAMETERS
+from .reference import find_sounds_by_windows
+
+REPEAT = 5
+NUMBER = 20
+TOKENS = [token for line in HEXAMETERS + ELEGIACS for token in re.split('[^a-zA-Zë]+', line) if token]
+
+
+def main() -> None:
+    assert all(SoundFactory.find_sounds_for_text(token) == find_sounds_by_windows(token)
+               for token in TOKENS)
+    for name, function in (("find_sounds_by_windows", find_sounds_by_windows),
+                           ("find_sounds_for_text", SoundFactory.find_sounds_for_text)):
+        best = min(timeit.repeat(lambda: [function(token) for token in TOKENS], repeat=REPEAT, number=NUMBER))
+        print(f"{name:24} {best / NUMBER * 1e6 / len(TOKENS):8.2f} us/token")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+The scanned verses of the corpus, written to a VerseStore file and read back through its memory-mapped columns:
+the size of the file, and the time to compute the Zeleny scores of all verses from the columns,
+compared with the memory that the Verse objects keep alive and the time to compute the scores from them.
+"""
+import os
+import tempfile
+import timeit
+import tracemalloc
+
+from elisio.parser.verse import Verse
+from elisio.parser.versefactory import VerseFactory, VerseType
+from elisio.parser.versestore import VerseStore
+
+from .corpus import ELEGIACS, HEXAMETERS
+
+REPEAT = 5
+NUMBER = 10
+
+
+def scan() -> list[Verse]:
+    results = VerseFactory.create_many(HEXAMETERS + ELEGIACS, creators=VerseType.UNKNOWN, workers=1)
+    return [result for result in results if isinstance(result, Verse)]
+
+
+def main() -> None:
+    scan()  # warm up: Whitaker's Words is loaded lazily
+    tracemalloc.start()
+    verses = scan()
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "verses.bin")
+        VerseStore.write(path, verses)
+        size = os.path.getsize(path)
+        with VerseStore(path) as store:
+            stored = min(timeit.repeat(lambda: [store.get_zeleny_score(index) for index in range(len(store))],
+                                       repeat=REPEAT, number=NUMBER))
+    objects = min(timeit.repeat(lambda: [verse.get_zeleny_score() for verse in verses],
+                                repeat=REPEAT, number=NUMBER))
+    print(f"{len(verses)} verses")
+    print(f"objects   {kept / len(verses):10.0f} bytes/verse {objects / NUMBER / len(verses) * 1e6:8.2f} us/verse")
+    print(f"store     {size / len(verses):10.0f} bytes/verse {stored / NUMBER / len(verses) * 1e6:8.2f} us/verse")
+
+
+if __name__ == '__main__':
+    main()
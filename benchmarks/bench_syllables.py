@@ -0,0 +1,30 @@
+"""
+Joining the sounds of every token of the corpus into syllables, with the single-pass joiner
+and with the reference implementation that tries out every sound on a copy of the syllable.
+"""
+import re
+import timeit
+
+from elisio.sound import SoundFactory
+from elisio.syllable import SyllableSplitter
+
+from .corpus import ELEGIACS, HEXAMETERS
+from .reference import join_by_trial
+
+REPEAT = 5
+NUMBER = 20
+TOKENS = [token for line in HEXAMETERS + ELEGIACS for token in re.split('[^a-zA-Zë]+', line) if token]
+SOUNDS = [SoundFactory.find_sounds_for_text(token) for token in TOKENS]
+
+
+def main() -> None:
+    assert all(SyllableSplitter.join_into_syllables(sounds) == join_by_trial(sounds)
+               for sounds in SOUNDS)
+    for name, function in (("join_by_trial", join_by_trial),
+                           ("join_into_syllables", SyllableSplitter.join_into_syllables)):
+        best = min(timeit.repeat(lambda: [function(sounds) for sounds in SOUNDS], repeat=REPEAT, number=NUMBER))
+        print(f"{name:24} {best / NUMBER * 1e6 / len(TOKENS):8.2f} us/token")
+
+
+if __name__ == '__main__':
+    main()
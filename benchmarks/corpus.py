@@ -0,0 +1,30 @@
+""" sample texts shared by the benchmarks """
+
+# Vergil, Aeneid I, 1-11
+HEXAMETERS = [
+    "Arma virumque cano, Troiae qui primus ab oris",
+    "Italiam fato profugus Laviniaque venit",
+    "litora, multum ille et terris iactatus et alto",
+    "vi superum, saevae memorem Iunonis ob iram,",
+    "multa quoque et bello passus, dum conderet urbem",
+    "inferretque deos Latio; genus unde Latinum",
+    "Albanique patres atque altae moenia Romae.",
+    "Musa, mihi causas memora, quo numine laeso",
+    "quidve dolens regina deum tot volvere casus",
+    "insignem pietate virum, tot adire labores",
+    "impulerit. Tantaene animis caelestibus irae?",
+]
+
+# Ovid, Tristia III, 1-10
+ELEGIACS = [
+    "Missus in hanc venio timide liber exulis urbem:",
+    "da placidam fesso, lector amice, manum;",
+    "neve reformida, ne sim tibi forte pudori:",
+    "nullus in hac charta versus amare docet.",
+    "haec domini fortuna mei est, ut debeat illam",
+    "infelix nullis dissimulare iocis.",
+    "id quoque, quod viridi quondam male lusit in aevo,",
+    "heu nimium sero damnat et odit opus!",
+    "inspice quid portem: nihil hic nisi triste videbis,",
+    "carmine temporibus conveniente suis.",
+]
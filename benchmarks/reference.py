@@ -0,0 +1,55 @@
+"""
+The reference implementations of the tokenizer and the syllabifier: simpler and slower than the ones of elisio,
+which must give the same results. They are only kept to test and time those against.
+"""
+from typing import Sequence
+
+from elisio.exceptions import SyllableException
+from elisio.sound import Sound, SoundFactory
+from elisio.syllable import Syllable
+
+
+def find_sounds_by_windows(text: str) -> list[Sound]:
+    """
+    iteratively allocate all text to a sound, one window of 3 letters at a time
+    this is the reference implementation of SoundFactory.find_sounds_for_text
+    """
+    i = 0
+    sounds: list[Sound] = []
+    while i < len(text):
+        added_sounds = SoundFactory.create_sounds_from_text(text[i:i + 3])
+        for sound in added_sounds:
+            sounds.append(sound)
+            i += len(sound.letters)
+    return sounds
+
+
+def join_by_trial(sounds: Sequence[Sound]) -> list[Syllable]:
+    """
+    join a list of sounds into a preliminary syllable
+    keep adding sounds to the syllable until it becomes illegal, or the word ends.
+    at either point, save the syllable and start building a new syllable
+    this is the reference implementation of SyllableSplitter.join_into_syllables
+    """
+    syllables = []
+    current_syllable = _first_sounds(sounds)
+    counter = len(current_syllable.sounds)
+    while counter < len(sounds):
+        try:
+            current_syllable.add_sound(sounds[counter])
+            counter += 1
+        except SyllableException:
+            syllables.append(current_syllable)
+            current_syllable = _first_sounds(sounds[counter:])
+            counter += len(current_syllable.sounds)
+    syllables.append(current_syllable)
+    return syllables
+
+
+def _first_sounds(sounds: Sequence[Sound]) -> Syllable:
+    result = []
+    for sound in sounds:
+        result.append(sound)
+        if not sound.consonant:
+            break
+    return Syllable(result)
@@ -0,0 +1,22 @@
+""" Elisio is a scanning engine for (classical) Latin verse """
+from typing import TYPE_CHECKING, Optional
+
+from .word import set_parser, whitaker_cache, word_cache
+
+if TYPE_CHECKING:
+    from whitakers_words.parser import Parser
+
+
+def configure(parser: Optional['Parser'] = None, whitaker_cache_size: Optional[int] = None,
+              word_cache_size: Optional[int] = None) -> None:
+    """
+    set up the process-wide state of the scanning engine
+    the given Whitaker parser replaces the one that would otherwise be loaded on first use
+    the caches of Whitaker analyses and of word templates can be resized, or disabled with a size of 0
+    """
+    if parser is not None:
+        set_parser(parser)
+    if whitaker_cache_size is not None:
+        whitaker_cache.resize(whitaker_cache_size)
+    if word_cache_size is not None:
+        word_cache.resize(word_cache_size)
@@ -1,26 +1,115 @@
-from typing import Any
+import asyncio
+import sqlite3
+from queue import Empty, Queue
+from threading import RLock, Thread
+from time import monotonic
+from typing import Any, Iterable, Optional, Union
 
-from .syllable import Syllable
+from .lexicon import Lexicon
+from .syllable import Syllable, Weight
+from .utils.cache import LRUCache
+from .utils.trie import PrefixTrie
 
 
 class Bridge:
     def split_from_deviant_word(self, lexeme: str) -> list[Syllable]:
         raise Exception("must be overridden")
 
+    def deviant_words(self) -> dict[str, list[Syllable]]:
+        """ all deviant words (or starts of words) with their syllables, e.g. to load them into an index at once """
+        raise Exception("must be overridden")
+
     def use_dictionary(self, word: str) -> list[str]:
         raise Exception("must be overridden")
 
+    def use_dictionary_many(self, words: Iterable[str]) -> dict[str, list[str]]:
+        """ the structures of all (distinct) words at once; a bridge with a database should use a single query """
+        return {word: self.use_dictionary(word) for word in dict.fromkeys(words)}
+
     def make_entry(self, txt: str, struct: str, db_id: int) -> Any:
         raise Exception("must be overridden")
 
     def dump(self, entries: list[Any]) -> None:
         raise Exception("must be overridden")
 
+    def flush(self) -> None:
+        """ make sure that all entries that have been dumped are written """
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+
+class AsyncBridge:
+    """
+    Bridge whose lookups and writes can be awaited, e.g. in a web service that must not block its event loop
+    make_entry does no I/O, so it is not a coroutine.
+    """
+    async def split_from_deviant_word(self, lexeme: str) -> list[Syllable]:
+        raise Exception("must be overridden")
+
+    async def use_dictionary(self, word: str) -> list[str]:
+        raise Exception("must be overridden")
+
+    def make_entry(self, txt: str, struct: str, db_id: int) -> Any:
+        raise Exception("must be overridden")
+
+    async def dump(self, entries: list[Any]) -> None:
+        raise Exception("must be overridden")
+
+    async def flush(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        await self.flush()
+
+
+class DummyAsyncBridge(AsyncBridge):
+    async def split_from_deviant_word(self, lexeme: str) -> list[Syllable]:
+        return []
+
+    async def use_dictionary(self, word: str) -> list[str]:
+        return []
+
+    def make_entry(self, txt: str, struct: str, db_id: int) -> Any:
+        return {}
+
+    async def dump(self, entries: list[Any]) -> None:
+        pass
+
+
+class ThreadedAsyncBridge(AsyncBridge):
+    """ AsyncBridge that runs the methods of a (blocking) Bridge in a worker thread """
+
+    def __init__(self, inner: Bridge):
+        self.inner = inner
+
+    async def split_from_deviant_word(self, lexeme: str) -> list[Syllable]:
+        return await asyncio.to_thread(self.inner.split_from_deviant_word, lexeme)
+
+    async def use_dictionary(self, word: str) -> list[str]:
+        return await asyncio.to_thread(self.inner.use_dictionary, word)
+
+    def make_entry(self, txt: str, struct: str, db_id: int) -> Any:
+        return self.inner.make_entry(txt, struct, db_id)
+
+    async def dump(self, entries: list[Any]) -> None:
+        await asyncio.to_thread(self.inner.dump, entries)
+
+    async def flush(self) -> None:
+        await asyncio.to_thread(self.inner.flush)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.inner.close)
+
 
 class DummyBridge(Bridge):
     def split_from_deviant_word(self, lexeme: str) -> list[Syllable]:
         return []
 
+    def deviant_words(self) -> dict[str, list[Syllable]]:
+        return {}
+
     def use_dictionary(self, word: str) -> list[str]:
         return []
 
@@ -41,3 +130,425 @@ class LocalDictionaryBridge(DummyBridge):
 
     def use_dictionary(self, word: str) -> list[str]:
         return self.cache[word]
+
+    def write_lexicon(self, path: str) -> None:
+        """ save the dictionary as a lexicon file, to be used by a LexiconBridge """
+        Lexicon.write(path, self.cache)
+
+
+class LexiconBridge(DummyBridge):
+    """ Bridge that finds the structures of words in a (memory-mapped) Lexicon; unknown words have none """
+
+    def __init__(self, lexicon: Union[Lexicon, str]):
+        self.lexicon = lexicon if isinstance(lexicon, Lexicon) else Lexicon(lexicon)
+
+    def use_dictionary(self, word: str) -> list[str]:
+        return self.lexicon.get(word)
+
+    def close(self) -> None:
+        self.lexicon.close()
+
+
+class PrefetchedBridge(Bridge):
+    """
+    Bridge that answers from lookups that were done beforehand, e.g. concurrently by an AsyncBridge
+    Words that were not looked up beforehand are looked up in the inner Bridge, which also receives the entries.
+    """
+    def __init__(self, dictionary: dict[str, list[str]], deviants: dict[str, list[Syllable]],
+                 inner: Bridge = DummyBridge()):
+        self.dictionary = dictionary
+        self.deviants = deviants
+        self.inner = inner
+
+    def split_from_deviant_word(self, lexeme: str) -> list[Syllable]:
+        if lexeme in self.deviants:
+            # the syllables are modified by the words that use them
+            return [syll.copy() for syll in self.deviants[lexeme]]
+        return self.inner.split_from_deviant_word(lexeme)
+
+    def deviant_words(self) -> dict[str, list[Syllable]]:
+        return self.inner.deviant_words()
+
+    def use_dictionary(self, word: str) -> list[str]:
+        if word in self.dictionary:
+            return list(self.dictionary[word])
+        return self.inner.use_dictionary(word)
+
+    def make_entry(self, txt: str, struct: str, db_id: int) -> Any:
+        return self.inner.make_entry(txt, struct, db_id)
+
+    def dump(self, entries: list[Any]) -> None:
+        self.inner.dump(entries)
+
+
+class DeviantIndexBridge(Bridge):
+    """
+    Bridge that loads all deviant words of another Bridge into a prefix tree once, when it is constructed,
+    and finds the longest deviant word that a word starts with in a single walk over its letters,
+    instead of asking the other Bridge for every word. Everything else is left to the other Bridge.
+    Deviant words that are added to the other Bridge later are only found after reload.
+    """
+    def __init__(self, inner: Bridge):
+        self.inner = inner
+        self.reload()
+
+    def reload(self) -> None:
+        self.index: PrefixTrie[tuple[Syllable, ...]] = PrefixTrie()
+        for stem, syllables in self.inner.deviant_words().items():
+            self.index[stem] = tuple(syllables)
+
+    def split_from_deviant_word(self, lexeme: str) -> list[Syllable]:
+        syllables = self.index.longest_prefix(lexeme)
+        if syllables is None:
+            return []
+        # the syllables are modified by the words that use them
+        return [syll.copy() for syll in syllables]
+
+    def deviant_words(self) -> dict[str, list[Syllable]]:
+        return {stem: [syll.copy() for syll in self.index[stem]] for stem in self.index}
+
+    def use_dictionary(self, word: str) -> list[str]:
+        return self.inner.use_dictionary(word)
+
+    def use_dictionary_many(self, words: Iterable[str]) -> dict[str, list[str]]:
+        return self.inner.use_dictionary_many(words)
+
+    def make_entry(self, txt: str, struct: str, db_id: int) -> Any:
+        return self.inner.make_entry(txt, struct, db_id)
+
+    def dump(self, entries: list[Any]) -> None:
+        self.inner.dump(entries)
+
+    def flush(self) -> None:
+        self.inner.flush()
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class CachingBridge(Bridge):
+    """
+    Bridge that remembers the answers of another Bridge, so that a word form is only looked up once
+    Negative answers are remembered as well, but exceptions are not.
+    The entries that are dumped through this bridge are forgotten, so that their new structures are looked up again;
+    until the next flush, the answers for them are not remembered, as the other Bridge may not have written them yet.
+    """
+    def __init__(self, inner: Bridge, maxsize: int = 4096):
+        self.inner = inner
+        self.dictionary_cache: LRUCache[str, tuple[str, ...]] = LRUCache(maxsize)
+        self.deviant_cache: LRUCache[str, tuple[Syllable, ...]] = LRUCache(maxsize)
+        self.pending: set[str] = set()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """ the caches are not pickled: a copy in another process starts empty """
+        return {'inner': self.inner, 'maxsize': self.dictionary_cache.maxsize}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.inner = state['inner']
+        self.dictionary_cache = LRUCache(state['maxsize'])
+        self.deviant_cache = LRUCache(state['maxsize'])
+        self.pending = set()
+
+    def split_from_deviant_word(self, lexeme: str) -> list[Syllable]:
+        syllables = self.deviant_cache.get(lexeme)
+        if syllables is None:
+            syllables = tuple(self.inner.split_from_deviant_word(lexeme))
+            self.deviant_cache.put(lexeme, syllables)
+        # the syllables are modified by the words that use them
+        return [syll.copy() for syll in syllables]
+
+    def deviant_words(self) -> dict[str, list[Syllable]]:
+        return self.inner.deviant_words()
+
+    def use_dictionary(self, word: str) -> list[str]:
+        structures = self.dictionary_cache.get(word)
+        if structures is None:
+            structures = tuple(self.inner.use_dictionary(word))
+            if word not in self.pending:
+                self.dictionary_cache.put(word, structures)
+        return list(structures)
+
+    def use_dictionary_many(self, words: Iterable[str]) -> dict[str, list[str]]:
+        """ only the words that are not cached are looked up, at once """
+        result: dict[str, list[str]] = {}
+        missing = []
+        for word in dict.fromkeys(words):
+            structures = self.dictionary_cache.get(word)
+            if structures is None:
+                missing.append(word)
+            else:
+                result[word] = list(structures)
+        if missing:
+            for word, answer in self.inner.use_dictionary_many(missing).items():
+                if word not in self.pending:
+                    self.dictionary_cache.put(word, tuple(answer))
+                result[word] = list(answer)
+        return result
+
+    def make_entry(self, txt: str, struct: str, db_id: int) -> Any:
+        return txt, self.inner.make_entry(txt, struct, db_id)
+
+    def dump(self, entries: list[Any]) -> None:
+        self.inner.dump([entry for _, entry in entries])
+        for txt, _ in entries:
+            self.dictionary_cache.discard(txt)
+            self.pending.add(txt)
+
+    def flush(self) -> None:
+        self.inner.flush()
+        self.pending.clear()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def hit_ratio(self) -> float:
+        """ the share of all lookups that were answered from the cache """
+        hits = self.dictionary_cache.hits + self.deviant_cache.hits
+        lookups = hits + self.dictionary_cache.misses + self.deviant_cache.misses
+        return hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        self.dictionary_cache.clear()
+        self.deviant_cache.clear()
+
+
+class SqliteBridge(Bridge):
+    """
+    Bridge that stores the learned structures of words, and the syllables of deviant words, in a SQLite file
+    Entries that are dumped are written immediately, but only committed once per batch_size entries,
+    so that scanning a corpus does not pay for a transaction per verse; flush or close commits the rest.
+    The database runs in WAL mode, so that other processes can read it while one process writes to it.
+    A pickled SqliteBridge (e.g. for a worker process) opens its own connection to the same file.
+    The connection can be shared by several threads, e.g. with a BufferedBridge.
+    """
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS words (word TEXT NOT NULL, structure TEXT NOT NULL, verse INTEGER NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS words_word ON words (word)",
+        "CREATE TABLE IF NOT EXISTS deviants (stem TEXT PRIMARY KEY, syllables TEXT NOT NULL, weights TEXT NOT NULL)",
+    )
+    SELECT_STRUCTURES = "SELECT DISTINCT structure FROM words WHERE word = ? ORDER BY structure"
+    # the number of words that are looked up in a single query by use_dictionary_many
+    MANY = 500
+    INSERT_WORD = "INSERT INTO words (word, structure, verse) VALUES (?, ?, ?)"
+    INSERT_DEVIANT = "INSERT OR REPLACE INTO deviants (stem, syllables, weights) VALUES (?, ?, ?)"
+
+    def __init__(self, path: str, batch_size: int = 10000):
+        self.path = path
+        self.batch_size = batch_size
+        self.pending = 0
+        self.closed = False
+        self.lock = RLock()
+        self.connection = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in SqliteBridge.SCHEMA:
+            connection.execute(statement)
+        connection.commit()
+        return connection
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {'path': self.path, 'batch_size': self.batch_size}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path = state['path']
+        self.batch_size = state['batch_size']
+        self.pending = 0
+        self.closed = False
+        self.lock = RLock()
+        self.connection = self._connect()
+
+    def __enter__(self) -> 'SqliteBridge':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def split_from_deviant_word(self, lexeme: str) -> list[Syllable]:
+        """ the syllables of the longest deviant word that the lexeme starts with """
+        if not lexeme:
+            return []
+        prefixes = [lexeme[:length] for length in range(1, len(lexeme) + 1)]
+        # there is one statement per length of lexeme, so the statement cache of sqlite3 keeps them prepared
+        with self.lock:
+            row = self.connection.execute(
+                f"SELECT syllables, weights FROM deviants WHERE stem IN ({', '.join('?' * len(prefixes))}) "
+                "ORDER BY length(stem) DESC LIMIT 1", prefixes).fetchone()
+        if row is None:
+            return []
+        return SqliteBridge._make_syllables(*row)
+
+    def deviant_words(self) -> dict[str, list[Syllable]]:
+        with self.lock:
+            rows = self.connection.execute("SELECT stem, syllables, weights FROM deviants").fetchall()
+        return {stem: SqliteBridge._make_syllables(syllables, weights) for stem, syllables, weights in rows}
+
+    @staticmethod
+    def _make_syllables(syllables: str, weights: str) -> list[Syllable]:
+        return [Syllable.make_empty_syllable(text, Weight(int(weight)) if weight.strip() else None)
+                for text, weight in zip(syllables.split('-'), weights)]
+
+    def use_dictionary(self, word: str) -> list[str]:
+        with self.lock:
+            return [row[0] for row in self.connection.execute(SqliteBridge.SELECT_STRUCTURES, (word,))]
+
+    def use_dictionary_many(self, words: Iterable[str]) -> dict[str, list[str]]:
+        result: dict[str, list[str]] = {word: [] for word in words}
+        keys = list(result)
+        with self.lock:
+            for start in range(0, len(keys), SqliteBridge.MANY):
+                chunk = keys[start:start + SqliteBridge.MANY]
+                query = (f"SELECT DISTINCT word, structure FROM words WHERE word IN ({', '.join('?' * len(chunk))}) "
+                         "ORDER BY word, structure")
+                for word, structure in self.connection.execute(query, chunk):
+                    result[word].append(structure)
+        return result
+
+    def make_entry(self, txt: str, struct: str, db_id: int) -> Any:
+        return txt, struct, db_id
+
+    def dump(self, entries: list[Any]) -> None:
+        with self.lock:
+            self.connection.executemany(SqliteBridge.INSERT_WORD, entries)
+            self.pending += len(entries)
+            if self.pending >= self.batch_size:
+                self.flush()
+
+    def add_deviant(self, stem: str, syllables: list[Syllable]) -> None:
+        """ store the syllables of a word (or the start of a word) that are not found by splitting it """
+        texts = '-'.join(''.join(sound.letters for sound in syll.sounds) for syll in syllables)
+        weights = ''.join(str(syll.weight.value) if syll.weight else ' ' for syll in syllables)
+        with self.lock:
+            self.connection.execute(SqliteBridge.INSERT_DEVIANT, (stem, texts, weights))
+            self.flush()
+
+    def flush(self) -> None:
+        """ commit all entries that have been dumped """
+        with self.lock:
+            self.connection.commit()
+            self.pending = 0
+
+    def close(self) -> None:
+        """ commit all entries that have been dumped, and close the connection; closing twice does nothing """
+        with self.lock:
+            if not self.closed:
+                self.flush()
+                self.connection.close()
+                self.closed = True
+
+
+# markers in the queue of a BufferedBridge, next to the entries
+_FLUSH = object()
+_CLOSE = object()
+# the oldest entry in the batch has waited long enough
+_EXPIRED = object()
+
+
+class BufferedBridge(Bridge):
+    """
+    Bridge that collects the entries dumped by many verses, and writes them to another Bridge on a background thread,
+    in batches of batch_size entries; an entry waits at most interval seconds before its batch is written.
+    At most maxsize entries are waiting at any time: beyond that, dump blocks until the background thread catches up.
+    Lookups go straight to the other Bridge, so they do not see the entries that are still waiting.
+    Entries are only certain to be written after flush or close, e.g. at the end of a with block.
+    An error in the background thread is raised again by the next call to dump, flush or close.
+    """
+    def __init__(self, inner: Bridge, batch_size: int = 1000, interval: float = 1.0, maxsize: int = 10000):
+        self.inner = inner
+        self.batch_size = batch_size
+        self.interval = interval
+        self.closed = False
+        self.error: Optional[Exception] = None
+        self.queue: Queue[Any] = Queue(maxsize)
+        self.thread = Thread(target=self._write_behind, name="BufferedBridge", daemon=True)
+        self.thread.start()
+
+    def __enter__(self) -> 'BufferedBridge':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def split_from_deviant_word(self, lexeme: str) -> list[Syllable]:
+        return self.inner.split_from_deviant_word(lexeme)
+
+    def deviant_words(self) -> dict[str, list[Syllable]]:
+        return self.inner.deviant_words()
+
+    def use_dictionary(self, word: str) -> list[str]:
+        return self.inner.use_dictionary(word)
+
+    def use_dictionary_many(self, words: Iterable[str]) -> dict[str, list[str]]:
+        return self.inner.use_dictionary_many(words)
+
+    def make_entry(self, txt: str, struct: str, db_id: int) -> Any:
+        return self.inner.make_entry(txt, struct, db_id)
+
+    def dump(self, entries: list[Any]) -> None:
+        if self.closed:
+            raise ValueError("dump to a closed BufferedBridge")
+        self._check()
+        for entry in entries:
+            self.queue.put(entry)
+
+    def flush(self) -> None:
+        """ wait until all entries that have been dumped are written; after close, they are already written """
+        if self.closed:
+            return
+        self._check()
+        self.queue.put(_FLUSH)
+        self.queue.join()
+        self._check()
+        self.inner.flush()
+
+    def close(self) -> None:
+        """ write all entries that have been dumped, stop the background thread, and close the other Bridge """
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(_CLOSE)
+        self.thread.join()
+        try:
+            self._check()
+        finally:
+            self.inner.close()
+
+    def _check(self) -> None:
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def _write_behind(self) -> None:
+        batch: list[Any] = []
+        markers = 0
+        deadline = 0.0
+        while True:
+            try:
+                item = self.queue.get(timeout=max(0.0, deadline - monotonic()) if batch else None)
+            except Empty:
+                item = _EXPIRED
+            if item is _FLUSH or item is _CLOSE:
+                markers += 1
+            elif item is not _EXPIRED:
+                if not batch:
+                    deadline = monotonic() + self.interval
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+            self._write(batch)
+            # entries are only done when they have been written, so that flush can wait for them
+            for _ in range(len(batch) + markers):
+                self.queue.task_done()
+            batch = []
+            markers = 0
+            if item is _CLOSE:
+                return
+
+    def _write(self, batch: list[Any]) -> None:
+        if batch:
+            try:
+                self.inner.dump(batch)
+            except Exception as exc:
+                self.error = exc
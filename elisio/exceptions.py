@@ -13,10 +13,8 @@ class ScansionException(Exception):
 
     def __repr__(self) -> str:
         result = self.message
-        if self.exceptions:
-            for excepts in self.exceptions:
-                for exc in excepts:
-                    result += f"\n{exc.__class__.__name__}: {exc}"
+        for exc in self.exceptions:
+            result += f"\n{exc.__class__.__name__}: {exc}"
         return result
 
 
@@ -50,6 +48,11 @@ class VerseCreatorException(VerseException):
     pass
 
 
+class VerseSubtypeException(VerseCreatorException):
+    """description of class"""
+    pass
+
+
 class PentameterException(VerseException):
     """description of class"""
     pass
@@ -0,0 +1,116 @@
+""" a read-only lexicon of word structures, stored in a compact file that is memory-mapped instead of loaded """
+import mmap
+import struct
+from bisect import bisect_right
+from typing import Any, Iterable, Iterator, Mapping
+
+# the file starts with a header: magic bytes, version and number of entries
+HEADER = struct.Struct('<4sHI')
+MAGIC = b'ELEX'
+VERSION = 1
+# then the offsets of the entries (and of the end of the last entry) in the data that follows them
+OFFSET = struct.Struct('<I')
+# every STRIDE-th key is kept in memory, to narrow down the search in the file
+STRIDE = 64
+
+
+class Lexicon:
+    """
+    Lexicon class
+    A mapping of word forms to their known weight structures, read from a file written by Lexicon.write.
+    The entries are sorted by word form, and a lookup is a binary search in the memory-mapped file,
+    so opening a lexicon only reads a sparse index of its keys, and a lookup only reads the pages it searches.
+    The pages are shared by all processes that map the same file, e.g. worker processes after a fork.
+    A word form that is not in the lexicon has no known structures.
+    """
+    def __init__(self, path: str):
+        self._open(path)
+
+    def _open(self, path: str) -> None:
+        self.path = path
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count = (b'', 0, 0)
+        if len(self._map) >= HEADER.size:
+            magic, version, self._count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a lexicon file of version {VERSION}")
+        self._data = HEADER.size + (self._count + 1) * OFFSET.size
+        self._sparse = [self._record(index)[0] + b'\0' for index in range(0, self._count, STRIDE)]
+
+    @staticmethod
+    def write(path: str, entries: Mapping[str, Iterable[str]]) -> None:
+        """ write a lexicon file for the given word forms and their structures """
+        records = sorted((key.encode(), b''.join(structure.encode() + b'\0' for structure in structures))
+                         for key, structures in entries.items())
+        offsets = [0]
+        for key, structures in records:
+            if b'\0' in key:
+                raise ValueError("a word form cannot contain a null character")
+            offsets.append(offsets[-1] + len(key) + 1 + len(structures))
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, len(records)))
+            file.write(b''.join(OFFSET.pack(offset) for offset in offsets))
+            for key, structures in records:
+                file.write(key + b'\0' + structures)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {'path': self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._open(state['path'])
+
+    def __enter__(self) -> 'Lexicon':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self._find(word.encode()) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._record(index)[0].decode()
+
+    def get(self, word: str) -> list[str]:
+        """ the known structures of the word form, or an empty list if it is not in the lexicon """
+        index = self._find(word.encode())
+        if index < 0:
+            return []
+        return [structure.decode() for structure in self._record(index)[1].split(b'\0')[:-1]]
+
+    def close(self) -> None:
+        self._map.close()
+
+    def _record(self, index: int) -> tuple[bytes, bytes]:
+        start, = OFFSET.unpack_from(self._map, HEADER.size + index * OFFSET.size)
+        end, = OFFSET.unpack_from(self._map, HEADER.size + (index + 1) * OFFSET.size)
+        record = self._map[self._data + start:self._data + end]
+        key, _, structures = record.partition(b'\0')
+        return key, structures
+
+    def _find(self, key: bytes) -> int:
+        """ the index of the entry with the given key, or -1 """
+        # the null character after a key sorts before any letter, so comparing with the key and its null character
+        # orders the entries correctly without looking for the end of every key that is probed
+        target = key + b'\0'
+        block = bisect_right(self._sparse, target) - 1
+        if block < 0:
+            return -1
+        low, high = block * STRIDE, min((block + 1) * STRIDE, self._count)
+        while low < high:
+            middle = (low + high) // 2
+            start = self._data + OFFSET.unpack_from(self._map, HEADER.size + middle * OFFSET.size)[0]
+            found = self._map[start:start + len(target)]
+            if found == target:
+                return middle
+            if found < target:
+                low = middle + 1
+            else:
+                high = middle
+        return -1
@@ -0,0 +1,128 @@
+"""
+Accent, Zeleny and ictus analytics for many scanned verses at once, with NumPy.
+The verses are given as the columns of a VerseStore: one number per syllable, word, foot or verse,
+with _start offsets that give the syllables of every word and verse and the feet of every verse.
+Every function computes the same as the per-verse methods of Verse, for all verses in a few array operations.
+NumPy is not a requirement of elisio: install it with the analytics extra.
+"""
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ..exceptions import IllegalFootException
+from ..syllable import Weight
+from .verse import Foot
+from .versestore import VerseStore
+
+Array = npt.NDArray[np.int64]
+Mask = npt.NDArray[np.bool_]
+
+
+def _foot_length(foot: Foot) -> int:
+    try:
+        return len(foot)
+    except IllegalFootException:
+        return 0
+
+
+# the number of syllables of every foot, by its Foot value; 0 for a foot that cannot be a part of a scanned verse
+FOOT_LENGTHS = np.zeros(max(foot.value for foot in Foot) + 1, dtype=np.int64)
+for _foot in Foot:
+    FOOT_LENGTHS[_foot.value] = _foot_length(_foot)
+
+
+class Columns(NamedTuple):
+    """ The columns of scanned verses that the analytics need """
+    weights: npt.NDArray[np.uint8]
+    stressed: Mask
+    feet: Array
+    word_syllable_start: Array
+    verse_syllable_start: Array
+    verse_foot_start: Array
+
+    @staticmethod
+    def of(store: VerseStore) -> 'Columns':
+        """ the columns of a VerseStore; the weights are not copied out of the file """
+        word_syllable_start = np.asarray(store.word_syllable_start, dtype=np.int64)
+        return Columns(np.frombuffer(store.weights, dtype=np.uint8),
+                       np.asarray(store.stressed, dtype=np.bool_),
+                       np.asarray(store.feet, dtype=np.int64),
+                       word_syllable_start,
+                       word_syllable_start[np.asarray(store.verse_word_start, dtype=np.int64)],
+                       np.asarray(store.verse_foot_start, dtype=np.int64))
+
+
+def get_accents(weights: npt.ArrayLike, word_syllable_start: npt.ArrayLike) -> Mask:
+    """ the stressed syllables, as Verse.add_accents puts them: by the weights of the syllables in every word """
+    weights = np.asarray(weights)
+    offsets = np.asarray(word_syllable_start, dtype=np.int64)
+    starts, ends = offsets[:-1], offsets[1:]
+    starts, ends = starts[ends > starts], ends[ends > starts]
+    short = ends - starts < 3
+    penultimate = np.where(short, starts, ends - 2)
+    accents = np.where(short, starts, np.where(weights[penultimate] == Weight.HEAVY.value, ends - 2, ends - 3))
+    stressed = np.zeros(len(weights), dtype=np.bool_)
+    stressed[accents] = True
+    return stressed
+
+
+def get_zeleny_scores(weights: npt.ArrayLike, stressed: npt.ArrayLike,
+                      verse_syllable_start: npt.ArrayLike) -> tuple[Array, Array]:
+    """
+    the Zeleny scores of all verses, as Verse.get_zeleny_score computes them
+    the scores are returned flat, with the offset of the score of every verse
+    """
+    weights = np.asarray(weights)
+    stressed = np.asarray(stressed, dtype=np.bool_)
+    offsets = np.asarray(verse_syllable_start, dtype=np.int64)
+    count = len(offsets) - 1
+    morae = np.where(weights == Weight.NONE.value, 0, np.where(weights == Weight.LIGHT.value, 1, 2))
+    total = np.concatenate(([0], np.cumsum(morae)))
+    index = np.arange(len(weights))
+    verses = np.repeat(np.arange(count), np.diff(offsets))
+    # a stressed syllable starts a new score if there are morae since the last stressed syllable in its verse
+    last_stressed = np.maximum.accumulate(np.where(stressed, index, -1))
+    previous = np.concatenate(([-1], last_stressed[:-1]))
+    previous = np.maximum(previous, offsets[:-1][verses])
+    breaks = index[stressed & (total[index] - total[previous] > 0)]
+    starts = np.concatenate((offsets[:-1], breaks))
+    order = np.lexsort((starts, np.concatenate((np.arange(count), verses[breaks]))))
+    starts = starts[order]
+    score_offsets = np.concatenate(([0], np.cumsum(1 + np.bincount(verses[breaks], minlength=count))))
+    ends = np.append(starts[1:], 0)
+    ends[score_offsets[1:] - 1] = offsets[1:]
+    return total[ends] - total[starts], score_offsets
+
+
+def get_ictus(weights: npt.ArrayLike, feet: npt.ArrayLike,
+              verse_syllable_start: npt.ArrayLike, verse_foot_start: npt.ArrayLike) -> Array:
+    """ the syllable that bears the ictus of every foot: its first syllable, not counting elided syllables """
+    weights = np.asarray(weights)
+    syllable_offsets = np.asarray(verse_syllable_start, dtype=np.int64)
+    foot_offsets = np.asarray(verse_foot_start, dtype=np.int64)
+    lengths = FOOT_LENGTHS[np.asarray(feet, dtype=np.int64)]
+    counted = np.concatenate(([0], np.cumsum(weights != Weight.NONE.value)))
+    filled = np.concatenate(([0], np.cumsum(lengths)))
+    if not np.all(lengths) or not np.array_equal(np.diff(counted[syllable_offsets]), np.diff(filled[foot_offsets])):
+        raise ValueError("the feet do not fit the syllables of their verses: not all verses are scanned")
+    return np.flatnonzero(weights != Weight.NONE.value)[filled[:-1]]
+
+
+def get_clashes(stressed: npt.ArrayLike, ictus: npt.ArrayLike, verse_foot_start: npt.ArrayLike) -> tuple[Array, Array]:
+    """
+    the coincidence of ictus and accent at every foot position: for the first, second ... foot of the verses,
+    the number of feet whose ictus syllable is stressed, and the number of feet
+    """
+    stressed = np.asarray(stressed, dtype=np.bool_)
+    offsets = np.asarray(verse_foot_start, dtype=np.int64)
+    positions = np.arange(offsets[-1] - offsets[0]) - np.repeat(offsets[:-1] - offsets[0], np.diff(offsets))
+    coincidences = np.bincount(positions, weights=stressed[np.asarray(ictus, dtype=np.int64)]).astype(np.int64)
+    return coincidences, np.bincount(positions)
+
+
+def to_lists(values: npt.ArrayLike, offsets: npt.ArrayLike) -> list[list[int]]:
+    """ flat values with offsets, e.g. Zeleny scores, as one list per verse """
+    values = np.asarray(values)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    return [values[start:end].tolist() for start, end in zip(offsets[:-1], offsets[1:])]
@@ -1,24 +1,29 @@
-from typing import Type
+from functools import lru_cache
+from typing import Sequence, Type
 
-from ..exceptions import HendecaException, VerseCreatorException
+from ..exceptions import HendecaException, VerseCreatorException, VerseSubtypeException
 from ..syllable import Weight
 from .verse import Verse
+from .weightmask import WeightMask
 
 
 SYLL = 11
 
 
+@lru_cache(maxsize=None)
+def _pattern(structure: str) -> WeightMask:
+    return WeightMask.from_pattern(structure)
+
+
 class Hendeca(Verse):
     def preparse(self) -> None:
-        for count, x in enumerate(self.get_structure()):
-            if x == '-':
-                if self.flat_list[count] == Weight.LIGHT:
-                    raise HendecaException("cannot be light")
-                self.flat_list[count] = Weight.HEAVY
-            elif x == 'u':
-                if self.flat_list[count] == Weight.HEAVY:
-                    raise HendecaException("cannot be heavy")
-                self.flat_list[count] = Weight.LIGHT
+        mask = self.get_mask()
+        pattern = _pattern(self.get_structure())
+        if mask.light & pattern.heavy:
+            raise HendecaException("cannot be light")
+        if mask.heavy & pattern.light:
+            raise HendecaException("cannot be heavy")
+        self.set_mask(mask.merge(pattern))
 
     def scan(self) -> None:
         pass
@@ -27,7 +32,7 @@ class Hendeca(Verse):
         raise HendecaException("must be overridden")
 
 
-def get_hendeca_subtype(li: list[Weight]) -> Type[Hendeca]:
+def get_hendeca_subtype(li: Sequence[Weight]) -> Type[Hendeca]:
     if len(li) != SYLL:
         raise VerseCreatorException(f"incorrect number of syllables: {len(li)}")
     """
@@ -56,14 +61,14 @@ def get_hendeca_subtype(li: list[Weight]) -> Type[Hendeca]:
     if len(poss) == 1:
         return poss.pop()
     if len(poss) > 1:
-        raise VerseCreatorException(f"{error} not enough information")
-    raise VerseCreatorException(f"{error} conflicting hints")
+        raise VerseSubtypeException(f"{error} not enough information")
+    raise VerseSubtypeException(f"{error} conflicting hints")
 
 
 class PhalaecianHendeca(Hendeca):
     def preparse(self) -> None:
         super().preparse()
-        if self.flat_list[0] == self.flat_list[1] == Weight.LIGHT:
+        if self.get_mask().light & 0b11 == 0b11:
             raise HendecaException("Phalaecian Hendecasyllable cannot start with two light syllables")
         if self.flat_list[1] == Weight.LIGHT:
             self.flat_list[0] = Weight.HEAVY
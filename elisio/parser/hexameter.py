@@ -1,8 +1,10 @@
-﻿from typing import Optional, Type
+﻿from itertools import product as cartesian_product
+from typing import Optional, Sequence, Type
 
 from ..exceptions import HexameterException, VerseCreatorException
 from ..syllable import Weight
 from .verse import Foot, Verse
+from .weightmask import WeightMask
 
 
 MAX_SYLL = 17
@@ -12,8 +14,8 @@ MIN_SYLL = 12
 class Hexameter(Verse):
     """ the most popular Latin verse type """
 
-    def __init__(self, text: str):
-        super().__init__(text)
+    def __init__(self, text: str, flat_list: Sequence[Weight] = ()):
+        super().__init__(text, flat_list)
         self.feet: list[Optional[Foot]] = [None] * 6
         self.hex = None
 
@@ -55,11 +57,11 @@ class Hexameter(Verse):
         pass
 
     @staticmethod
-    def has_spondaic_fifth_foot(lst: list[Weight]) -> bool:
+    def has_spondaic_fifth_foot(lst: Sequence[Weight]) -> bool:
         return lst[-3] == Weight.HEAVY or lst[-4] == Weight.HEAVY or lst[-5] == Weight.LIGHT
 
 
-def get_hexa_subtype(lst: list[Weight]) -> Type[Hexameter]:
+def get_hexa_subtype(lst: Sequence[Weight]) -> Type[Hexameter]:
     hex_types = [SpondaicHexameter, SpondaicDominantHexameter, BalancedHexameter,
                  DactylicDominantHexameter, DactylicHexameter]  # this is an ordered list !
     size = len(lst)
@@ -84,6 +86,79 @@ def get_hexa_subtype(lst: list[Weight]) -> Type[Hexameter]:
         raise VerseCreatorException(f"{size} is an illegal number of syllables in a Hexameter")
 
 
+def _build_scansion_table() -> dict[int, list[tuple[WeightMask, tuple[Foot, ...]]]]:
+    """
+    precompile all legal foot sequences of a Hexameter, by number of syllables
+    every sequence is stored with the WeightMask of its syllables
+    """
+    table: dict[int, list[tuple[WeightMask, tuple[Foot, ...]]]] = {}
+    for feet in cartesian_product(*[[Foot.DACTYLUS, Foot.SPONDAEUS]] * 5,
+                                  [Foot.SPONDAEUS, Foot.TROCHAEUS, Foot.BINARY_ANCEPS]):
+        pattern = WeightMask.from_weights(weight for foot in feet for weight in foot.get_structure())
+        table.setdefault(len(pattern), []).append((pattern, feet))
+    return table
+
+
+def _final_foot(weight: Weight) -> Foot:
+    if weight == Weight.HEAVY:
+        return Foot.SPONDAEUS
+    if weight == Weight.LIGHT:
+        return Foot.TROCHAEUS
+    return Foot.BINARY_ANCEPS
+
+
+SCANSION_TABLE = _build_scansion_table()
+
+
+def find_hexa_scansions(lst: Sequence[Weight]) -> list[list[Foot]]:
+    """
+    find all legal foot sequences that are compatible with the known syllable weights,
+    by matching against the precompiled table instead of following the rules of the Hexameter subtypes
+    the final foot follows the weight of the last syllable, as in Hexameter.scan
+    """
+    if not lst:
+        return []
+    mask = WeightMask.of(lst)
+    final = _final_foot(mask[-1])
+    return [list(feet) for pattern, feet in SCANSION_TABLE.get(len(mask), [])
+            if feet[5] == final and not mask.conflicts(pattern)]
+
+
+def get_hexa_table_subtype(lst: Sequence[Weight]) -> Type[Hexameter]:
+    size = len(lst)
+    if size > MAX_SYLL:
+        raise VerseCreatorException("too many syllables")
+    if size < MIN_SYLL:
+        raise VerseCreatorException("too few syllables")
+    return TabularHexameter
+
+
+class TabularHexameter(Hexameter):
+    """
+    a Hexameter that is scanned by matching against all legal foot sequences at once
+    the rule-based Hexameter subtypes remain the reference implementation
+    """
+    def __init__(self, text: str, flat_list: Sequence[Weight] = ()):
+        super().__init__(text, flat_list)
+        self.scansions: list[list[Foot]] = []
+
+    def preparse(self) -> None:
+        """ the constraints on syllable weights are part of the table """
+        pass
+
+    def scan(self) -> None:
+        self.scansions = find_hexa_scansions(self.flat_list)
+        if not self.scansions:
+            raise HexameterException("no legal foot sequence fits the syllable weights")
+        candidates = self.scansions
+        if len(candidates) > 1:
+            # like the rules, assume a dactylic fifth foot if the weights allow it
+            candidates = [feet for feet in candidates if feet[4] == Foot.DACTYLUS] or candidates
+        if len(candidates) > 1:
+            raise HexameterException(f"{len(candidates)} foot sequences fit the syllable weights")
+        self.feet = list(candidates[0])
+
+
 class SpondaicHexameter(Hexameter):
     """ a Hexameter with 4 Spondees in its first 4 feet """
     def scan_for_real(self) -> None:
@@ -164,8 +239,8 @@ class DactylicDominantHexameter(Hexameter):
 
 class BalancedHexameter(Hexameter):
     """ a Hexameter with 2 Spondees and 2 Dactyls in its first 4 feet"""
-    def __init__(self, text: str):
-        super().__init__(text)
+    def __init__(self, text: str, flat_list: Sequence[Weight] = ()):
+        super().__init__(text, flat_list)
         self.dactyls = 0
         self.spondees = 0
 
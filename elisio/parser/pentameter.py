@@ -1,24 +1,26 @@
-from typing import Optional, Type
+from typing import Optional, Sequence, Type
 
 from ..exceptions import PentameterException, VerseCreatorException
 from ..syllable import Weight
 from .verse import Foot, Verse
+from .weightmask import WeightMask
 
 
 MAX_SYLL = 14
 MIN_SYLL = 12
+SECOND_HALF = WeightMask.from_pattern("--uu-uu-")
+SPONDAIC_FIRST_HALF = WeightMask.from_pattern("----")
+DACTYLIC_FIRST_HALF = WeightMask.from_pattern("-uu-uu")
 
 
 class Pentameter(Verse):
-    def __init__(self, text: str):
-        super().__init__(text)
+    def __init__(self, text: str, flat_list: Sequence[Weight] = ()):
+        super().__init__(text, flat_list)
         self.feet: list[Optional[Foot]] = [None, None, Foot.MACRON, Foot.DACTYLUS, Foot.DACTYLUS, Foot.MACRON]
 
     def preparse(self) -> None:
-        if (self.flat_list[-1] == Weight.LIGHT or self.flat_list[-2] == Weight.HEAVY
-                or self.flat_list[-3] == Weight.HEAVY or self.flat_list[-4] == Weight.LIGHT
-                or self.flat_list[-5] == Weight.HEAVY or self.flat_list[-6] == Weight.HEAVY
-                or self.flat_list[-7] == Weight.LIGHT or self.flat_list[-8] == Weight.LIGHT):
+        mask = self.get_mask()
+        if mask.conflicts(SECOND_HALF, len(mask) - len(SECOND_HALF)):
             raise PentameterException("problem in second half with syllable weight")
 
     def scan(self) -> None:
@@ -28,7 +30,7 @@ class Pentameter(Verse):
         pass
 
 
-def get_penta_subtype(lst: list[Weight]) -> Type[Pentameter]:
+def get_penta_subtype(lst: Sequence[Weight]) -> Type[Pentameter]:
     pent_types = [SpondaicPentameter, BalancedPentameter, DactylicPentameter]
     size = len(lst)
     if size > MAX_SYLL:
@@ -45,18 +47,19 @@ def get_penta_subtype(lst: list[Weight]) -> Type[Pentameter]:
 class SpondaicPentameter(Pentameter):
 
     def scan_first_half(self) -> None:
-        for i in range(4):
-            if self.flat_list[i] == Weight.LIGHT:
-                raise PentameterException(f"no light syllable allowed on pos {i} of Spondaic Pentameter")
+        mask = self.get_mask()
+        if mask.conflicts(SPONDAIC_FIRST_HALF):
+            conflicts = mask.light & SPONDAIC_FIRST_HALF.heavy
+            # the lowest set bit: the first light syllable
+            position = (conflicts & -conflicts).bit_length() - 1
+            raise PentameterException(f"no light syllable allowed on pos {position} of Spondaic Pentameter")
         self.feet[:2] = [Foot.SPONDAEUS, Foot.SPONDAEUS]
 
 
 class DactylicPentameter(Pentameter):
 
     def scan_first_half(self) -> None:
-        if (self.flat_list[0] == Weight.LIGHT or self.flat_list[1] == Weight.HEAVY
-                or self.flat_list[2] == Weight.HEAVY or self.flat_list[3] == Weight.LIGHT
-                or self.flat_list[4] == Weight.HEAVY or self.flat_list[5] == Weight.HEAVY):
+        if self.get_mask().conflicts(DACTYLIC_FIRST_HALF):
             raise PentameterException("problem with first half of Dactylic Pentameter")
         self.feet[:2] = [Foot.DACTYLUS, Foot.DACTYLUS]
 
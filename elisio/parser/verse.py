@@ -1,12 +1,14 @@
 ﻿""" the main module for parsing verses """
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional, Sequence, Type, Union
 
-from ..bridge import Bridge
-from ..exceptions import IllegalFootException, VerseException
+from ..bridge import AsyncBridge, Bridge
+from ..exceptions import (IllegalFootException, ScansionException, VerseCreatorException, VerseException,
+                          VerseSubtypeException)
 from ..sound import SoundFactory
 from ..syllable import Weight
 from ..word import Word
+from .weightmask import WeightMask
 
 
 class Foot(Enum):
@@ -40,19 +42,71 @@ class Foot(Enum):
         raise IllegalFootException(f"currently illegal foot structure: {self.name}")
 
 
+class ScansionScore(NamedTuple):
+    """
+    How likely a scansion of a verse is, when there are several: lower scores are more likely
+    * the number of hiatuses, i.e. of elisions that did not happen
+    * the number of syllables whose weight was only guessed by the meter
+    * the number of syllables whose weight contradicts the dictionary of the bridge
+    """
+    hiatuses: int
+    guesses: int
+    disagreements: int
+
+
+class Reason(Enum):
+    """ Why a candidate scansion of a verse failed """
+    SYLLABLE_COUNT = 1  # the verse type does not allow the number of syllables
+    SUBTYPE = 2  # the subtype of the verse type cannot be determined from the syllable weights
+    SCANSION = 3  # the syllable weights do not fit the verse (sub)type
+    ANALYSIS = 4  # the words of the verse could not be analyzed, so there were no candidates
+
+
+class ScanFailure(NamedTuple):
+    """
+    A failed candidate scansion, as plain data: it holds no traceback, words or other candidates.
+    The exception is only created again if the failure reaches the public API, see ScanResult.get_verse
+    """
+    reason: Reason
+    kind: Type[ScansionException]
+    message: str
+    creator: str = ''  # the name of the VerseCreator, filled in by VersePreprocessor.scan
+    weights: Optional[WeightMask] = None  # the syllable weights of the candidate; only rendered if it is reported
+
+    @classmethod
+    def of(cls, exc: ScansionException) -> 'ScanFailure':
+        if isinstance(exc, VerseSubtypeException):
+            reason = Reason.SUBTYPE
+        elif isinstance(exc, VerseCreatorException):
+            reason = Reason.SYLLABLE_COUNT
+        else:
+            reason = Reason.SCANSION
+        return cls(reason, type(exc), exc.message)
+
+    def of_candidate(self, creator: str, weights: WeightMask) -> 'ScanFailure':
+        """ this failure, for the candidate with the given creator and weights; cheaper than _replace """
+        return ScanFailure(self.reason, self.kind, self.message, creator, weights)
+
+    def to_exception(self) -> ScansionException:
+        return self.kind(self.message)
+
+
 class Verse:
     """ Verse class
     A verse is the representation of the Latin text of a verse
     It has no knowledge of its surroundings or context
     """
-    def __init__(self, text: str):
-        """ construct a Verse by its contents """
+    def __init__(self, text: str, flat_list: Sequence[Weight] = ()):
+        """ construct a Verse by its contents, and optionally its syllable weights (e.g. a WeightMask) """
         if not isinstance(text, str):
             raise VerseException("Verse must be initialized with text data")
         self.text = text
         self.words: list[Word] = []
-        self.flat_list: list[Weight] = []
+        # the weights are kept as a WeightMask for the checks, and only expanded into a list when they are parsed
+        self._mask: Optional[WeightMask] = flat_list if isinstance(flat_list, WeightMask) else None
+        self._flat_list: Optional[list[Weight]] = None if self._mask else list(flat_list)
         self.feet: list[Optional[Foot]] = []
+        self.score: Optional[ScansionScore] = None
 
     def __repr__(self) -> str:
         return ''.join(str(x) for x in self.words)
@@ -67,6 +121,29 @@ class Verse:
         self.save_structure()
         self.add_accents()
 
+    @property
+    def flat_list(self) -> list[Weight]:
+        """ the syllable weights as a list, which parsing fills in """
+        if self._flat_list is None:
+            self._flat_list = list(self._mask or ())
+        return self._flat_list
+
+    @flat_list.setter
+    def flat_list(self, flat_list: list[Weight]) -> None:
+        self._mask = None
+        self._flat_list = list(flat_list)
+
+    def get_mask(self) -> WeightMask:
+        """ the current syllable weights as a WeightMask, for checking them against a pattern """
+        if self._flat_list is None and self._mask is not None:
+            return self._mask
+        return WeightMask.from_weights(self.flat_list)
+
+    def set_mask(self, mask: WeightMask) -> None:
+        """ replace the syllable weights, without expanding them into a list """
+        self._mask = mask
+        self._flat_list = None
+
     def preparse(self) -> None:
         raise Exception("must be overridden")
 
@@ -93,6 +170,20 @@ class Verse:
                     syll.weight = self.flat_list[i]
                     i += 1
 
+    def count_disagreements(self) -> int:
+        """ the number of syllables that have a weight which none of the dictionary structures of their word allows """
+        result = 0
+        for word in self.words:
+            if not word.dictionary_structures:
+                continue
+            for count, syll in enumerate(word.syllables):
+                if syll.weight in (None, Weight.NONE, Weight.ANCEPS):
+                    continue
+                allowed = {struct[count] for struct in word.dictionary_structures if count < len(struct)}
+                if allowed and not allowed & {"0", "3", str(syll.weight.value)}:
+                    result += 1
+        return result
+
     def add_accents(self) -> None:
         for wrd in self.words:
             if len(wrd.syllables) < 3:
@@ -130,6 +221,17 @@ class Verse:
         return score
 
     def save(self, db_id: int, bridge: Bridge) -> None:
+        entries = self.make_entries(db_id, bridge)
+        if len(entries):
+            bridge.dump(entries)
+
+    async def save_async(self, db_id: int, bridge: AsyncBridge) -> None:
+        entries = self.make_entries(db_id, bridge)
+        if len(entries):
+            await bridge.dump(entries)
+
+    def make_entries(self, db_id: int, bridge: Union[Bridge, AsyncBridge]) -> list[Any]:
+        """ the entries with the structure of every word in this verse, as the bridge stores them """
         entries: list[Any] = []
         for count, wrd in enumerate(self.words):
             strct = ""
@@ -149,12 +251,42 @@ class Verse:
                 txt = wrd.without_enclitic()  # TODO multi-syllable enclitics (e.g. -cumque)
                 if strct[-1] == str(Weight.HEAVY.value):
                     ltr = SoundFactory.create(txt[-1])
-                    if ltr.is_consonant() and not ltr.is_heavy_making():
+                    if ltr.consonant and not ltr.heavy_making:
                         strct = strct[:-1]
                         strct += str(Weight.ANCEPS.value)
             if wrd.ends_in_variable_declension():
                 strct = strct[:-1]
                 strct += str(Weight.ANCEPS.value)
             entries.append(bridge.make_entry(txt, strct, db_id))
-        if len(entries):
-            bridge.dump(entries)
+        return entries
+
+
+class ScanResult(NamedTuple):
+    """ The outcome of scanning a verse: the verse, or the failures of all candidate scansions """
+    verse: Optional[Verse]
+    failures: tuple[ScanFailure, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        return self.verse is not None
+
+    @property
+    def failure(self) -> Optional[ScanFailure]:
+        """ the failure that explains the result best: a rejection by the last creator, or else the first """
+        if not self.failures:
+            return None
+        if self.failures[-1].reason != Reason.SCANSION:
+            return self.failures[-1]
+        return self.failures[0]
+
+    def exception(self) -> ScansionException:
+        """ the exception that the public API raises for a failed scan """
+        if self.failures and self.failures[-1].reason != Reason.SCANSION:
+            # the last creator rejected the syllable weights, and its exception is raised as it is
+            return self.failures[-1].to_exception()
+        return VerseException("parsing did not succeed", *(failure.to_exception() for failure in self.failures))
+
+    def get_verse(self) -> Verse:
+        if self.verse is None:
+            raise self.exception()
+        return self.verse
@@ -1,19 +1,24 @@
-﻿import re
+﻿import asyncio
+import re
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from itertools import product as cartesian_product
-from typing import Callable, Optional, Sequence, Type, Union
+from itertools import count as counter
+from itertools import cycle
+from itertools import combinations, islice
+from typing import Callable, Iterable, Iterator, Optional, Sequence, TextIO, Type, Union
 
-from ..bridge import Bridge, DummyBridge
-from ..exceptions import ScansionException, VerseException
+from ..bridge import AsyncBridge, Bridge, DummyAsyncBridge, DummyBridge, PrefetchedBridge
+from ..exceptions import ScansionException, VerseCreatorException
 from ..syllable import Syllable
-from ..word import Weight, Word
+from ..word import Weight, Word, get_parser
 from .hendeca import get_hendeca_subtype
-from .hexameter import get_hexa_subtype
+from .hexameter import get_hexa_subtype, get_hexa_table_subtype
 from .pentameter import get_penta_subtype
-from .verse import Verse
+from .verse import Reason, ScanFailure, ScanResult, ScansionScore, Verse
+from .weightmask import WeightMask
 
 
-VerseCreator = Callable[[list[Weight]], Type[Verse]]
+VerseCreator = Callable[[Sequence[Weight]], Type[Verse]]
 
 
 class VerseType(Enum):
@@ -21,6 +26,7 @@ class VerseType(Enum):
     HEXAMETER = 1
     PENTAMETER = 2
     HENDECASYLLABUS = 3
+    TABULAR_HEXAMETER = 4
 
     def get_creators(self) -> list[VerseCreator]:
         if self == VerseType.HEXAMETER:
@@ -29,6 +35,8 @@ class VerseType(Enum):
             return [get_penta_subtype]
         if self == VerseType.HENDECASYLLABUS:
             return [get_hendeca_subtype]
+        if self == VerseType.TABULAR_HEXAMETER:
+            return [get_hexa_table_subtype]
         return [get_hexa_subtype, get_penta_subtype]
 
 
@@ -48,6 +56,41 @@ class VerseForm(Enum):
         return [VerseType.UNKNOWN]
 
 
+class VerseFailure:
+    """ Outcome of a batch scan for a verse that could not be parsed.
+    Only a fixed number of plain values is kept, however many candidate scansions failed,
+    so that a failure holds no words or exceptions, and can be sent back from a worker process.
+    The reason, creator and weights are those of the failure that explains it best (see ScanResult.failure).
+    """
+    __slots__ = ('index', 'text', 'reason', 'creator', 'weights', 'message', 'candidates')
+
+    def __init__(self, index: int, text: str, reason: Optional[Reason], message: str,
+                 creator: str = '', weights: str = '', candidates: int = 0):
+        self.index = index
+        self.text = text
+        self.reason = reason
+        self.message = message
+        self.creator = creator
+        self.weights = weights
+        self.candidates = candidates
+
+    @classmethod
+    def of_result(cls, index: int, text: str, result: ScanResult) -> 'VerseFailure':
+        failure = result.failure
+        if failure is None:
+            return cls(index, text, None, "no verse type to scan with")
+        weights = repr(failure.weights) if failure.weights is not None else ''  # a pattern of - u x
+        return cls(index, text, failure.reason, f"{failure.kind.__name__}: {failure.message}",
+                   failure.creator, weights, len(result.failures))
+
+    @classmethod
+    def of_exception(cls, index: int, text: str, exc: ScansionException) -> 'VerseFailure':
+        return cls(index, text, Reason.ANALYSIS, f"{exc.__class__.__name__}: {exc.message}")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.index}, {self.message!r})"
+
+
 class VerseFactory:
     """ Static factory method container for verse creation.
     The methods delegate pre-analysis work to the VersePreprocessor class,
@@ -65,6 +108,46 @@ class VerseFactory:
     def create(text: str, db_id: int = 0, bridge: Bridge = DummyBridge(), creators: Sequence[VerseType] = []) -> Verse:
         return VersePreprocessor(text, bridge, creators).create_verse(db_id)
 
+    @staticmethod
+    def create_all(text: str, bridge: Bridge = DummyBridge(),
+                   creators: Union[VerseType, Sequence[VerseType]] = []) -> list[Verse]:
+        return VersePreprocessor(text, bridge, creators).create_all()
+
+    @staticmethod
+    async def create_async(text: str, db_id: int = 0, bridge: AsyncBridge = DummyAsyncBridge(),
+                           creators: Union[VerseType, Sequence[VerseType]] = []) -> Verse:
+        return await VersePreprocessor(text, creators=creators).create_verse_async(db_id, bridge)
+
+    @staticmethod
+    async def create_many_async(lines: Iterable[str], bridge: AsyncBridge = DummyAsyncBridge(),
+                                creators: Union[VerseType, Sequence[VerseType]] = []
+                                ) -> list[Union[Verse, VerseFailure]]:
+        """ Scan a batch of verses, after looking up all of their words concurrently.
+        The results are returned in input order, with a VerseFailure for every verse that cannot be parsed.
+        """
+        preprocessors = [VersePreprocessor(line, creators=creators) for line in lines]
+        words, failures = _split_all(0, preprocessors)
+        return _scan_prefetched(0, preprocessors, await prefetch(words, bridge), failures)
+
+    @staticmethod
+    def create_many(lines: Iterable[str], bridge: Bridge = DummyBridge(),
+                    creators: Union[VerseType, Sequence[VerseType]] = [], workers: Optional[int] = None,
+                    chunksize: int = 16) -> list[Union[Verse, VerseFailure]]:
+        """ Scan a batch of verses, spreading them over a pool of worker processes.
+        The results are returned in input order. A verse that cannot be parsed does not abort the run,
+        but is returned as a VerseFailure.
+        Every worker receives chunksize lines at a time, and looks up the dictionary structures
+        of all their distinct words at once (see Bridge.use_dictionary_many).
+        If workers is 1, everything is done in the current process, and all words are looked up at once.
+        """
+        if workers == 1:
+            return _scan_batch(0, list(lines), bridge, creators)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(bridge, creators)) as pool:
+            results: list[Union[Verse, VerseFailure]] = []
+            for batch in pool.map(_scan_in_worker, counter(0, chunksize), _batches(lines, chunksize)):
+                results += batch
+            return results
+
 
 class VersePreprocessor:
     """ The verse preprocessor will do the heavy lifting of analyzing words and their structure.
@@ -82,69 +165,243 @@ class VersePreprocessor:
         self.verse = verse
         self.bridge = bridge
         self.words: list[Word] = []
-        self.creators: set[VerseCreator]
+        self.layers: Optional[list[list[Weight]]] = None
+        self._alternatives: list[tuple[tuple[int, ...], WeightMask]] = []
+        self._pending_alternatives: Optional[Iterator[tuple[tuple[int, ...], WeightMask]]] = None
         # https://docs.python.org/3/tutorial/controlflow.html#default-argument-values
         if isinstance(creators, VerseType):
-            self.creators = set(creators.get_creators())
-        else:
-            self.creators = set()
-            for creator in creators:
-                self.creators.update(creator.get_creators())
+            creators = [creators]
+        # a dict keeps the creators in order, and removes duplicates like a set would
+        self.creators: list[VerseCreator] = list(dict.fromkeys(
+            creator for verse_type in creators for creator in verse_type.get_creators()))
 
     def split(self) -> list[Word]:
-        """ Split a Verse into Words, remembering only the letter characters """
-        array = re.split('[^a-zA-Zë]+', self.verse.strip())
-        for word in array:
-            if word.isalpha():
-                self.words.append(Word(word))
+        """ Split a Verse into Words, remembering only the letter characters; this is only done once """
+        if not self.words:
+            array = re.split('[^a-zA-Zë]+', self.verse.strip())
+            for word in array:
+                if word.isalpha():
+                    self.words.append(Word(word))
         return self.words
 
     def layer(self) -> list[list[Weight]]:
-        """ get available weights of syllables """
-        self.split()
-        for word in self.words:
-            word.analyze_structure(self.bridge)
-        for count, word in enumerate(self.words[:-1]):
-            new_weight = word.apply_word_contact(self.words[count + 1])
-            if new_weight:
-                word.syllables[-1].weight = new_weight
-        return [word.get_syllable_structure() for word in self.words]
-
-    def get_flat_lists(self) -> list[list[Weight]]:
+        """ get available weights of syllables; the words are only analyzed once """
+        if self.layers is None:
+            self.split()
+            for word in self.words:
+                word.analyze_structure(self.bridge)
+            for count, word in enumerate(self.words[:-1]):
+                new_weight = word.apply_word_contact(self.words[count + 1])
+                if new_weight:
+                    word.syllables[-1].weight = new_weight
+            self.layers = [word.get_syllable_structure() for word in self.words]
+        return self.layers
+
+    def get_flat_lists(self) -> Iterator[WeightMask]:
+        """
+        lazily generate the syllable weights of the verse for every combination of elision and hiatus
+        the most likely combinations come first: elision before hiatus, and fewer hiatuses before more
+        every combination is only generated once, and then shared by all creators
+        """
+        for _, flat_list in self._get_alternatives():
+            yield flat_list
+
+    def _get_alternatives(self) -> Iterator[tuple[tuple[int, ...], WeightMask]]:
+        """ the flat lists, along with the positions of the syllables in hiatus """
+        count = 0
+        while True:
+            if count == len(self._alternatives):
+                if self._pending_alternatives is None:
+                    self._pending_alternatives = self._generate_alternatives()
+                try:
+                    self._alternatives.append(next(self._pending_alternatives))
+                except StopIteration:
+                    return
+            yield self._alternatives[count]
+            count += 1
+
+    def _generate_alternatives(self) -> Iterator[tuple[tuple[int, ...], WeightMask]]:
         self.layer()
-        flat_lists: list[list[Optional[Weight]]] = []
         flat_list: list[Syllable] = []
-
         for word in self.words:
             flat_list += [syll for syll in word.syllables]
+        weights: list[Optional[Weight]] = [syll.weight for syll in flat_list]
         permutations = [idx for idx, syll in enumerate(flat_list) if syll.get_alternative_weight()]
-        for a in range(2**len(permutations)):
-            flat_lists.append(list(syll.weight for syll in flat_list))
-        prod = list(cartesian_product(*[[False, True]] * len(permutations)))
-        for count, lst in enumerate(flat_lists):
-            for x, perm in enumerate(permutations):
-                if prod[count][x]:
+        for hiatuses in range(len(permutations) + 1):
+            for combination in combinations(permutations, hiatuses):
+                lst = list(weights)
+                for perm in combination:
                     lst[perm] = flat_list[perm].get_alternative_weight()
-        return [[weight for weight in lst if weight and weight != Weight.NONE] for lst in flat_lists]
+                yield combination, WeightMask.from_weights(weight for weight in lst if weight and weight != Weight.NONE)
+
+    def _copy_words(self, hiatuses: tuple[int, ...]) -> list[Word]:
+        """ copies of the analyzed words, in which the syllables at the given positions are not elided """
+        words = [word.copy() for word in self.words]
+        syllables = [syll for word in words for syll in word.syllables]
+        for idx in hiatuses:
+            syllables[idx].weight = syllables[idx].get_alternative_weight()
+        return words
 
     def create_verse(self, verse_id: int) -> Verse:
-        problems = []
+        return self.scan(verse_id).get_verse()
+
+    def scan(self, verse_id: int = 0) -> ScanResult:
+        """
+        try the creators on the combinations of elision and hiatus until a verse can be parsed.
+        Every failed candidate is collected as a ScanFailure, which keeps no traceback;
+        an exception is only raised again by ScanResult.get_verse, at the public API.
+        """
+        failures: list[ScanFailure] = []
         for creator in self.creators:
-            local_problems = []
-            worked = False
+            name = getattr(creator, '__name__', repr(creator))
             for flat_list in self.get_flat_lists():
-                verseClassType = creator(flat_list)  # returns e.g. the SpondaicHexameter type
-                verse = verseClassType(self.verse)
+                try:
+                    verseClassType = creator(flat_list)  # returns e.g. the SpondaicHexameter type
+                except VerseCreatorException as exc:
+                    failures.append(ScanFailure.of(exc).of_candidate(name, flat_list))
+                    # e.g. a pentameter has too few syllables for a hexameter: the next creator may scan it
+                    break
+                verse = verseClassType(self.verse, flat_list)
                 verse.words = self.words
-                verse.flat_list = list(flat_list)
                 try:
                     verse.parse()
-                    worked = True
-                    if verse_id:
-                        verse.save(verse_id, self.bridge)
-                    return verse  # TODO what if multiple options are viable
                 except ScansionException as exc:
-                    local_problems.append(exc)
-            if not worked:
-                problems += local_problems
-        raise VerseException("parsing did not succeed", *problems)
+                    failures.append(ScanFailure.of(exc).of_candidate(name, flat_list))
+                    continue
+                if verse_id:
+                    verse.save(verse_id, self.bridge)
+                return ScanResult(verse)  # TODO what if multiple options are viable
+        return ScanResult(None, tuple(failures))
+
+    async def create_verse_async(self, verse_id: int, bridge: AsyncBridge) -> Verse:
+        """ look up all words of the verse concurrently, and then create the verse without waiting for the bridge """
+        self.bridge = await prefetch(self.split(), bridge)
+        verse = self.create_verse(0)
+        if verse_id:
+            await verse.save_async(verse_id, bridge)
+        return verse
+
+    def create_all(self) -> list[Verse]:
+        """
+        try every creator on every combination of elision and hiatus, and return all verses that can be parsed,
+        the most likely first (see ScansionScore). The words are analyzed once, and copied for every verse.
+        If the verse cannot be parsed at all, the list is empty.
+        """
+        verses: list[tuple[ScansionScore, Verse]] = []
+        for creator in self.creators:
+            for hiatuses, flat_list in self._get_alternatives():
+                try:
+                    verse = creator(flat_list)(self.verse, flat_list)
+                    verse.words = self._copy_words(hiatuses)
+                    verse.parse()
+                except ScansionException:
+                    continue
+                verse.score = ScansionScore(len(hiatuses), flat_list.anceps_count(), verse.count_disagreements())
+                verses.append((verse.score, verse))
+        # sorting is stable: among equally likely verses, the order of the creators and alternatives is kept
+        verses.sort(key=lambda scored: scored[0])
+        return [verse for _, verse in verses]
+
+
+async def prefetch(words: Iterable[Word], bridge: AsyncBridge) -> PrefetchedBridge:
+    """ look up the dictionary structures and deviant syllables of all (distinct) words concurrently """
+    words = list(words)
+    lexemes = list(dict.fromkeys(word.without_enclitic() for word in words))
+    texts = list(dict.fromkeys(word.text for word in words))
+    deviants, structures = await asyncio.gather(
+        asyncio.gather(*(bridge.split_from_deviant_word(lexeme) for lexeme in lexemes)),
+        asyncio.gather(*(bridge.use_dictionary(text) for text in texts)))
+    return PrefetchedBridge(dict(zip(texts, structures)), dict(zip(lexemes, deviants)))
+
+
+def prefetch_dictionary(words: Iterable[Word], bridge: Bridge) -> PrefetchedBridge:
+    """ look up the dictionary structures of all (distinct) words at once; deviant words are still looked up later """
+    return PrefetchedBridge(bridge.use_dictionary_many(list(dict.fromkeys(word.text for word in words))), {}, bridge)
+
+
+def scan_stream(fileobj: TextIO, verse_form: VerseForm = VerseForm.HEXAMETRIC,
+                bridge: Bridge = DummyBridge()) -> Iterator[Union[Verse, VerseFailure]]:
+    """ Scan a text one line at a time, yielding every Verse (or VerseFailure) as soon as it is scanned.
+    The verse types of the verse form are assigned to the lines in turn,
+    e.g. an elegiac text alternates between hexameters and pentameters.
+    Empty lines are skipped, and do not count as a verse of the form.
+    """
+    verse_types = cycle(verse_form.get_verse_types())
+    for index, line in enumerate(fileobj):
+        line = line.rstrip('\r\n')
+        if not line.strip():
+            continue
+        yield _scan_line(index, line, bridge, next(verse_types))
+
+
+def _scan_line(index: int, line: str, bridge: Bridge,
+               creators: Union[VerseType, Sequence[VerseType]]) -> Union[Verse, VerseFailure]:
+    return _scan_preprocessed(index, VersePreprocessor(line, bridge, creators))
+
+
+def _scan_batch(start: int, lines: list[str], bridge: Bridge,
+                creators: Union[VerseType, Sequence[VerseType]]) -> list[Union[Verse, VerseFailure]]:
+    """ scan the lines, after looking up the dictionary structures of all their words at once """
+    preprocessors = [VersePreprocessor(line, bridge, creators) for line in lines]
+    words, failures = _split_all(start, preprocessors)
+    return _scan_prefetched(start, preprocessors, prefetch_dictionary(words, bridge), failures)
+
+
+def _split_all(start: int, preprocessors: list[VersePreprocessor]) -> tuple[list[Word], dict[int, VerseFailure]]:
+    """ the words of all lines that can be split, and a VerseFailure for every line that cannot, by its index """
+    words: list[Word] = []
+    failures: dict[int, VerseFailure] = {}
+    for index, preprocessor in enumerate(preprocessors, start):
+        try:
+            words += preprocessor.split()
+        except ScansionException as exc:  # e.g. a letter that is not Latin
+            failures[index] = VerseFailure.of_exception(index, preprocessor.verse, exc)
+    return words, failures
+
+
+def _scan_prefetched(start: int, preprocessors: list[VersePreprocessor], bridge: Bridge,
+                     failures: dict[int, VerseFailure]) -> list[Union[Verse, VerseFailure]]:
+    """ scan the lines with the prefetched bridge, except those that could not be split """
+    results: list[Union[Verse, VerseFailure]] = []
+    for index, preprocessor in enumerate(preprocessors, start):
+        if index in failures:
+            results.append(failures[index])
+            continue
+        preprocessor.bridge = bridge
+        results.append(_scan_preprocessed(index, preprocessor))
+    return results
+
+
+def _scan_preprocessed(index: int, preprocessor: VersePreprocessor) -> Union[Verse, VerseFailure]:
+    try:
+        result = preprocessor.scan()
+    except ScansionException as exc:  # the words of the verse could not be analyzed
+        return VerseFailure.of_exception(index, preprocessor.verse, exc)
+    if result.verse is None:
+        return VerseFailure.of_result(index, preprocessor.verse, result)
+    return result.verse
+
+
+def _batches(lines: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(lines)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+# state of a worker process in VerseFactory.create_many, set up once by _init_worker
+_worker_bridge: Bridge = DummyBridge()
+_worker_creators: Union[VerseType, Sequence[VerseType]] = []
+
+
+def _init_worker(bridge: Bridge, creators: Union[VerseType, Sequence[VerseType]]) -> None:
+    """ Executed once in every worker process, before it scans its first verse.
+    The shared Whitaker parser is loaded here, and the SoundFactory keeps its sounds for the lifetime of the worker.
+    """
+    global _worker_bridge, _worker_creators
+    _worker_bridge = bridge
+    _worker_creators = creators
+    get_parser()
+
+
+def _scan_in_worker(start: int, lines: list[str]) -> list[Union[Verse, VerseFailure]]:
+    return _scan_batch(start, lines, _worker_bridge, _worker_creators)
@@ -0,0 +1,196 @@
+""" a columnar store of scanned verses, in a file that is memory-mapped instead of loaded """
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, Iterable, Literal, Optional
+
+from ..syllable import Weight
+from .verse import Verse
+
+# the file starts with a header: magic bytes, version and byte order of the columns
+HEADER = struct.Struct('<4sHc')
+MAGIC = b'EVST'
+VERSION = 1
+# every column is an array of numbers, in this order; the header is followed by the length of every column
+# the columns that end in _start have one item more than the table they index: the end of the last item
+Typecode = Literal['q', 'I', 'B']  # the typecodes of array and memoryview.cast that the columns use
+COLUMNS: tuple[tuple[str, Typecode], ...] = (
+    ('verse_ids', 'q'),  # of every verse: its id
+    ('verse_word_start', 'I'),  # of every verse: the index of its first word
+    ('verse_foot_start', 'I'),  # of every verse: the index of its first foot
+    ('feet', 'B'),  # of every foot: its Foot value
+    ('word_syllable_start', 'I'),  # of every word: the index of its first syllable
+    ('syllable_verses', 'I'),  # of every syllable: the index of its verse
+    ('syllable_words', 'I'),  # of every syllable: the index of its word
+    ('syllable_text_start', 'I'),  # of every syllable: the offset of its letters in text
+    ('weights', 'B'),  # of every syllable: its Weight value, or NO_WEIGHT
+    ('stressed', 'B'),  # of every syllable: 1 if it is stressed
+    ('syllable_feet', 'B'),  # of every syllable: the Foot value of its foot, or 0 (Foot.UNKNOWN) if it is elided
+    ('text', 'B'),  # the letters of all syllables, encoded in UTF-8
+)
+LENGTHS = struct.Struct(f'<{len(COLUMNS)}Q')
+# every column starts at a multiple of ALIGNMENT bytes
+ALIGNMENT = 8
+NO_WEIGHT = 255
+NONE = Weight.NONE.value
+LIGHT = Weight.LIGHT.value
+
+
+class VerseStore:
+    """
+    VerseStore class
+    The feet, syllable weights, stresses and letters of scanned verses, read from a file written by VerseStore.write.
+    Every column is a memoryview of the memory-mapped file, with one number per verse, foot, word or syllable,
+    so that a corpus can be analyzed without building Verse, Word and Syllable objects again,
+    and without reading more of the file than is used.
+    The columns must be released before the store is closed.
+    """
+    verse_ids: memoryview
+    verse_word_start: memoryview
+    verse_foot_start: memoryview
+    feet: memoryview
+    word_syllable_start: memoryview
+    syllable_verses: memoryview
+    syllable_words: memoryview
+    syllable_text_start: memoryview
+    weights: memoryview
+    stressed: memoryview
+    syllable_feet: memoryview
+    text: memoryview
+
+    def __init__(self, path: str):
+        self._open(path)
+
+    def _open(self, path: str) -> None:
+        self.path = path
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, byteorder = (b'', 0, b'')
+        if len(self._map) >= HEADER.size + LENGTHS.size:
+            magic, version, byteorder = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a verse store file of version {VERSION}")
+        if byteorder != _byteorder():
+            self._map.close()
+            raise ValueError(f"{path} was written on a machine with another byte order")
+        view = memoryview(self._map)
+        offset = HEADER.size + LENGTHS.size
+        for (name, typecode), length in zip(COLUMNS, LENGTHS.unpack_from(self._map, HEADER.size)):
+            offset = _align(offset)
+            size = length * array(typecode).itemsize
+            setattr(self, name, view[offset:offset + size].cast(typecode))
+            offset += size
+        view.release()
+
+    @staticmethod
+    def write(path: str, verses: Iterable[Verse], ids: Optional[Iterable[int]] = None) -> int:
+        """
+        write a verse store file for the given scanned verses, and return the number of verses
+        the verses are numbered from 0, unless their ids are given
+        """
+        columns = {name: array(typecode) for name, typecode in COLUMNS}
+        for name in ('verse_word_start', 'verse_foot_start', 'word_syllable_start', 'syllable_text_start'):
+            columns[name].append(0)
+        text = bytearray()
+        id_iterator = iter(ids) if ids is not None else None
+        for index, verse in enumerate(verses):
+            columns['verse_ids'].append(next(id_iterator) if id_iterator is not None else index)
+            feet = [foot.value if foot else 0 for foot in verse.feet]
+            columns['feet'].extend(feet)
+            foot_values = [value for value, foot in zip(feet, verse.feet) for _ in range(len(foot) if foot else 0)]
+            count = 0
+            for word in verse.words:
+                for syllable in word.syllables:
+                    columns['syllable_verses'].append(index)
+                    columns['syllable_words'].append(len(columns['word_syllable_start']) - 1)
+                    text += ''.join(sound.letters for sound in syllable.sounds).encode()
+                    columns['syllable_text_start'].append(len(text))
+                    weight = syllable.weight
+                    columns['weights'].append(NO_WEIGHT if weight is None else weight.value)
+                    columns['stressed'].append(1 if syllable.stressed else 0)
+                    if weight == Weight.NONE or count >= len(foot_values):
+                        columns['syllable_feet'].append(0)
+                    else:
+                        columns['syllable_feet'].append(foot_values[count])
+                        count += 1
+                columns['word_syllable_start'].append(len(columns['syllable_verses']))
+            columns['verse_word_start'].append(len(columns['word_syllable_start']) - 1)
+            columns['verse_foot_start'].append(len(columns['feet']))
+        columns['text'].frombytes(bytes(text))
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, _byteorder()))
+            file.write(LENGTHS.pack(*(len(columns[name]) for name, _ in COLUMNS)))
+            offset = HEADER.size + LENGTHS.size
+            for name, _ in COLUMNS:
+                file.write(bytes(_align(offset) - offset))
+                data = columns[name].tobytes()
+                file.write(data)
+                offset = _align(offset) + len(data)
+        return len(columns['verse_ids'])
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {'path': self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._open(state['path'])
+
+    def __enter__(self) -> 'VerseStore':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.verse_ids)
+
+    def syllables(self, verse: int) -> range:
+        """ the indices of the syllables of a verse (by its index in the store, not its id) """
+        return range(self.word_syllable_start[self.verse_word_start[verse]],
+                     self.word_syllable_start[self.verse_word_start[verse + 1]])
+
+    def syllable_text(self, syllable: int) -> str:
+        return bytes(self.text[self.syllable_text_start[syllable]:self.syllable_text_start[syllable + 1]]).decode()
+
+    def structure(self, verse: int) -> str:
+        """ the feet of a verse, as written by Verse.structure """
+        feet = self.feet[self.verse_foot_start[verse]:self.verse_foot_start[verse + 1]]
+        return ''.join(str(foot) if foot else ' ' for foot in feet)
+
+    def get_weights(self, verse: int) -> list[Optional[Weight]]:
+        return [None if self.weights[index] == NO_WEIGHT else Weight(self.weights[index])
+                for index in self.syllables(verse)]
+
+    def get_zeleny_score(self, verse: int) -> list[int]:
+        """ the Zeleny score of a verse, as computed by Verse.get_zeleny_score """
+        syllables = self.syllables(verse)
+        score = []
+        current = 0
+        # one slice per column: indexing a memoryview item by item is slower than iterating a list
+        for weight, stressed in zip(self.weights[syllables.start:syllables.stop].tolist(),
+                                    self.stressed[syllables.start:syllables.stop].tolist()):
+            if current and stressed:
+                score.append(current)
+                current = 0
+            if weight == NONE:
+                continue
+            elif weight == LIGHT:
+                current += 1
+            else:
+                current += 2
+        score.append(current)
+        return score
+
+    def close(self) -> None:
+        for name, _ in COLUMNS:
+            getattr(self, name).release()
+        self._map.close()
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _byteorder() -> bytes:
+    return b'<' if sys.byteorder == 'little' else b'>'
@@ -0,0 +1,113 @@
+""" compact encoding of a list of syllable weights """
+from typing import Iterable, Iterator, Sequence, Union, overload
+
+from ..syllable import Weight
+
+
+class WeightMask(Sequence[Weight]):
+    """
+    WeightMask class
+    An immutable list of syllable weights, encoded as a bitmask of the known heavy syllables,
+    a bitmask of the known light syllables, and a length. Every other syllable is anceps.
+    Bit n of a mask stands for the syllable at position n.
+    It can be used wherever a list of weights is read, and checking it against a verse pattern
+    takes a few bitwise operations instead of a comparison per syllable.
+    """
+    __slots__ = ('heavy', 'light', 'length')
+
+    def __init__(self, heavy: int = 0, light: int = 0, length: int = 0):
+        if heavy & light:
+            raise ValueError("a syllable cannot be both heavy and light")
+        if (heavy | light) >> length:
+            raise ValueError("mask does not fit in the given length")
+        self.heavy = heavy
+        self.light = light
+        self.length = length
+
+    @classmethod
+    def from_weights(cls, weights: Iterable[Weight]) -> 'WeightMask':
+        """ encode a list of weights; elided syllables (Weight.NONE) must have been left out """
+        heavy = light = length = 0
+        for weight in weights:
+            if weight == Weight.HEAVY:
+                heavy |= 1 << length
+            elif weight == Weight.LIGHT:
+                light |= 1 << length
+            elif weight != Weight.ANCEPS:
+                raise ValueError(f"cannot encode {weight} in a WeightMask")
+            length += 1
+        return cls(heavy, light, length)
+
+    @classmethod
+    def of(cls, weights: Sequence[Weight]) -> 'WeightMask':
+        """ the list of weights as a WeightMask, without encoding it again if it already is one """
+        if isinstance(weights, WeightMask):
+            return weights
+        return cls.from_weights(weights)
+
+    @classmethod
+    def from_pattern(cls, pattern: str) -> 'WeightMask':
+        """ encode a verse pattern written with - for heavy, u for light, and x for anceps """
+        return cls.from_weights(Weight.HEAVY if x == '-' else Weight.LIGHT if x == 'u' else Weight.ANCEPS
+                                for x in pattern)
+
+    def __len__(self) -> int:
+        return self.length
+
+    @overload
+    def __getitem__(self, index: int) -> Weight: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Weight]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Weight, list[Weight]]:
+        if isinstance(index, slice):
+            return [self[count] for count in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("WeightMask index out of range")
+        if self.heavy >> index & 1:
+            return Weight.HEAVY
+        if self.light >> index & 1:
+            return Weight.LIGHT
+        return Weight.ANCEPS
+
+    def __iter__(self) -> Iterator[Weight]:
+        heavy, light = self.heavy, self.light
+        for count in range(self.length):
+            if heavy >> count & 1:
+                yield Weight.HEAVY
+            elif light >> count & 1:
+                yield Weight.LIGHT
+            else:
+                yield Weight.ANCEPS
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, WeightMask):
+            return (self.heavy, self.light, self.length) == (other.heavy, other.light, other.length)
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.heavy, self.light, self.length))
+
+    def __repr__(self) -> str:
+        return ''.join('-' if self.heavy >> count & 1 else 'u' if self.light >> count & 1 else 'x'
+                       for count in range(self.length))
+
+    def anceps_count(self) -> int:
+        """ the number of syllables whose weight is not known """
+        return self.length - bin(self.heavy | self.light).count('1')
+
+    def conflicts(self, pattern: 'WeightMask', offset: int = 0) -> bool:
+        """
+        does a known weight contradict the pattern, placed at the given position
+        positions outside of the pattern are not checked
+        """
+        return bool((self.heavy >> offset) & pattern.light or (self.light >> offset) & pattern.heavy)
+
+    def merge(self, pattern: 'WeightMask', offset: int = 0) -> 'WeightMask':
+        """ fill in the known weights of a pattern that does not conflict, placed at the given position """
+        return WeightMask(self.heavy | pattern.heavy << offset, self.light | pattern.light << offset, self.length)
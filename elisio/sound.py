@@ -1,5 +1,5 @@
-﻿import re
-from enum import Enum
+﻿from enum import Enum
+from typing import Optional
 
 from .exceptions import SoundException
 
@@ -42,6 +42,8 @@ latin_letters = {
 }
 
 liquida = ['r', 'l']
+# every text of 3 letters with an intervocalic semivowel, in which the semivowel is a separate sound
+INTERVOCALIC = frozenset(first + middle + last for first in "aeijouvy" for middle in "ijuv" for last in "aeijouvy")
 hard_muta = ['p', 't', 'c']
 muta = ['b', 'd', 'g', 'f'] + hard_muta
 
@@ -50,9 +52,25 @@ class Sound:
     """
     Sound class
     A sound is composed of one or several Letters
+    Sounds are immutable and interned: there is only one instance of every valid sound,
+    so they are compared by identity, and their properties are computed once.
+    Every sound has a code, its index in SOUNDS, so that a sequence of sounds can be stored as bytes
     """
-
-    def __init__(self, *letters: str):
+    __slots__ = ('letters', 'code', 'vowel', 'semivowel', 'consonant', 'diphthong', 'heavy_making', 'aspirate',
+                 'muta_cum_liquida')
+    _instances: dict[tuple[type, str], 'Sound'] = {}
+
+    letters: str
+    code: int
+    vowel: bool
+    semivowel: bool
+    consonant: bool
+    diphthong: bool
+    heavy_making: bool
+    aspirate: bool
+    muta_cum_liquida: bool
+
+    def __new__(cls, *letters: str) -> 'Sound':
         """ construct a Sound from a list of letters, or (a list of) text(s) """
         if not letters:
             raise SoundException("Sound constructor cannot have empty argument list")
@@ -62,7 +80,35 @@ class Sound:
                 local_letters += letter
             else:
                 raise SoundException(f"invalid constructor arguments: {letters}")
-        self.letters = local_letters
+        try:
+            return Sound._instances[cls, local_letters]
+        except KeyError:
+            pass
+        sound = super().__new__(cls)
+        object.__setattr__(sound, 'letters', local_letters)
+        if not sound.is_valid_sound():
+            raise SoundException(f"not a valid sound: {local_letters}")
+        for name in Sound.__slots__[2:]:
+            object.__setattr__(sound, name, getattr(sound, '_is_' + name)())
+        object.__setattr__(sound, 'code', len(SOUNDS))
+        SOUNDS.append(sound)
+        Sound._instances[cls, local_letters] = sound
+        return sound
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> tuple[type, tuple[str, ...]]:
+        return self.__class__, tuple(self.letters)
+
+    def __copy__(self) -> 'Sound':
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> 'Sound':
+        return self
 
     def is_valid_sound(self) -> bool:
         """ is a given sound a valid sound
@@ -72,9 +118,6 @@ class Sound:
         """
         raise NotImplementedError("Please implement this method")
 
-    def __eq__(self, other: object) -> bool:
-        return self.__dict__ == other.__dict__
-
     def __repr__(self) -> str:
         return str(self.letters)
 
@@ -83,55 +126,70 @@ class Sound:
 
     def is_vowel(self) -> bool:
         """ determine whether a sound is unambiguously vocalic """
-        return False
+        return self.vowel
 
     def is_semivowel(self) -> bool:
         """ it is impossible to determine on the sound level
         whether or not a semivowel is vocalic or consonantal
         therefore we keep the semivowel category separate
         """
-        return False
+        return self.semivowel
 
     def is_consonant(self) -> bool:
-        """
-        does a sound contain a consonantal letter
-        implicitly abstract
-        """
-        return False
+        """ does a sound contain a consonantal letter """
+        return self.consonant
 
     def is_diphthong(self) -> bool:
-        """
-        implicitly abstract
-        """
-        return False
+        """ is a sound a double vowel """
+        return self.diphthong
 
     def is_heavy_making(self) -> bool:
-        """
-        does a sound contain a cluster-forming consonant letter
-        implicitly abstract
-        """
-        return False
+        """ does a sound contain a cluster-forming consonant letter """
+        return self.heavy_making
 
     def is_h(self) -> bool:
-        """
-        implicitly abstract
-        """
-        return False
+        """ is a sound the aspirate """
+        return self.aspirate
+
+    def is_muta_cum_liquida(self) -> bool:
+        """ MCL is a sequence of a stop or f and a liquid sound """
+        return self.muta_cum_liquida
 
     def get_type(self) -> LetterType:
         """ general API method for getting the type """
         return latin_letters[self.letters[0]]
 
+    # the rules for the properties, which are only evaluated when a sound is created
+    # implicitly abstract
+    def _is_vowel(self) -> bool:
+        return False
+
+    def _is_semivowel(self) -> bool:
+        return False
+
+    def _is_consonant(self) -> bool:
+        return False
+
+    def _is_diphthong(self) -> bool:
+        return False
+
+    def _is_heavy_making(self) -> bool:
+        return False
+
+    def _is_aspirate(self) -> bool:
+        return False
+
+    def _is_muta_cum_liquida(self) -> bool:
+        return False
+
 
 class VowelSound(Sound):
     """
     Vowels are syllable-bearing Sounds
     """
+    __slots__ = ()
 
-    def __init__(self, *letters: str):
-        super().__init__(*letters)
-
-    def is_vowel(self) -> bool:
+    def _is_vowel(self) -> bool:
         """ override for type checking """
         return True
 
@@ -148,11 +206,9 @@ class Diphthong(VowelSound):
     """
     Diphthongs are specific double Vowel Sounds
     """
+    __slots__ = ()
 
-    def __init__(self, *letters: str):
-        super().__init__(*letters)
-
-    def is_diphthong(self) -> bool:
+    def _is_diphthong(self) -> bool:
         """ override for type checking """
         return True
 
@@ -174,11 +230,9 @@ class SemivowelSound(Sound):
     both phonetic and lexical circumstances
     They have no knowledge which they are at any given time
     """
+    __slots__ = ()
 
-    def __init__(self, *letters: str):
-        super().__init__(*letters)
-
-    def is_semivowel(self) -> bool:
+    def _is_semivowel(self) -> bool:
         """ override for type checking """
         return True
 
@@ -197,11 +251,9 @@ class ConsonantSound(Sound):
     to make a previous Syllable heavy. They do so when clustered,
     unless (maybe) in specific double-Consonant combinations
     """
+    __slots__ = ()
 
-    def __init__(self, *letters: str):
-        super().__init__(*letters)
-
-    def is_consonant(self) -> bool:
+    def _is_consonant(self) -> bool:
         """ override for type checking """
         return True
 
@@ -213,13 +265,13 @@ class ConsonantSound(Sound):
             return latin_letters[self.letters] == LetterType.CONSONANT
         return self.is_valid_double_sound()
 
-    def is_h(self) -> bool:
+    def _is_aspirate(self) -> bool:
         """
         method call avoids literal
         """
         return self.letters[0] == 'h'
 
-    def is_muta_cum_liquida(self) -> bool:
+    def _is_muta_cum_liquida(self) -> bool:
         """
         MCL is a sequence of a stop or f and a liquid sound
         """
@@ -239,7 +291,7 @@ class ConsonantSound(Sound):
         first = self.letters[0]
         second = self.letters[1]
         return ((second == 'u' and first in ['q', 'g']) or
-                self.is_muta_cum_liquida() or
+                self._is_muta_cum_liquida() or
                 (second == 'h' and
                  (first == 'r' or first in hard_muta)))
 
@@ -250,11 +302,9 @@ class HeavymakerSound(ConsonantSound):
     inherently make the previous Syllable heavy
     because they essentially are two Sounds in one Letter
     """
+    __slots__ = ()
 
-    def __init__(self, *letters: str):
-        super().__init__(*letters)
-
-    def is_heavy_making(self) -> bool:
+    def _is_heavy_making(self) -> bool:
         """ override for type checking """
         return True
 
@@ -267,38 +317,61 @@ class HeavymakerSound(ConsonantSound):
         return False
 
 
+# every sound, by its code
+SOUNDS: list[Sound] = []
+
+
+def _create_all_sounds() -> dict[str, Sound]:
+    """
+    every valid sound: a sound for every letter, and a Diphthong or double ConsonantSound
+    for the combinations of two letters that form one
+    """
+    sounds: dict[str, Sound] = {letter: globals()[str.title(typ.name) + "Sound"](letter)
+                                for (letter, typ) in latin_letters.items()}
+    for first, sound in list(sounds.items()):
+        double_class: type[Sound] = Diphthong if sound.vowel or sound.semivowel else ConsonantSound
+        for second in latin_letters:
+            try:
+                sounds[first + second] = double_class(first, second)
+            except SoundException:
+                pass
+    return sounds
+
+
 class SoundFactory:
-    sound_dict = {letter: globals()[str.title(typ.name) + "Sound"](letter) for (letter, typ) in latin_letters.items()}
+    # the closed set of valid sounds, by their (normalized) letters
+    sound_dict = _create_all_sounds()
+    # tables for find_sounds_for_text, filled on first use
+    singles: dict[str, Sound] = {}
+    doubles: dict[str, Sound] = {}
 
     @staticmethod
     def create(letters: str) -> Sound:
         """
         outward-facing factory which preparses its parameters
-        and passes them to the internal factory method
+        and looks up the sound they form
         """
-        if letters.lower() in SoundFactory.sound_dict:
-            return SoundFactory.sound_dict[letters.lower()]
-        for count, letter in enumerate(letters):
-            item = letter.lower()
-            if item == 'v':
-                item = 'u'
-            elif item == 'j':
-                item = 'i'
-            if not count:
-                try:
-                    sound = SoundFactory.sound_dict[item]
-                except KeyError:
-                    raise SoundException(f"not a valid letter: {item}")
-            else:
-                if sound.is_vowel() or sound.is_semivowel():
-                    sound = Diphthong(sound.letters[0], item)
-                elif sound.is_consonant():
-                    sound = ConsonantSound(sound.letters[0], item)
-        if not sound.is_valid_sound():
-            raise SoundException("not a valid sound given in factory method")
-        SoundFactory.sound_dict[sound.letters] = sound
+        sound = SoundFactory.find(letters)
+        if sound is not None:
+            return sound
+        if len(letters) <= 2:
+            for letter in SoundFactory._normalize(letters):
+                if letter not in latin_letters:
+                    raise SoundException(f"not a valid letter: {letter}")
+        raise SoundException("not a valid sound given in factory method")
+
+    @staticmethod
+    def find(letters: str) -> Optional[Sound]:
+        """ the sound that the letters form, or None if they do not form one """
+        sound = SoundFactory.sound_dict.get(letters.lower())
+        if sound is None and len(letters) <= 2:
+            sound = SoundFactory.sound_dict.get(SoundFactory._normalize(letters))
         return sound
 
+    @staticmethod
+    def _normalize(letters: str) -> str:
+        return letters.lower().replace('v', 'u').replace('j', 'i')
+
     @staticmethod
     def create_sounds_from_text(text: str) -> list[Sound]:
         """
@@ -312,22 +385,65 @@ class SoundFactory:
             raise SoundException("too many letters in this text sample")
         elif len(text) == 3:
             # detect intervocalic semivowels
-            if re.match("^[aeijouvy][ijuv][aeijouvy]$", text):
+            if text in INTERVOCALIC:
                 return [SoundFactory.create(text[0]), SoundFactory.create(text[1])]
-        try:
-            sound = SoundFactory.create(text[0:2])
-        except SoundException:
+        sound = SoundFactory.find(text[0:2])
+        if sound is None:
             sound = SoundFactory.create(text[0])
         return [sound]
 
     @staticmethod
     def find_sounds_for_text(text: str) -> list[Sound]:
-        """ iteratively allocate all text to a sound """
+        """
+        allocate all text to sounds in a single pass, looking them up in precomputed tables
+        the result is identical to that of the reference implementation in benchmarks/reference.py
+        """
+        if ' ' in text:
+            raise SoundException("argument cannot contain spaces")
+        singles, doubles = SoundFactory._get_tables()
         i = 0
+        length = len(text)
         sounds: list[Sound] = []
-        while i < len(text):
-            added_sounds = SoundFactory.create_sounds_from_text(text[i:i + 3])
-            for sound in added_sounds:
+        while i < length:
+            if text[i:i + 3] in INTERVOCALIC:
+                # intervocalic semivowel: both letters are single sounds
+                sounds.append(singles[text[i]])
+                sounds.append(singles[text[i + 1]])
+                i += 2
+                continue
+            sound = doubles.get(text[i:i + 2])
+            if sound is not None:
                 sounds.append(sound)
-                i += len(sound.letters)
+                i += 2
+                continue
+            sound = singles.get(text[i])
+            if sound is None:
+                # a letter outside of the tables, e.g. an invalid one: let the factory decide
+                added_sounds = SoundFactory.create_sounds_from_text(text[i:i + 3])
+                sounds += added_sounds
+                i += sum(len(added.letters) for added in added_sounds)
+                continue
+            sounds.append(sound)
+            i += 1
         return sounds
+
+    @staticmethod
+    def _get_tables() -> tuple[dict[str, Sound], dict[str, Sound]]:
+        """
+        the sound for every (lower or upper case) letter, and for every pair of letters that is a single sound,
+        found by the factory method itself
+        """
+        if not SoundFactory.doubles:
+            letters = [letter for letter in latin_letters] + ['v', 'j']
+            letters += [letter.upper() for letter in letters]
+            singles = {letter: SoundFactory.create(letter) for letter in letters}
+            doubles: dict[str, Sound] = {}
+            for first in letters:
+                for second in letters:
+                    try:
+                        doubles[first + second] = SoundFactory.create(first + second)
+                    except SoundException:
+                        pass
+            SoundFactory.singles = singles
+            SoundFactory.doubles = doubles
+        return SoundFactory.singles, SoundFactory.doubles
@@ -1,8 +1,9 @@
-﻿from enum import Enum
-from typing import Optional, Union
+﻿from collections.abc import MutableSequence
+from enum import Enum
+from typing import Iterable, Iterator, Optional, Sequence, Union, overload
 
 from .exceptions import SyllableException
-from .sound import Sound, SoundFactory
+from .sound import SOUNDS, Sound, SoundFactory
 
 
 class Weight(Enum):
@@ -15,22 +16,105 @@ class Weight(Enum):
     ANCEPS = 3
 
 
+class SyllableSounds(MutableSequence[Sound]):
+    """
+    The sounds of a Syllable, as a list that reads and writes the codes of the syllable:
+    changing it in place changes the syllable
+    """
+    __slots__ = ('syllable',)
+
+    def __init__(self, syllable: 'Syllable'):
+        self.syllable = syllable
+
+    def __len__(self) -> int:
+        return len(self.syllable.codes)
+
+    @overload
+    def __getitem__(self, index: int) -> Sound: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Sound]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Sound, list[Sound]]:
+        if isinstance(index, slice):
+            return [SOUNDS[code] for code in self.syllable.codes[index]]
+        return SOUNDS[self.syllable.codes[index]]
+
+    @overload
+    def __setitem__(self, index: int, value: Sound) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Sound]) -> None: ...
+
+    def __setitem__(self, index: Union[int, slice], value: Union[Sound, Iterable[Sound]]) -> None:
+        codes = bytearray(self.syllable.codes)
+        if isinstance(index, slice) and not isinstance(value, Sound):
+            codes[index] = bytes([sound.code for sound in value])
+        elif isinstance(index, int) and isinstance(value, Sound):
+            codes[index] = value.code
+        else:
+            raise TypeError("a Sound must be assigned to an index, and sounds to a slice")
+        self.syllable.codes = bytes(codes)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        codes = bytearray(self.syllable.codes)
+        del codes[index]
+        self.syllable.codes = bytes(codes)
+
+    def insert(self, index: int, value: Sound) -> None:
+        codes = bytearray(self.syllable.codes)
+        codes.insert(index, value.code)
+        self.syllable.codes = bytes(codes)
+
+    def __iter__(self) -> Iterator[Sound]:
+        return (SOUNDS[code] for code in self.syllable.codes)
+
+    def __eq__(self, other: object) -> bool:
+        """ equal to the list of the same sounds, as the list of sounds was """
+        if isinstance(other, SyllableSounds):
+            return self.syllable.codes == other.syllable.codes
+        return isinstance(other, list) and list(self) == other
+
+    def __add__(self, other: Iterable[Sound]) -> list[Sound]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable[Sound]) -> list[Sound]:
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class Syllable:
     """ Syllable class
     A syllable knows its sounds and can determine if the specific combination of them is a valid one
+    The sounds are stored compactly, as the bytes of their codes (see Sound.code)
     """
-    def __init__(self, text: Union[str, list[Sound]]):
+    __slots__ = ('codes', 'weight', 'stressed', 'alternative_weight')
+
+    def __init__(self, text: Union[str, Sequence[Sound]]):
         """ construct a Syllable by its contents """
         self.weight: Optional[Weight] = None
         self.stressed = False
+        self.alternative_weight: Optional[Weight] = None
+        self.codes = b''
         if text:
             if isinstance(text, str):
                 self.sounds = SoundFactory.find_sounds_for_text(text)
             else:
-                self.sounds = list(text)  # copy the list
+                self.sounds = text
             if not self.is_valid():
                 raise SyllableException("invalid Syllable object")
 
+    @property
+    def sounds(self) -> SyllableSounds:
+        """ the sounds of the syllable, as a list that reads and writes their codes """
+        return SyllableSounds(self)
+
+    @sounds.setter
+    def sounds(self, sounds: Sequence[Sound]) -> None:
+        self.codes = bytes([sound.code for sound in sounds])
+
     @classmethod
     def make_empty_syllable(cls, text: str, weight: Optional[Weight] = None) -> 'Syllable':
         result = cls('')
@@ -38,16 +122,25 @@ class Syllable:
         result.weight = weight
         return result
 
+    def copy(self) -> 'Syllable':
+        """ a copy of the syllable that can be modified independently, without validating it again """
+        result = Syllable('')
+        result.codes = self.codes
+        result.weight = self.weight
+        result.stressed = self.stressed
+        result.alternative_weight = self.alternative_weight
+        return result
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Syllable):
             return False
-        return self.sounds == other.sounds
+        return self.codes == other.codes
 
     def __repr__(self) -> str:
         return str(self.sounds)
 
     def __len__(self) -> int:
-        return sum(len(sound) for sound in self.sounds)
+        return sum(len(SOUNDS[code]) for code in self.codes)
 
     def is_valid(self) -> bool:
         """
@@ -55,20 +148,20 @@ class Syllable:
             * a single vowel or semivowel
             * a semivowel and a vowel in that order
         """
-        if len(self.sounds) > 1 and self.sounds[0].letters == self.sounds[1].letters == 'i':
+        sounds = self.sounds
+        if len(sounds) > 1 and sounds[0].letters == sounds[1].letters == 'i':
             return False
-        if self.sounds[0].letters == 'gu':
+        if sounds[0].letters == 'gu':
             try:
-                copied = Syllable([SoundFactory.create('u')] + self.sounds[1:])
+                copied = Syllable([SoundFactory.create('u')] + sounds[1:])
                 if copied.starts_with_vowel():
-                    self.sounds[0] = SoundFactory.create('g')
-                    self.sounds.insert(1, SoundFactory.create('u'))
+                    self.sounds = [SoundFactory.create('g'), SoundFactory.create('u')] + sounds[1:]
                 return True
             except SyllableException:
                 return False
         contains_final_consonant = contains_vowel = contains_semivowel = False
-        for count, sound in enumerate(self.sounds):
-            if sound.is_consonant():
+        for count, sound in enumerate(sounds):
+            if sound.consonant:
                 if contains_vowel or contains_semivowel:
                     if sound.letters == 'gu':
                         return False
@@ -76,9 +169,9 @@ class Syllable:
             else:
                 if contains_vowel or (contains_final_consonant and contains_semivowel):
                     return False
-                if sound.is_vowel():
+                if sound.vowel:
                     contains_vowel = True
-                elif sound.is_semivowel():
+                elif sound.semivowel:
                     if count > 0:
                         contains_vowel = True
                     contains_semivowel = True
@@ -86,34 +179,38 @@ class Syllable:
 
     def ends_with_consonant(self) -> bool:
         """ last sound of the syllable is consonantal """
-        return self.sounds[-1].is_consonant()
+        return SOUNDS[self.codes[-1]].consonant
 
     def ends_with_consonant_cluster(self) -> bool:
-        return len(self.sounds) > 1 and self.ends_with_consonant() and self.sounds[-2].is_consonant()
+        return len(self.codes) > 1 and self.ends_with_consonant() and SOUNDS[self.codes[-2]].consonant
 
     def must_be_heavy(self) -> bool:
         return self.ends_with_heavymaker() or self.ends_with_consonant_cluster() or self.has_diphthong()
 
     def ends_with_heavymaker(self) -> bool:
         """ last sound of the syllable is consonantal """
-        return self.sounds[-1].is_heavy_making()
+        return SOUNDS[self.codes[-1]].heavy_making
 
     def can_elide_if_final(self) -> bool:
         """ special property of words ending in a vowel """
         return self.ends_with_vowel() or self.ends_with_vowel_and_m()
 
     def ends_with_vowel_and_m(self) -> bool:
-        return self.sounds[-1].letters == 'm' and (self.sounds[-2].is_vowel() or self.sounds[-2].is_semivowel())
+        if SOUNDS[self.codes[-1]].letters != 'm':
+            return False
+        sound = SOUNDS[self.codes[-2]]
+        return sound.vowel or sound.semivowel
 
     def has_diphthong(self) -> bool:
-        return self.get_vowel().is_diphthong()
+        return self.get_vowel().diphthong
 
     def ends_with_vowel(self) -> bool:
         """
         last sound of the syllable is vocalic
         a final semivowel is always vocalic
         """
-        return self.sounds[-1].is_vowel() or self.sounds[-1].is_semivowel()
+        sound = SOUNDS[self.codes[-1]]
+        return sound.vowel or sound.semivowel
 
     def starts_with_vowel(self, initial: bool = True) -> bool:
         """
@@ -121,13 +218,15 @@ class Syllable:
         an initial semivowel is only vocalic if it is the syllable's only sound
         or if it is followed directly by a consonant
         """
-        if self.sounds[0] == SoundFactory.create('ë'):
+        codes = self.codes
+        sound = SOUNDS[codes[0]]
+        if sound is SoundFactory.create('ë'):
             return False
-        if self.sounds[0].is_vowel():
+        if sound.vowel:
             return True
-        if self.sounds[0].is_h() and len(self.sounds) > 1 and not self.sounds[1].is_consonant():
+        if sound.aspirate and len(codes) > 1 and not SOUNDS[codes[1]].consonant:
             return True
-        return self.sounds[0].is_semivowel() and (not initial or len(self.sounds) == 1 or self.sounds[1].is_consonant())
+        return sound.semivowel and (not initial or len(codes) == 1 or SOUNDS[codes[1]].consonant)
 
     def starts_with_consonant(self, initial: bool = True) -> bool:
         """
@@ -139,21 +238,22 @@ class Syllable:
     def starts_with_consonant_cluster(self) -> bool:
         """ first sounds of the syllable are all consonants """
         return (self.starts_with_consonant() and
-                ((len(self.sounds) > 1 and self.sounds[1].is_consonant()) or self.makes_previous_heavy()))
+                ((len(self.codes) > 1 and SOUNDS[self.codes[1]].consonant) or self.makes_previous_heavy()))
 
     def makes_previous_heavy(self) -> bool:
         """ first sound of the syllable is a double consonant letter """
-        return self.sounds[0].is_heavy_making()
+        return SOUNDS[self.codes[0]].heavy_making
 
     def get_vowel_location(self) -> int:
-        for idx, sound in enumerate(reversed(self.sounds)):
-            if sound.is_vowel() or sound.is_semivowel():
-                return len(self.sounds) - idx - 1
+        for idx in range(len(self.codes) - 1, -1, -1):
+            sound = SOUNDS[self.codes[idx]]
+            if sound.vowel or sound.semivowel:
+                return idx
         raise SyllableException(f"no vowel found in Syllable {self}")
 
     def get_vowel(self) -> Sound:
         """ get the vocalic sound from a syllable """
-        return self.sounds[self.get_vowel_location()]
+        return SOUNDS[self.codes[self.get_vowel_location()]]
 
     def is_heavy(self, next_syllable: Optional['Syllable'] = None) -> bool:
         """
@@ -165,15 +265,15 @@ class Syllable:
         """
         vowel = self.get_vowel()
         if next_syllable and isinstance(next_syllable, Syllable):
-            if next_syllable.sounds[0].is_h():
+            if SOUNDS[next_syllable.codes[0]].aspirate:
                 return self.ends_with_consonant_cluster() or self.ends_with_heavymaker()
             return ((self.ends_with_consonant() or next_syllable.makes_previous_heavy()) or
-                    (not self.is_light(next_syllable) and vowel.is_diphthong()))
-        return self.ends_with_consonant() or vowel.is_diphthong()
+                    (not self.is_light(next_syllable) and vowel.diphthong))
+        return self.ends_with_consonant() or vowel.diphthong
 
     def must_be_anceps(self, next_syllable: Optional['Syllable'] = None) -> bool:
         if next_syllable and isinstance(next_syllable, Syllable):
-            return self.ends_with_vowel() and self.get_vowel().is_diphthong() and next_syllable.starts_with_vowel()
+            return self.ends_with_vowel() and self.get_vowel().diphthong and next_syllable.starts_with_vowel()
         return False
 
     def is_light(self, next_syllable: Optional['Syllable'] = None) -> bool:
@@ -193,7 +293,7 @@ class Syllable:
         test_syllable = Syllable(self.sounds)
         test_syllable.sounds.append(sound)
         if test_syllable.is_valid():
-            self.sounds.append(sound)
+            self.codes += bytes([sound.code])
         else:
             raise SyllableException("syllable invalidated by last addition")
 
@@ -216,9 +316,7 @@ class Syllable:
         return Weight.ANCEPS
 
     def get_alternative_weight(self) -> Optional[Weight]:
-        if hasattr(self, "alternative_weight"):
-            return self.alternative_weight
-        return None
+        return self.alternative_weight
 
 
 class SyllableSplitter:
@@ -230,32 +328,67 @@ class SyllableSplitter:
         return SyllableSplitter.redistribute(sylls)
 
     @staticmethod
-    def join_into_syllables(sounds: list[Sound]) -> list[Syllable]:
+    def join_into_syllables(sounds: Sequence[Sound]) -> list[Syllable]:
         """
-        join a list of sounds into a preliminary syllable
-        keep adding sounds to the syllable until it becomes illegal, or the word ends.
-        at either point, save the syllable and start building a new syllable
+        join a list of sounds into preliminary syllables in a single pass
+        a syllable takes its leading consonants and its first vocalic sound,
+        and keeps the sounds after them for as long as it stays valid by the rules of Syllable.is_valid.
+        the state of the syllable decides whether the next sound fits, so no trial syllables are made,
+        except for a syllable that starts with GU: its validity depends on all of its sounds,
+        so they are added to it one by one, for as long as it stays valid.
+        the result is identical to that of the reference implementation in benchmarks/reference.py
         """
-        syllables = []
-        current_syllable = SyllableSplitter._first_sounds(sounds)
-        counter = len(current_syllable.sounds)
-        while counter < len(sounds):
-            try:
-                current_syllable.add_sound(sounds[counter])
-                counter += 1
-            except SyllableException:
-                syllables.append(current_syllable)
-                current_syllable = SyllableSplitter._first_sounds(sounds[counter:])
-                counter += len(current_syllable.sounds)
-        syllables.append(current_syllable)
+        syllables: list[Syllable] = []
+        start = 0
+        length = len(sounds)
+        while start < length:
+            if sounds[start].letters == 'gu':
+                syllable = SyllableSplitter._first_sounds(sounds[start:])
+                # validating the syllable may split GU into G and U: it is made of one sound more than it took
+                end = start + len(syllable.sounds)
+                while end < length:
+                    try:
+                        syllable.add_sound(sounds[end])
+                    except SyllableException:
+                        break
+                    end += 1
+                syllables.append(syllable)
+                start = end
+                continue
+            end = start
+            while end < length and sounds[end].consonant:
+                end += 1
+            if end == length:
+                raise SyllableException("invalid Syllable object")
+            first = sounds[end]
+            contains_vowel = first.vowel or end > start
+            contains_semivowel = first.semivowel
+            contains_final_consonant = False
+            end += 1
+            while end < length:
+                sound = sounds[end]
+                if sound.consonant:
+                    if sound.letters == 'gu':
+                        break
+                    contains_final_consonant = True
+                elif (contains_vowel or (contains_final_consonant and contains_semivowel) or
+                      (end == start + 1 and first.letters == sound.letters == 'i')):
+                    break
+                else:
+                    contains_vowel = True
+                end += 1
+            syllable = Syllable('')
+            syllable.sounds = sounds[start:end]
+            syllables.append(syllable)
+            start = end
         return syllables
 
     @staticmethod
-    def _first_sounds(sounds: list[Sound]) -> Syllable:
+    def _first_sounds(sounds: Sequence[Sound]) -> Syllable:
         result = []
         for sound in sounds:
             result.append(sound)
-            if not sound.is_consonant():
+            if not sound.consonant:
                 break
         return Syllable(result)
 
@@ -274,14 +407,14 @@ class SyllableSplitter:
             elif syllables[count].ends_with_consonant():
                 if (syllables[count + 1].sounds[0].letters == 'u' and len(syllables[count + 1].sounds) > 1 and
                         not syllables[count].ends_with_consonant_cluster() and
-                        not syllables[count + 1].sounds[1].is_consonant()):
+                        not syllables[count + 1].sounds[1].consonant):
                     if not syllables[count].sounds[-1].letters in ['r', 'l']:
                         SyllableSplitter.__switch_sound(syllables[count], syllables[count + 1], False)
                 elif syllables[count + 1].starts_with_vowel(False):
                     SyllableSplitter.__switch_sound(syllables[count], syllables[count + 1], False)
         local_sylls = []
         for syll in syllables:
-            if not syll.sounds:
+            if not syll.codes:
                 continue
             if syll.is_valid():
                 local_sylls.append(syll)
@@ -297,10 +430,8 @@ class SyllableSplitter:
         if toFirst is False, switch from the first to the second
         """
         if to_first:
-            given_sound = syllable2.sounds[0]
-            syllable2.sounds = syllable2.sounds[1:]
-            syllable1.sounds.append(given_sound)
+            syllable1.codes += syllable2.codes[:1]
+            syllable2.codes = syllable2.codes[1:]
         else:
-            given_sound = syllable1.sounds[-1]
-            syllable1.sounds = syllable1.sounds[:-1]
-            syllable2.sounds.insert(0, given_sound)
+            syllable2.codes = syllable1.codes[-1:] + syllable2.codes
+            syllable1.codes = syllable1.codes[:-1]
@@ -0,0 +1,75 @@
+""" a prefix tree, to find the longest key that a text starts with in a single walk over its letters """
+from typing import Generic, Iterator, Optional, TypeVar, cast
+
+V = TypeVar('V')
+
+
+class _Node(Generic[V]):
+    __slots__ = ('children', 'value', 'is_key')
+
+    def __init__(self) -> None:
+        self.children: dict[str, '_Node[V]'] = {}
+        self.value: Optional[V] = None
+        self.is_key = False
+
+
+class PrefixTrie(Generic[V]):
+    """
+    A mapping of (non-empty) keys to values, stored letter by letter in a tree of nodes
+    Looking up the longest key that a text starts with only walks once over the letters of the text.
+    """
+    def __init__(self) -> None:
+        self._root: _Node[V] = _Node()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __setitem__(self, key: str, value: V) -> None:
+        if not key:
+            raise ValueError("the key of a PrefixTrie cannot be empty")
+        node = self._root
+        for letter in key:
+            node = node.children.setdefault(letter, _Node())
+        if not node.is_key:
+            node.is_key = True
+            self._count += 1
+        node.value = value
+
+    def _find(self, key: str) -> Optional[_Node[V]]:
+        node: Optional[_Node[V]] = self._root
+        for letter in key:
+            if node is None:
+                break
+            node = node.children.get(letter)
+        return node if node is not None and node.is_key else None
+
+    def __getitem__(self, key: str) -> V:
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return cast(V, node.value)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        stack = [('', self._root)]
+        while stack:
+            prefix, node = stack.pop()
+            if node.is_key:
+                yield prefix
+            stack.extend((prefix + letter, child) for letter, child in node.children.items())
+
+    def longest_prefix(self, text: str) -> Optional[V]:
+        """ the value of the longest key that the text starts with, or None """
+        result = None
+        node = self._root
+        for letter in text:
+            child = node.children.get(letter)
+            if child is None:
+                break
+            node = child
+            if node.is_key:
+                result = node.value
+        return result
@@ -1,11 +1,91 @@
 ﻿""" processing unit for Words and lower entities """
-from typing import Optional
-from whitakers_words.parser import Parser
+import copy
+from threading import Lock
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
 from .bridge import Bridge, DummyBridge
 from .exceptions import SyllableException, WordException
-from .sound import SoundFactory
+from .sound import Sound, SoundFactory
 from .syllable import Syllable, SyllableSplitter, Weight
+from .utils.cache import LRUCache
+
+if TYPE_CHECKING:
+    from whitakers_words.parser import Parser
+
+_parser: Optional['Parser'] = None
+_parser_lock = Lock()
+
+
+def get_parser() -> 'Parser':
+    """
+    the Whitaker parser shared by all Words in this process
+    it is only constructed, and the dictionary loaded, when it is first needed
+    """
+    global _parser
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                from whitakers_words.parser import Parser
+                _parser = Parser(frequency="X")
+    return _parser
+
+
+def set_parser(parser: Optional['Parser']) -> None:
+    """ replace the shared Whitaker parser; None means a default parser is constructed on first use """
+    global _parser
+    with _parser_lock:
+        _parser = parser
+    whitaker_cache.clear()
+
+
+class WhitakerAnalysis(NamedTuple):
+    """ the part of a Whitaker parse that a Word needs; the full analysis is not kept """
+    enclitic: str
+    has_enclitic: bool
+
+    @classmethod
+    def from_parse(cls, text: str, parser: 'Parser') -> 'WhitakerAnalysis':
+        forms = parser.parse(text).forms
+        return cls(max([x.enclitic.text for x in forms if x.enclitic], key=len, default=''),
+                   any(x.enclitic for x in forms))
+
+
+# analyses by the shared parser, keyed by word form
+whitaker_cache: LRUCache[str, WhitakerAnalysis] = LRUCache(8192)
+
+
+def analyze_with_whitaker(text: str) -> WhitakerAnalysis:
+    """ get the Whitaker analysis of a word form from the shared parser, or from the cache if it has been seen """
+    analysis = whitaker_cache.get(text)
+    if analysis is None:
+        analysis = WhitakerAnalysis.from_parse(text, get_parser())
+        whitaker_cache.put(text, analysis)
+    return analysis
+
+
+class WordTemplate:
+    """
+    What is known about a word form before it comes into contact with other words:
+    its sounds, and its syllables after splitting and after analyzing their structure.
+    Words with the same form are cloned from the template instead of being split again.
+    The syllables are kept per answer of the bridge's dictionary, so that they follow any change in the bridge.
+    """
+    def __init__(self, text: str):
+        self.sounds = tuple(SoundFactory.find_sounds_for_text(text))
+        self.split: dict[tuple[str, ...], tuple[tuple[Sound, ...], tuple[Syllable, ...]]] = {}
+        self.analyzed: dict[tuple[str, ...], tuple[tuple[Sound, ...], tuple[Syllable, ...]]] = {}
+
+
+# templates of word forms, keyed by the text as it occurs in the verse
+word_cache: LRUCache[str, WordTemplate] = LRUCache(8192)
+
+
+def get_word_template(text: str) -> WordTemplate:
+    template = word_cache.get(text)
+    if template is None:
+        template = WordTemplate(text)
+        word_cache.put(text, template)
+    return template
 
 
 class Word:
@@ -13,15 +93,21 @@ class Word:
     A word is the representation of the Latin word
     It has extensive knowledge of its sounds, which it can join into syllables
     """
-    def __init__(self, text: str, parser: Parser = Parser(frequency="X")):
+    def __init__(self, text: str, parser: Optional['Parser'] = None):
         """ construct a Word by its contents """
         if not (isinstance(text, str) and text.isalpha()):
             raise WordException("Word not initialized with alphabetic data")
         # TODO determine if we need all these properties
         self.can_be_name = text.istitle()
-        self.whitaker = parser.parse(text)
+        if parser is None:
+            self.whitaker = analyze_with_whitaker(text)
+        else:
+            self.whitaker = WhitakerAnalysis.from_parse(text, parser)
+        self.form = text
         self.syllables: list[Syllable] = []
-        self.sounds = SoundFactory.find_sounds_for_text(text)
+        self.sounds = list(get_word_template(text).sounds)
+        # the answer of the bridge's dictionary when the word was split, None for a deviant word
+        self.dictionary_structures: Optional[list[str]] = None
         self.reconstruct_text()
         self.enclitic = self.put_enclitic()
 
@@ -42,6 +128,13 @@ class Word:
             return sum(len(syllable) for syllable in self.syllables)
         return sum(len(sound) for sound in self.sounds)
 
+    def copy(self) -> 'Word':
+        """ a copy of the word whose syllables can be modified independently, e.g. by scanning a verse """
+        result = copy.copy(self)
+        result.sounds = list(self.sounds)
+        result.syllables = [syllable.copy() for syllable in self.syllables]
+        return result
+
     def reconstruct_text(self) -> None:
         """
         find the sequence of sounds from the textual representation of the word
@@ -59,9 +152,18 @@ class Word:
     def split(self, bridge: Bridge = DummyBridge()) -> None:
         """
         splits a word into syllables by using a few static methods from the Syllable class
+        a word form that has been split before is cloned from its template instead
+        """
+        self._split(bridge, False)
+
+    def _split(self, bridge: Bridge, analyzed: bool) -> bool:
+        """
+        returns True if the syllables were cloned from a template whose structure has already been analyzed,
+        which can only happen when asked for explicitly
         """
         deviant_syllables = bridge.split_from_deviant_word(self.without_enclitic())
         if deviant_syllables:
+            self.dictionary_structures = None
             self.syllables = list(deviant_syllables)
             text = self.text[len(self):]
             if text:  # if only part of a word has been overruled by the bridge
@@ -69,15 +171,45 @@ class Word:
                 wrd.split()
                 self.syllables += wrd.syllables
             self.reconstruct_text()
-            return
+            return False
+        template = None
         if not self.syllables:
-            temporary_syllables = SyllableSplitter.join_into_syllables(self.sounds)
-            self.syllables = SyllableSplitter.redistribute(temporary_syllables)
-            self.check_consistency()
+            template = get_word_template(self.form)
+            if not template.split:
+                # a new word form is split before the dictionary is asked, so that a word that cannot be split fails
+                # with a SyllableException, whether the dictionary knows it or not
+                self.split_sounds()
+        stored_structures = bridge.use_dictionary(self.text)
+        self.dictionary_structures = stored_structures
+        if template and not self.syllables:
+            answer = tuple(stored_structures)
+            if analyzed and answer in template.analyzed:
+                self.restore(template.analyzed[answer])
+                return True
+            if answer in template.split:
+                self.restore(template.split[answer])
+                return False
+            self.split_sounds()
         if len(self.syllables) == 1 and len(self.text) == 1:
             self.syllables[0].weight = Weight.HEAVY
-        stored_structures = bridge.use_dictionary(self.text)
         self.assign_weights_from_dict(stored_structures)
+        if template:
+            template.split[tuple(stored_structures)] = self.snapshot()
+        return False
+
+    def split_sounds(self) -> None:
+        temporary_syllables = SyllableSplitter.join_into_syllables(self.sounds)
+        self.syllables = SyllableSplitter.redistribute(temporary_syllables)
+        self.check_consistency()
+
+    def snapshot(self) -> tuple[tuple[Sound, ...], tuple[Syllable, ...]]:
+        """ a copy of the sounds and syllables, for use in a WordTemplate """
+        return tuple(self.sounds), tuple(syllable.copy() for syllable in self.syllables)
+
+    def restore(self, snapshot: tuple[tuple[Sound, ...], tuple[Syllable, ...]]) -> None:
+        sounds, syllables = snapshot
+        self.sounds = list(sounds)
+        self.syllables = [syllable.copy() for syllable in syllables]
 
     def assign_weights_from_dict(self, stored_structures: list[str]) -> None:
         if len(stored_structures):
@@ -100,7 +232,7 @@ class Word:
 
     def ends_in_enclitic(self) -> bool:
         """ for now, use the longest enclitic that can be analyzed """
-        return any(x.enclitic for x in self.whitaker.forms)
+        return self.whitaker.has_enclitic
 
     def without_enclitic(self) -> str:
         """ for now, use the longest enclitic that can be analyzed """
@@ -110,7 +242,7 @@ class Word:
 
     def put_enclitic(self) -> str:
         """ for now, use the longest enclitic that can be analyzed """
-        return max([x.enclitic.text for x in self.whitaker.forms if x.enclitic], key=len, default='')
+        return self.whitaker.enclitic
 
     def may_be_heavy_by_position(self, next_word: 'Word') -> bool:
         return (self.syllables[-1].is_heavy() and
@@ -119,8 +251,11 @@ class Word:
 
     def analyze_structure(self, bridge: Bridge = DummyBridge()) -> None:
         """ Get the syllable structure, regardless of word contact """
+        cacheable = False
         if not self.syllables:
-            self.split(bridge)
+            if self._split(bridge, True):
+                return
+            cacheable = self.dictionary_structures is not None
         for count, syllable in enumerate(self.syllables[:-1]):
             syllable.weight = syllable.get_weight(self.syllables[count + 1])
         self.syllables[-1].weight = self.syllables[-1].get_weight()
@@ -128,6 +263,8 @@ class Word:
             for syllable in self.syllables[:-1]:
                 if syllable.weight == Weight.LIGHT:
                     syllable.weight = Weight.ANCEPS
+        if cacheable and self.dictionary_structures is not None:
+            get_word_template(self.form).analyzed[tuple(self.dictionary_structures)] = self.snapshot()
 
     def apply_word_contact(self, next_word: 'Word') -> Optional[Weight]:
         """ See if next word has any influence on the syllable structure """
@@ -165,7 +302,7 @@ class Word:
         else:
             # recheck to catch a-chi-u-is type errors
             for count, syllable in enumerate(self.syllables):
-                if (len(syllable.sounds) == 1 and syllable.sounds[0].is_semivowel() and
+                if (len(syllable.sounds) == 1 and syllable.sounds[0].semivowel and
                         count < len(self.syllables) - 1 and self.syllables[count + 1].starts_with_vowel()):
                     try:
                         syllable = Syllable(syllable.sounds + self.syllables[count + 1].sounds)
@@ -178,8 +315,8 @@ class Word:
         # try to maintain the morpheme boundary
         mainword = self.text.replace(proc, '', 1)
         snd = SoundFactory.create(mainword[0])
-        if (snd.is_consonant() or
-                (snd.is_semivowel() and len(mainword) > 1 and not SoundFactory.create(mainword[1]).is_consonant())):
+        if (snd.consonant or
+                (snd.semivowel and len(mainword) > 1 and not SoundFactory.create(mainword[1]).consonant)):
             wrd = Word(mainword)
             wrd.split()
             syl = Syllable(proc)
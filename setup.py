@@ -29,5 +29,6 @@ setup(
     version='0.1.0',
     # not on PyPI: install from a local checkout (see requirements.txt)
     # or from git+https://github.com/blagae/whitakers_words.git
-    install_requires=['whitakers_words']
+    install_requires=['whitakers_words'],
+    extras_require={'analytics': ['numpy']}
 )
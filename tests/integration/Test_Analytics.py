@@ -0,0 +1,108 @@
+import os
+import tempfile
+import unittest
+
+from elisio.parser.verse import Verse
+from elisio.parser.versefactory import VerseFactory, VerseType
+from elisio.parser.versestore import VerseStore
+from elisio.syllable import Weight
+
+try:
+    import numpy as np
+    from elisio.parser import analytics
+except ImportError:
+    np = None
+
+LINES = ["Arma virumque cano, Troiae qui primus ab oris",
+         "Italiam fato profugus Laviniaque venit",
+         "litora, multum ille et terris iactatus et alto",
+         "vi superum, saevae memorem Iunonis ob iram,",
+         "Sunt lacrimae rerum et mentem mortalia tangunt",
+         "Vivamus, mea Lesbia, atque amemus,",
+         "Quid tibi vis, mulier nigris dignissima barris?",
+         "Iam nox, iam tenebrae; Musa, recede mihi"]
+
+
+def get_ictus(verse):
+    """ the syllables of a verse that bear the ictus, counted one by one """
+    syllables = [syllable for word in verse.words for syllable in word.syllables]
+    counted = [count for count, syllable in enumerate(syllables) if syllable.weight != Weight.NONE]
+    result = []
+    start = 0
+    for foot in verse.feet:
+        result.append(counted[start])
+        start += len(foot)
+    return result
+
+
+@unittest.skipUnless(np, "the analytics need NumPy")
+class TestAnalytics(unittest.TestCase):
+    """ testing the corpus-wide analytics against the methods of every verse """
+
+    @classmethod
+    def setUpClass(cls):
+        results = VerseFactory.create_many(LINES, creators=VerseType.UNKNOWN, workers=1)
+        cls.verses = [result for result in results if isinstance(result, Verse)]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(self.directory.name, "verses.bin")
+        VerseStore.write(path, self.verses)
+        self.store = VerseStore(path)
+        self.columns = analytics.Columns.of(self.store)
+
+    def tearDown(self):
+        # the arrays must not hold the columns of the store when it is closed
+        del self.columns
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_analytics_scanned(self):
+        self.assertGreater(len(self.verses), 5)
+
+    def test_analytics_accents(self):
+        stressed = analytics.get_accents(self.columns.weights, self.columns.word_syllable_start)
+        expected = [syllable.stressed for verse in self.verses for word in verse.words for syllable in word.syllables]
+        self.assertEqual(stressed.tolist(), expected)
+
+    def test_analytics_zeleny(self):
+        scores, offsets = analytics.get_zeleny_scores(self.columns.weights, self.columns.stressed,
+                                                      self.columns.verse_syllable_start)
+        self.assertEqual(analytics.to_lists(scores, offsets), [verse.get_zeleny_score() for verse in self.verses])
+
+    def test_analytics_zeleny_words(self):
+        # as in the loop of Verse.get_zeleny_score: a verse without syllables has a score of 0,
+        # and a stressed elided syllable closes a score that is followed by an empty one
+        weights = np.array([Weight.HEAVY.value, Weight.LIGHT.value, Weight.NONE.value, Weight.HEAVY.value])
+        stressed = np.array([True, False, True, True])
+        scores, offsets = analytics.get_zeleny_scores(weights, stressed, [0, 0, 3, 4])
+        self.assertEqual(analytics.to_lists(scores, offsets), [[0], [3, 0], [2]])
+
+    def test_analytics_ictus(self):
+        ictus = analytics.get_ictus(self.columns.weights, self.columns.feet,
+                                    self.columns.verse_syllable_start, self.columns.verse_foot_start)
+        expected = []
+        start = 0
+        for verse in self.verses:
+            expected += [start + count for count in get_ictus(verse)]
+            start += sum(len(word.syllables) for word in verse.words)
+        self.assertEqual(ictus.tolist(), expected)
+
+    def test_analytics_clashes(self):
+        ictus = analytics.get_ictus(self.columns.weights, self.columns.feet,
+                                    self.columns.verse_syllable_start, self.columns.verse_foot_start)
+        coincidences, totals = analytics.get_clashes(self.columns.stressed, ictus, self.columns.verse_foot_start)
+        expected_coincidences = [0] * len(totals)
+        expected_totals = [0] * len(totals)
+        for verse in self.verses:
+            syllables = [syllable for word in verse.words for syllable in word.syllables]
+            for position, count in enumerate(get_ictus(verse)):
+                expected_totals[position] += 1
+                expected_coincidences[position] += syllables[count].stressed
+        self.assertEqual(coincidences.tolist(), expected_coincidences)
+        self.assertEqual(totals.tolist(), expected_totals)
+
+    def test_analytics_unscanned(self):
+        with self.assertRaises(ValueError):
+            analytics.get_ictus(self.columns.weights, np.zeros(len(self.columns.feet), dtype=np.int64),
+                                self.columns.verse_syllable_start, self.columns.verse_foot_start)
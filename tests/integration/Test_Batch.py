@@ -0,0 +1,100 @@
+import io
+import pickle
+import unittest
+
+from elisio.bridge import DummyBridge
+from elisio.parser.hexameter import Hexameter
+from elisio.parser.pentameter import Pentameter
+from elisio.parser.verse import Foot, Reason
+from elisio.parser.versefactory import (VerseFactory, VerseFailure, VerseForm,
+                                        VerseType, scan_stream)
+
+LINES = ["Arma virumque cano, Troiae qui primus ab oris",
+         "tres sumus",
+         "litora, multum ille et terris iactatus et alto"]
+
+
+class CountingBridge(DummyBridge):
+    def __init__(self):
+        self.batches = []
+        self.lookups = 0
+
+    def use_dictionary(self, word):
+        self.lookups += 1
+        return []
+
+    def use_dictionary_many(self, words):
+        self.batches.append(list(words))
+        return {word: [] for word in self.batches[-1]}
+
+
+class TestBatch(unittest.TestCase):
+    """ testing the batch scanning of many verses at once """
+
+    def check_results(self, results):
+        self.assertEqual(len(results), 3)
+        self.assertTrue(isinstance(results[0], Hexameter))
+        self.assertEqual(results[0].feet, [Foot.DACTYLUS, Foot.DACTYLUS, Foot.SPONDAEUS,
+                                           Foot.SPONDAEUS, Foot.DACTYLUS, Foot.SPONDAEUS])
+        self.assertTrue(isinstance(results[1], VerseFailure))
+        self.assertEqual(results[1].index, 1)
+        self.assertEqual(results[1].text, LINES[1])
+        self.assertEqual(results[1].reason, Reason.SYLLABLE_COUNT)
+        self.assertEqual(results[1].creator, "get_hexa_subtype")
+        self.assertTrue(isinstance(results[2], Hexameter))
+        self.assertEqual(results[2].text, LINES[2])
+
+    def test_batch_in_process(self):
+        self.check_results(VerseFactory.create_many(LINES, creators=VerseType.HEXAMETER, workers=1))
+
+    def test_batch_process_pool(self):
+        self.check_results(VerseFactory.create_many(LINES, creators=VerseType.HEXAMETER, workers=2, chunksize=1))
+
+    def test_stream_hexametric(self):
+        results = list(scan_stream(io.StringIO("\n".join(LINES))))
+        self.check_results(results)
+
+    def test_stream_elegiac(self):
+        text = "Arma virumque cano, Troiae qui primus ab oris\n\ntres sumus; hoc illi praetulit auctor opus\n"
+        results = scan_stream(io.StringIO(text), VerseForm.ELEGIAC_DISTICHON)
+        self.assertTrue(isinstance(next(results), Hexameter))
+        self.assertTrue(isinstance(next(results), Pentameter))
+        with self.assertRaises(StopIteration):
+            next(results)
+
+    def test_batch_prefetch(self):
+        bridge = CountingBridge()
+        self.check_results(VerseFactory.create_many(LINES, bridge, VerseType.HEXAMETER, workers=1))
+        self.assertEqual(len(bridge.batches), 1)
+        self.assertEqual(sorted(bridge.batches[0]), sorted(set(bridge.batches[0])))
+        self.assertIn('arma', bridge.batches[0])
+        self.assertEqual(bridge.lookups, 0)
+
+    def test_batch_failure_record(self):
+        """ a failure keeps a fixed number of plain values, however many candidates failed """
+        line = "necdum etiam causae irarum saevique dolores"
+        failure = VerseFactory.create_many([line], creators=VerseType.PENTAMETER, workers=1)[0]
+        self.assertIsInstance(failure, VerseFailure)
+        self.assertFalse(hasattr(failure, '__dict__'))
+        self.assertGreater(failure.candidates, 1)
+        self.assertEqual(failure.creator, "get_penta_subtype")
+        self.assertTrue(set(failure.weights) <= set("-ux"))
+        copied = pickle.loads(pickle.dumps(failure))
+        self.assertEqual((copied.index, copied.text, copied.reason, copied.message, copied.weights),
+                         (failure.index, failure.text, failure.reason, failure.message, failure.weights))
+
+    def test_batch_failure_analysis(self):
+        failure = VerseFactory.create_many(["c"], creators=VerseType.HEXAMETER, workers=1)[0]
+        self.assertIsInstance(failure, VerseFailure)
+        self.assertEqual(failure.reason, Reason.ANALYSIS)
+        self.assertEqual(failure.candidates, 0)
+
+    def test_batch_unsplittable(self):
+        """ a line with a letter that is not Latin does not abort the batch """
+        lines = ["Arma virumque cano, Troiae qui primus ab oris", "William was here"]
+        for workers in (1, 2):
+            results = VerseFactory.create_many(lines, creators=VerseType.HEXAMETER, workers=workers)
+            self.assertIsInstance(results[0], Hexameter)
+            self.assertIsInstance(results[1], VerseFailure)
+            self.assertEqual((results[1].index, results[1].reason), (1, Reason.ANALYSIS))
+            self.assertTrue(results[1].message.startswith("SoundException"))
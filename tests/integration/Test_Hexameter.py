@@ -27,6 +27,13 @@ class TestHexameter(unittest.TestCase):
         verse = construct_hexameter()
         self.assertEqual(verse.feet, expected_feet)
 
+    def test_hexameter_scan_table(self):
+        """ the precompiled table must agree with the rules on Aen. 1, 1 """
+        verse = VerseFactory.create("Arma virumque cano, Troiae qui primus ab oris",
+                                    creators=VerseType.TABULAR_HEXAMETER)
+        self.assertTrue(isinstance(verse, Hexameter))
+        self.assertEqual(verse.feet, construct_hexameter().feet)
+
     def test_hexameter_scan_diaeresis(self):
         expected_feet = [Foot.SPONDAEUS, Foot.DACTYLUS,
                          Foot.SPONDAEUS, Foot.SPONDAEUS,
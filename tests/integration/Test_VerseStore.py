@@ -0,0 +1,85 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from elisio.parser.verse import Foot
+from elisio.parser.versefactory import VerseFactory, VerseType
+from elisio.parser.versestore import NO_WEIGHT, VerseStore
+from elisio.syllable import Weight
+
+LINES = ["Arma virumque cano, Troiae qui primus ab oris",
+         "litora, multum ille et terris iactatus et alto"]
+
+
+class TestVerseStore(unittest.TestCase):
+    """ testing the columnar file of scanned verses """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.verses = [VerseFactory.create(line, creators=VerseType.HEXAMETER) for line in LINES]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "verses.bin")
+        self.assertEqual(VerseStore.write(self.path, self.verses, [17, 42]), 2)
+        self.store = VerseStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_store_verses(self):
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(list(self.store.verse_ids), [17, 42])
+        for index, verse in enumerate(self.verses):
+            self.assertEqual(self.store.structure(index), verse.structure())
+            self.assertEqual(self.store.get_zeleny_score(index), verse.get_zeleny_score())
+            weights = [syllable.weight for word in verse.words for syllable in word.syllables]
+            self.assertEqual(self.store.get_weights(index), weights)
+
+    def test_store_syllables(self):
+        syllables = [syllable for verse in self.verses for word in verse.words for syllable in word.syllables]
+        self.assertEqual(len(self.store.weights), len(syllables))
+        self.assertEqual([self.store.syllable_text(index) for index in range(4)], ['ar', 'ma', 'ui', 'rum'])
+        self.assertEqual(list(self.store.stressed[:4]), [1, 0, 0, 1])
+        self.assertEqual(list(self.store.syllable_words[:4]), [0, 0, 1, 1])
+        self.assertEqual(self.store.syllable_verses[len(syllables) - 1], 1)
+        self.assertEqual(self.store.syllables(1).stop, len(syllables))
+        self.assertEqual(len(self.store.word_syllable_start), sum(len(verse.words) for verse in self.verses) + 1)
+
+    def test_store_feet(self):
+        # litora, multum ille: the last syllable of multum is elided and has no foot
+        first = self.store.syllables(1).start
+        feet = list(self.store.syllable_feet[first:first + 6])
+        self.assertEqual(feet, [Foot.DACTYLUS.value] * 3 + [Foot.SPONDAEUS.value, 0, Foot.SPONDAEUS.value])
+        self.assertEqual(self.store.weights[first + 4], Weight.NONE.value)
+        self.assertEqual(list(self.store.feet[:6]), [foot.value for foot in self.verses[0].feet])
+
+    def test_store_empty(self):
+        path = os.path.join(self.directory.name, "empty.bin")
+        self.assertEqual(VerseStore.write(path, []), 0)
+        with VerseStore(path) as store:
+            self.assertEqual(len(store), 0)
+            self.assertEqual(len(store.text), 0)
+
+    def test_store_unscanned(self):
+        path = os.path.join(self.directory.name, "unscanned.bin")
+        verse = VerseFactory.create(LINES[0], creators=VerseType.HEXAMETER)
+        verse.words[0].syllables[0].weight = None
+        VerseStore.write(path, [verse])
+        with VerseStore(path) as store:
+            self.assertEqual(store.weights[0], NO_WEIGHT)
+            self.assertIsNone(store.get_weights(0)[0])
+
+    def test_store_invalid(self):
+        path = os.path.join(self.directory.name, "invalid.bin")
+        with open(path, 'wb') as file:
+            file.write(b'EVST')
+        with self.assertRaises(ValueError):
+            VerseStore(path)
+
+    def test_store_pickle(self):
+        copied = pickle.loads(pickle.dumps(self.store))
+        self.assertEqual(copied.structure(0), self.verses[0].structure())
+        copied.close()
@@ -0,0 +1,113 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from elisio.bridge import (AsyncBridge, LocalDictionaryBridge, PrefetchedBridge,
+                           SqliteBridge, ThreadedAsyncBridge)
+from elisio.exceptions import VerseException
+from elisio.parser.verse import Reason
+from elisio.parser.versefactory import VerseFactory, VerseFailure, VerseType
+from elisio.syllable import Syllable
+from elisio.word import Word
+
+TYPICAL_VERSE = "Arma virumque cano, Troiae qui primus ab oris"
+SECOND_VERSE = "Italiam fato profugus Laviniaque venit"
+
+
+class SlowBridge(AsyncBridge):
+    """ answers after a while, and remembers how many lookups were waiting at the same time """
+    def __init__(self, dictionary):
+        self.dictionary = dictionary
+        self.waiting = 0
+        self.most_waiting = 0
+        self.lookups = []
+        self.dumped = []
+
+    async def _wait(self):
+        self.waiting += 1
+        self.most_waiting = max(self.most_waiting, self.waiting)
+        await asyncio.sleep(0.001)
+        self.waiting -= 1
+
+    async def split_from_deviant_word(self, lexeme):
+        await self._wait()
+        return [Syllable("a"), Syllable("mat")] if lexeme == "amat" else []
+
+    async def use_dictionary(self, word):
+        await self._wait()
+        self.lookups.append(word)
+        return self.dictionary.get(word, [])
+
+    def make_entry(self, txt, struct, db_id):
+        return txt, struct
+
+    async def dump(self, entries):
+        await self._wait()
+        self.dumped += entries
+
+
+class TestAsyncBridge(unittest.TestCase):
+
+    def test_async_create(self):
+        bridge = SlowBridge({'arma': ['23']})
+        verse = asyncio.run(VerseFactory.create_async(TYPICAL_VERSE, 0, bridge, [VerseType.HEXAMETER]))
+        dictionary = {word.text: [] for word in VerseFactory.split(TYPICAL_VERSE)}
+        dictionary['arma'] = ['23']
+        expected = VerseFactory.create(TYPICAL_VERSE, 0, LocalDictionaryBridge(dictionary), [VerseType.HEXAMETER])
+        self.assertEqual(verse.structure(), expected.structure())
+        self.assertEqual(sorted(bridge.lookups), sorted(word.text for word in VerseFactory.split(TYPICAL_VERSE)))
+        self.assertGreater(bridge.most_waiting, 8)
+        self.assertEqual(bridge.dumped, [])
+
+    def test_async_save(self):
+        bridge = SlowBridge({})
+        asyncio.run(VerseFactory.create_async(TYPICAL_VERSE, 1, bridge, [VerseType.HEXAMETER]))
+        self.assertEqual(len(bridge.dumped), 8)
+        self.assertEqual(bridge.dumped[0], ('arma', '23'))
+
+    def test_async_failure(self):
+        with self.assertRaises(VerseException):
+            asyncio.run(VerseFactory.create_async("arma", 0, SlowBridge({}), [VerseType.HEXAMETER]))
+
+    def test_async_deviant(self):
+        bridge = SlowBridge({})
+        verse = asyncio.run(VerseFactory.create_many_async(["amat"], bridge, [VerseType.HEXAMETER]))[0]
+        self.assertIsInstance(verse, VerseFailure)
+        word = Word("amat")
+        word.split(PrefetchedBridge({}, {'amat': [Syllable("a"), Syllable("mat")]}))
+        self.assertEqual(word.syllables, [Syllable("a"), Syllable("mat")])
+
+    def test_async_many(self):
+        bridge = SlowBridge({})
+        lines = [TYPICAL_VERSE, "arma", SECOND_VERSE, TYPICAL_VERSE]
+        results = asyncio.run(VerseFactory.create_many_async(lines, bridge, VerseType.HEXAMETER))
+        self.assertEqual([result.text for result in results], lines)
+        self.assertIsInstance(results[1], VerseFailure)
+        self.assertEqual(results[1].index, 1)
+        self.assertEqual(results[3].structure(), results[0].structure())
+        # every distinct word is looked up once for the whole batch
+        self.assertEqual(len(bridge.lookups), len(set(bridge.lookups)))
+
+    def test_async_many_unsplittable(self):
+        """ a line with a letter that is not Latin fails on its own, and its words are not looked up """
+        bridge = SlowBridge({})
+        results = asyncio.run(VerseFactory.create_many_async([TYPICAL_VERSE, "William was here"], bridge,
+                                                             VerseType.HEXAMETER))
+        self.assertNotIsInstance(results[0], VerseFailure)
+        self.assertIsInstance(results[1], VerseFailure)
+        self.assertEqual(results[1].reason, Reason.ANALYSIS)
+        self.assertNotIn("here", bridge.lookups)
+
+    def test_async_threaded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            sqlite = SqliteBridge(os.path.join(directory, "elisio.sqlite3"))
+            bridge = ThreadedAsyncBridge(sqlite)
+
+            async def scan_twice():
+                await VerseFactory.create_async(TYPICAL_VERSE, 1, bridge, [VerseType.HEXAMETER])
+                await bridge.flush()
+                return await bridge.use_dictionary("arma")
+
+            self.assertEqual(asyncio.run(scan_twice()), ['23'])
+            asyncio.run(bridge.close())
@@ -1,6 +1,6 @@
 import unittest
 
-from elisio.bridge import Bridge
+from elisio.bridge import Bridge, DeviantIndexBridge, DummyBridge
 from elisio.exceptions import SyllableException
 from elisio.syllable import Syllable
 from elisio.word import Word
@@ -29,3 +29,42 @@ class TestBridgeDeviant(unittest.TestCase):
         word = Word("amatss")
         with self.assertRaises(SyllableException):
             word.split(LocalDeviantBridge())
+
+
+class CountingDeviantBridge(DummyBridge):
+    def __init__(self):
+        self.loaded = 0
+        self.asked = 0
+
+    def split_from_deviant_word(self, lexeme):
+        self.asked += 1
+        return []
+
+    def deviant_words(self):
+        self.loaded += 1
+        return {"amat": [Syllable("a"), Syllable("mat")], "a": [Syllable("a")]}
+
+
+class TestBridgeDeviantIndex(unittest.TestCase):
+
+    def test_bridge_index_loaded_once(self):
+        inner = CountingDeviantBridge()
+        bridge = DeviantIndexBridge(inner)
+        for text in ["amaturus", "amat", "arma", "cano"]:
+            Word(text).split(bridge)
+        self.assertEqual(inner.loaded, 1)
+        self.assertEqual(inner.asked, 0)
+
+    def test_bridge_index_longest(self):
+        bridge = DeviantIndexBridge(CountingDeviantBridge())
+        word = Word("amaturus")
+        word.split(bridge)
+        self.assertEqual(word.syllables, deviant_result + [Syllable("u"), Syllable("rus")])
+        self.assertEqual(bridge.split_from_deviant_word("amo"), [Syllable("a")])
+        self.assertEqual(bridge.split_from_deviant_word("cano"), [])
+        self.assertEqual(sorted(bridge.deviant_words()), ["a", "amat"])
+
+    def test_bridge_index_copies(self):
+        bridge = DeviantIndexBridge(CountingDeviantBridge())
+        bridge.split_from_deviant_word("amat")[0].weight = "changed"
+        self.assertIsNone(bridge.split_from_deviant_word("amat")[0].weight)
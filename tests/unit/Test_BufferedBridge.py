@@ -0,0 +1,115 @@
+import os
+import tempfile
+import time
+import unittest
+from threading import Event, Thread
+
+from elisio.bridge import BufferedBridge, DummyBridge, SqliteBridge
+from elisio.parser.versefactory import VerseFactory, VerseType
+
+
+class RecordingBridge(DummyBridge):
+    def __init__(self):
+        self.batches = []
+        self.flushed = 0
+        self.closed = False
+        self.release = Event()
+        self.release.set()
+
+    def make_entry(self, txt, struct, db_id):
+        return txt
+
+    def dump(self, entries):
+        self.release.wait()
+        if "error" in entries:
+            raise RuntimeError("cannot write")
+        self.batches.append(list(entries))
+
+    def flush(self):
+        self.flushed += 1
+
+    def close(self):
+        self.closed = True
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return condition()
+
+
+class TestBufferedBridge(unittest.TestCase):
+
+    def setUp(self):
+        self.inner = RecordingBridge()
+
+    def test_buffered_batch_size(self):
+        with BufferedBridge(self.inner, batch_size=3, interval=60) as bridge:
+            bridge.dump(["arma", "virum"])
+            time.sleep(0.01)
+            self.assertEqual(self.inner.batches, [])
+            bridge.dump(["cano", "troiae"])
+            self.assertTrue(wait_for(lambda: self.inner.batches))
+            self.assertEqual(self.inner.batches, [["arma", "virum", "cano"]])
+        self.assertEqual(self.inner.batches, [["arma", "virum", "cano"], ["troiae"]])
+        self.assertTrue(self.inner.closed)
+
+    def test_buffered_interval(self):
+        with BufferedBridge(self.inner, batch_size=100, interval=0.01) as bridge:
+            bridge.dump(["arma"])
+            self.assertTrue(wait_for(lambda: self.inner.batches))
+            self.assertEqual(self.inner.batches, [["arma"]])
+
+    def test_buffered_flush(self):
+        bridge = BufferedBridge(self.inner, batch_size=100, interval=60)
+        bridge.dump(["arma", "virum"])
+        bridge.flush()
+        self.assertEqual(self.inner.batches, [["arma", "virum"]])
+        self.assertEqual(self.inner.flushed, 1)
+        bridge.flush()
+        self.assertEqual(len(self.inner.batches), 1)
+        bridge.close()
+        bridge.close()
+        with self.assertRaises(ValueError):
+            bridge.dump(["cano"])
+
+    def test_buffered_flush_closed(self):
+        with BufferedBridge(self.inner, batch_size=100, interval=60) as bridge:
+            bridge.dump(["arma"])
+        flusher = Thread(target=bridge.flush, daemon=True)
+        flusher.start()
+        flusher.join(5)
+        self.assertFalse(flusher.is_alive())
+        self.assertEqual(self.inner.batches, [["arma"]])
+
+    def test_buffered_backpressure(self):
+        self.inner.release.clear()
+        bridge = BufferedBridge(self.inner, batch_size=1, maxsize=2)
+        writer = Thread(target=bridge.dump, args=(["arma", "virum", "cano", "troiae", "qui"],))
+        writer.start()
+        writer.join(0.05)
+        self.assertTrue(writer.is_alive())
+        self.inner.release.set()
+        writer.join(5)
+        self.assertFalse(writer.is_alive())
+        bridge.close()
+        self.assertEqual(self.inner.batches, [["arma"], ["virum"], ["cano"], ["troiae"], ["qui"]])
+
+    def test_buffered_error(self):
+        bridge = BufferedBridge(self.inner, batch_size=100, interval=60)
+        bridge.dump(["error"])
+        with self.assertRaises(RuntimeError):
+            bridge.flush()
+        bridge.dump(["arma"])
+        bridge.close()
+        self.assertEqual(self.inner.batches, [["arma"]])
+
+    def test_buffered_sqlite(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "elisio.sqlite3")
+            with BufferedBridge(SqliteBridge(path)) as bridge:
+                VerseFactory.create("Arma virumque cano, Troiae qui primus ab oris", 1, bridge,
+                                    [VerseType.HEXAMETER])
+            with SqliteBridge(path) as bridge:
+                self.assertEqual(bridge.use_dictionary("arma"), ["23"])
@@ -0,0 +1,41 @@
+import unittest
+
+from elisio.utils.cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_cache_hit_and_miss(self):
+        cache = LRUCache(2)
+        self.assertIsNone(cache.get('et'))
+        cache.put('et', 1)
+        self.assertEqual(cache.get('et'), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_ratio(), 0.5)
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put('et', 1)
+        cache.put('in', 2)
+        cache.get('et')
+        cache.put('ille', 3)
+        self.assertIn('et', cache)
+        self.assertNotIn('in', cache)
+        self.assertIn('ille', cache)
+
+    def test_cache_resize_and_clear(self):
+        cache = LRUCache(3)
+        for count, key in enumerate(['et', 'in', 'ille']):
+            cache.put(key, count)
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertIn('ille', cache)
+        cache.get('ille')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_cache_disabled(self):
+        cache = LRUCache(0)
+        cache.put('et', 1)
+        self.assertIsNone(cache.get('et'))
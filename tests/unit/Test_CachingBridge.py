@@ -0,0 +1,115 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from elisio.bridge import (BufferedBridge, CachingBridge, DummyBridge,
+                           LocalDictionaryBridge, SqliteBridge)
+from elisio.syllable import Syllable
+from elisio.word import Word
+
+
+class CountingBridge(LocalDictionaryBridge):
+    def __init__(self, cache):
+        super().__init__(cache)
+        self.lookups = 0
+        self.deviant_lookups = 0
+        self.dumped = []
+
+    def split_from_deviant_word(self, lexeme):
+        self.deviant_lookups += 1
+        if lexeme == "amat":
+            return [Syllable("a"), Syllable("mat")]
+        return []
+
+    def use_dictionary(self, word):
+        self.lookups += 1
+        return super().use_dictionary(word)
+
+    def make_entry(self, txt, struct, db_id):
+        return {'word': txt, 'struct': struct}
+
+    def dump(self, entries):
+        self.dumped += entries
+        for entry in entries:
+            self.cache[entry['word']] = [entry['struct']]
+
+
+class TestCachingBridge(unittest.TestCase):
+
+    def setUp(self):
+        self.inner = CountingBridge({'arma': ['23'], 'cano': []})
+        self.bridge = CachingBridge(self.inner)
+
+    def test_caching_dictionary(self):
+        for _ in range(3):
+            self.assertEqual(self.bridge.use_dictionary("arma"), ['23'])
+            self.assertEqual(self.bridge.use_dictionary("cano"), [])
+        self.assertEqual(self.inner.lookups, 2)
+        self.assertEqual(self.bridge.dictionary_cache.hits, 4)
+
+    def test_caching_dictionary_many(self):
+        self.bridge.use_dictionary("arma")
+        self.assertEqual(self.bridge.use_dictionary_many(["arma", "cano", "cano"]), {'arma': ['23'], 'cano': []})
+        self.assertEqual(self.inner.lookups, 2)
+        self.assertEqual(self.bridge.use_dictionary("cano"), [])
+        self.assertEqual(self.inner.lookups, 2)
+
+    def test_caching_exception(self):
+        with self.assertRaises(KeyError):
+            self.bridge.use_dictionary("virum")
+        with self.assertRaises(KeyError):
+            self.bridge.use_dictionary("virum")
+        self.assertEqual(self.inner.lookups, 2)
+
+    def test_caching_deviant(self):
+        for _ in range(2):
+            word = Word("amat")
+            word.analyze_structure(self.bridge)
+            self.assertEqual(word.syllables, [Syllable("a"), Syllable("mat")])
+        self.assertEqual(self.inner.deviant_lookups, 1)
+        # the cached syllables are not modified by the words that use them
+        self.assertEqual([syll.weight for syll in self.bridge.split_from_deviant_word("amat")], [None, None])
+        self.assertEqual(self.bridge.split_from_deviant_word("arma"), [])
+        self.bridge.split_from_deviant_word("arma")
+        self.assertEqual(self.inner.deviant_lookups, 2)
+
+    def test_caching_dump(self):
+        self.bridge.use_dictionary("arma")
+        self.bridge.use_dictionary("cano")
+        self.bridge.dump([self.bridge.make_entry("cano", "13", 1)])
+        self.assertEqual(self.inner.dumped, [{'word': 'cano', 'struct': '13'}])
+        self.assertEqual(self.bridge.use_dictionary("cano"), ['13'])
+        self.assertEqual(self.bridge.use_dictionary("arma"), ['23'])
+        self.assertEqual(self.inner.lookups, 3)
+
+    def test_caching_pending_dump(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "elisio.sqlite3")
+            bridge = CachingBridge(BufferedBridge(SqliteBridge(path), interval=60))
+            bridge.dump([bridge.make_entry("arma", "23", 1)])
+            # the entry may still be waiting: the answer is not remembered
+            bridge.use_dictionary("arma")
+            bridge.use_dictionary_many(["arma"])
+            bridge.flush()
+            self.assertEqual(bridge.use_dictionary("arma"), ['23'])
+            self.assertEqual(bridge.use_dictionary_many(["arma"]), {'arma': ['23']})
+            bridge.close()
+
+    def test_caching_hit_ratio(self):
+        self.assertEqual(self.bridge.hit_ratio(), 0.0)
+        self.bridge.use_dictionary("arma")
+        self.bridge.use_dictionary("arma")
+        self.bridge.split_from_deviant_word("arma")
+        self.bridge.split_from_deviant_word("arma")
+        self.assertEqual(self.bridge.hit_ratio(), 0.5)
+        self.bridge.clear()
+        self.assertEqual(len(self.bridge.dictionary_cache), 0)
+
+    def test_caching_pickle(self):
+        bridge = CachingBridge(DummyBridge(), 16)
+        bridge.use_dictionary("arma")
+        copied = pickle.loads(pickle.dumps(bridge))
+        self.assertEqual(len(copied.dictionary_cache), 0)
+        self.assertEqual(copied.dictionary_cache.maxsize, 16)
+        self.assertEqual(copied.use_dictionary("arma"), [])
@@ -0,0 +1,83 @@
+import subprocess
+import sys
+import unittest
+
+import elisio
+from elisio import word as word_module
+from elisio.word import Word, get_parser, whitaker_cache
+
+
+class Enclitic:
+    def __init__(self, text):
+        self.text = text
+
+
+class Form:
+    def __init__(self, enclitic=None):
+        self.enclitic = Enclitic(enclitic) if enclitic else None
+
+
+class Analysis:
+    def __init__(self, text):
+        self.forms = [Form(), Form('que')] if text.endswith('que') else [Form()]
+
+
+class CountingParser:
+    def __init__(self):
+        self.calls = 0
+
+    def parse(self, text):
+        self.calls += 1
+        return Analysis(text)
+
+
+class TestConfigure(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = word_module._parser
+
+    def tearDown(self):
+        word_module.set_parser(self.previous)
+        elisio.configure(whitaker_cache_size=8192)
+
+    def test_configure_parser(self):
+        parser = CountingParser()
+        elisio.configure(parser=parser)
+        self.assertIs(get_parser(), parser)
+        Word("arma")
+        Word("virum")
+        self.assertEqual(parser.calls, 2)
+
+    def test_configure_explicit_parser(self):
+        shared = CountingParser()
+        explicit = CountingParser()
+        elisio.configure(parser=shared)
+        Word("arma", explicit)
+        self.assertEqual(shared.calls, 0)
+        self.assertEqual(explicit.calls, 1)
+
+    def test_whitaker_cache(self):
+        parser = CountingParser()
+        elisio.configure(parser=parser)
+        for _ in range(3):
+            word = Word("virumque")
+        self.assertEqual(parser.calls, 1)
+        self.assertEqual(whitaker_cache.hits, 2)
+        self.assertEqual(whitaker_cache.misses, 1)
+        self.assertEqual(word.enclitic, 'que')
+        self.assertTrue(word.ends_in_enclitic())
+        whitaker_cache.clear()
+        Word("virumque")
+        self.assertEqual(parser.calls, 2)
+
+    def test_whitaker_cache_disabled(self):
+        parser = CountingParser()
+        elisio.configure(parser=parser, whitaker_cache_size=0)
+        Word("arma")
+        Word("arma")
+        self.assertEqual(parser.calls, 2)
+
+    def test_import_is_lazy(self):
+        code = "import sys, elisio.parser.versefactory; print('whitakers_words' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), "False")
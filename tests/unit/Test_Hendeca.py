@@ -1,7 +1,7 @@
 import unittest
 from copy import deepcopy
 
-from elisio.exceptions import VerseCreatorException
+from elisio.exceptions import VerseCreatorException, VerseSubtypeException
 from elisio.parser.hendeca import (AlcaicHendeca, HendecaException,
                                    PhalaecianHendeca, SapphicHendeca,
                                    get_hendeca_subtype)
@@ -274,7 +274,7 @@ class TestHendecaCreator(unittest.TestCase):
     def test_hen_create_ambiguous_fail(self):
         sylls = [Weight.ANCEPS] * 11
         sylls[4] = Weight.HEAVY
-        with self.assertRaises(VerseCreatorException):
+        with self.assertRaises(VerseSubtypeException):
             get_hendeca_subtype(sylls)
 
     def test_hen_create_conflicting_fail(self):
@@ -282,7 +282,7 @@ class TestHendecaCreator(unittest.TestCase):
         sylls[2] = Weight.HEAVY
         sylls[3] = Weight.HEAVY
         sylls[5] = Weight.HEAVY
-        with self.assertRaises(VerseCreatorException):
+        with self.assertRaises(VerseSubtypeException):
             get_hendeca_subtype(sylls)
 
 
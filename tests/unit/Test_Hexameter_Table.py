@@ -0,0 +1,74 @@
+import random
+import unittest
+
+from elisio.exceptions import (HexameterException, ScansionException,
+                               VerseCreatorException)
+from elisio.parser.hexameter import (SCANSION_TABLE, TabularHexameter,
+                                     find_hexa_scansions, get_hexa_subtype,
+                                     get_hexa_table_subtype)
+from elisio.parser.verse import Foot
+from elisio.syllable import Weight
+
+ARMA_VIRUMQUE = [Weight.HEAVY, Weight.LIGHT, Weight.LIGHT, Weight.HEAVY, Weight.LIGHT, Weight.LIGHT,
+                 Weight.HEAVY, Weight.HEAVY, Weight.HEAVY, Weight.HEAVY, Weight.HEAVY, Weight.LIGHT,
+                 Weight.LIGHT, Weight.HEAVY, Weight.HEAVY]
+
+
+def parse(lst):
+    hex_class = get_hexa_table_subtype(lst)
+    hex_obj = hex_class('')
+    hex_obj.flat_list = list(lst)
+    hex_obj.parse()
+    return hex_obj.feet
+
+
+class TestHexameterTable(unittest.TestCase):
+
+    def test_table_size(self):
+        self.assertEqual(sum(len(entries) for entries in SCANSION_TABLE.values()), 96)
+        self.assertEqual(sorted(SCANSION_TABLE), list(range(12, 18)))
+
+    def test_table_known_weights(self):
+        expected = [Foot.DACTYLUS, Foot.DACTYLUS, Foot.SPONDAEUS, Foot.SPONDAEUS, Foot.DACTYLUS, Foot.SPONDAEUS]
+        self.assertEqual(find_hexa_scansions(ARMA_VIRUMQUE), [expected])
+        self.assertEqual(parse(ARMA_VIRUMQUE), expected)
+
+    def test_table_all_alternatives(self):
+        lst = [Weight.ANCEPS] * 14
+        scansions = find_hexa_scansions(lst)
+        self.assertEqual(len(scansions), 10)
+        self.assertTrue(all(feet[5] == Foot.BINARY_ANCEPS for feet in scansions))
+
+    def test_table_conflict(self):
+        lst = [Weight.LIGHT] + [Weight.ANCEPS] * 13
+        self.assertEqual(find_hexa_scansions(lst), [])
+        with self.assertRaises(HexameterException):
+            parse(lst)
+
+    def test_table_ambiguous(self):
+        with self.assertRaises(HexameterException):
+            parse([Weight.ANCEPS] * 14)
+
+    def test_table_creator(self):
+        self.assertEqual(get_hexa_table_subtype([Weight.ANCEPS] * 15), TabularHexameter)
+        with self.assertRaises(VerseCreatorException):
+            get_hexa_table_subtype([Weight.ANCEPS] * 11)
+        with self.assertRaises(VerseCreatorException):
+            get_hexa_table_subtype([Weight.ANCEPS] * 18)
+
+    def test_table_cross_check(self):
+        """ every scansion by the rule engine must be one of the scansions in the table """
+        rnd = random.Random(6)
+        for _ in range(2000):
+            length = rnd.choice(list(SCANSION_TABLE))
+            pattern, feet = rnd.choice(SCANSION_TABLE[length])
+            lst = [Weight.ANCEPS if rnd.random() < 0.5 else weight for weight in pattern]
+            scansions = find_hexa_scansions(lst)
+            self.assertIn(list(feet[:5]), [scansion[:5] for scansion in scansions])
+            try:
+                hex_obj = get_hexa_subtype(lst)('')
+                hex_obj.flat_list = list(lst)
+                hex_obj.parse()
+            except ScansionException:
+                continue
+            self.assertIn(hex_obj.feet, scansions)
@@ -0,0 +1,77 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from elisio.bridge import LexiconBridge, LocalDictionaryBridge
+from elisio.lexicon import Lexicon
+from elisio.syllable import Weight
+from elisio.word import Word
+
+ENTRIES = {'arma': ['23'], 'cano': ['13', '11'], 'virum': [], 'ab': ['1'], 'Troiae': ['233']}
+
+
+class TestLexicon(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "lexicon.bin")
+        Lexicon.write(self.path, ENTRIES)
+        self.lexicon = Lexicon(self.path)
+
+    def tearDown(self):
+        self.lexicon.close()
+        self.directory.cleanup()
+
+    def test_lexicon_lookup(self):
+        for word, structures in ENTRIES.items():
+            self.assertEqual(self.lexicon.get(word), structures)
+        self.assertEqual(self.lexicon.get("oris"), [])
+        self.assertEqual(self.lexicon.get("a"), [])
+        self.assertEqual(self.lexicon.get("zzz"), [])
+        self.assertEqual(self.lexicon.get("A"), [])
+
+    def test_lexicon_mapping(self):
+        self.assertEqual(len(self.lexicon), 5)
+        self.assertEqual(list(self.lexicon), sorted(ENTRIES))
+        self.assertIn("virum", self.lexicon)
+        self.assertNotIn("oris", self.lexicon)
+
+    def test_lexicon_empty(self):
+        path = os.path.join(self.directory.name, "empty.bin")
+        Lexicon.write(path, {})
+        with Lexicon(path) as lexicon:
+            self.assertEqual(len(lexicon), 0)
+            self.assertEqual(lexicon.get("arma"), [])
+
+    def test_lexicon_large(self):
+        path = os.path.join(self.directory.name, "large.bin")
+        entries = {f"verbum{count}": [str(count)] for count in range(20000)}
+        Lexicon.write(path, entries)
+        with Lexicon(path) as lexicon:
+            self.assertEqual(len(lexicon), 20000)
+            for count in range(0, 20000, 61):
+                self.assertEqual(lexicon.get(f"verbum{count}"), [str(count)])
+            self.assertEqual(lexicon.get("verbum20000"), [])
+
+    def test_lexicon_invalid(self):
+        path = os.path.join(self.directory.name, "invalid.bin")
+        with open(path, 'wb') as file:
+            file.write(b'ELEX')
+        with self.assertRaises(ValueError):
+            Lexicon(path)
+
+    def test_lexicon_pickle(self):
+        copied = pickle.loads(pickle.dumps(self.lexicon))
+        self.assertEqual(copied.get("cano"), ['13', '11'])
+        copied.close()
+
+    def test_lexicon_bridge(self):
+        path = os.path.join(self.directory.name, "local.bin")
+        LocalDictionaryBridge({'se': ['2']}).write_lexicon(path)
+        bridge = LexiconBridge(path)
+        word = Word("se")
+        word.analyze_structure(bridge)
+        self.assertEqual(word.syllables[0].weight, Weight.HEAVY)
+        self.assertEqual(bridge.use_dictionary("me"), [])
+        bridge.close()
@@ -118,6 +118,12 @@ class TestSpondaicPentameter(unittest.TestCase):
         with self.assertRaises(PentameterException):
             parse(sylls)
 
+    def test_pent_spon_fail_first_position(self):
+        sylls = [Weight.ANCEPS] * 12
+        sylls[1] = sylls[3] = Weight.LIGHT
+        with self.assertRaisesRegex(PentameterException, "on pos 1 of"):
+            parse(sylls)
+
 
 class TestBalancedPentameter(unittest.TestCase):
     def test_pent_bal_basic_1a(self):
@@ -1,7 +1,10 @@
 """ test module for Sound """
+import copy
+import pickle
 import unittest
 
-from elisio.sound import SoundFactory
+from elisio.exceptions import SoundException
+from elisio.sound import ConsonantSound, Diphthong, SoundFactory
 
 
 class TestSound(unittest.TestCase):
@@ -83,3 +86,45 @@ class TestSound(unittest.TestCase):
         self.assertTrue(sound.is_consonant())
         self.assertFalse(sound.is_heavy_making())
         self.assertTrue(sound.is_h())
+
+    def test_sound_interned(self):
+        """ there is only one instance of every sound """
+        self.assertIs(SoundFactory.create('Qv'), SoundFactory.create('qu'))
+        self.assertIs(SoundFactory.create('ae'), Diphthong('a', 'e'))
+        self.assertIs(SoundFactory.create('t'), ConsonantSound('t'))
+        self.assertEqual(hash(SoundFactory.create('j')), hash(SoundFactory.create('i')))
+        self.assertNotEqual(SoundFactory.create('pr'), SoundFactory.create('p'))
+
+    def test_sound_invalid_construction(self):
+        """ an invalid sound cannot be constructed """
+        with self.assertRaises(SoundException):
+            ConsonantSound('q', 'i')
+        with self.assertRaises(SoundException):
+            Diphthong('w')
+
+    def test_sound_immutable(self):
+        sound = SoundFactory.create('r')
+        with self.assertRaises(AttributeError):
+            sound.letters = 'l'
+        with self.assertRaises(AttributeError):
+            sound.vowel = True
+        with self.assertRaises(AttributeError):
+            sound.extra = 1
+        self.assertEqual(sound.letters, 'r')
+
+    def test_sound_copy_pickle(self):
+        """ copies of a sound are the sound itself """
+        for letters in ['a', 'oe', 'x', 'th', 'qu', 'ë']:
+            sound = SoundFactory.create(letters)
+            self.assertIs(copy.copy(sound), sound)
+            self.assertIs(copy.deepcopy(sound), sound)
+            self.assertIs(pickle.loads(pickle.dumps(sound)), sound)
+
+    def test_sound_properties(self):
+        """ the properties are the results of the predicates """
+        for sound in SoundFactory.sound_dict.values():
+            self.assertEqual(sound.vowel, sound.is_vowel())
+            self.assertEqual(sound.consonant, sound.is_consonant())
+            self.assertEqual(sound.aspirate, sound.is_h())
+        self.assertTrue(SoundFactory.create('cl').muta_cum_liquida)
+        self.assertFalse(SoundFactory.create('ch').muta_cum_liquida)
@@ -1,5 +1,7 @@
+import random
 import unittest
 
+from benchmarks.reference import find_sounds_by_windows
 from elisio.exceptions import SoundException
 from elisio.sound import (ConsonantSound, Diphthong, HeavymakerSound,
                           SemivowelSound, Sound, SoundFactory, VowelSound)
@@ -64,6 +66,13 @@ class TestSoundFactory(unittest.TestCase):
         with self.assertRaises(SoundException):
             construct_sound(' ')
 
+    def test_sound_find(self):
+        """ looking up a sound does not raise """
+        self.assertIs(SoundFactory.find('Qv'), construct_sound('qu'))
+        self.assertIsNone(SoundFactory.find('qi'))
+        self.assertIsNone(SoundFactory.find(' '))
+        self.assertIsNone(SoundFactory.find('quo'))
+
     def test_sound_constr_from_text(self):
         """ a regular sound should be created easily """
         sound = SoundFactory.create_sounds_from_text('A')
@@ -154,3 +163,24 @@ class TestSoundFactory(unittest.TestCase):
                            SoundFactory.create('v'), SoundFactory.create('ae')]
         sounds = SoundFactory.find_sounds_for_text('novae')
         self.assertEqual(sounds, expected_sounds)
+
+    def test_sound_factory_tables(self):
+        """ the table-driven tokenizer finds the same sounds as the reference implementation """
+        rnd = random.Random(18)
+        alphabet = "aeiouybcdfghklmnpqrstvxzjAEIOUVQJë"
+        texts = ['athosve', 'aërii', 'Quae', 'quoque', 'iuvenem', 'Aiax', 'euoe', 'ëa', 'novae', 'thea', 'Cthulhu']
+        texts += [''.join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 10))) for _ in range(5000)]
+        for text in texts:
+            expected = find_sounds_by_windows(text)
+            sounds = SoundFactory.find_sounds_for_text(text)
+            self.assertEqual(len(sounds), len(expected), text)
+            for sound, expected_sound in zip(sounds, expected):
+                self.assertEqual(type(sound), type(expected_sound), text)
+                self.assertEqual(sound, expected_sound, text)
+
+    def test_sound_factory_tables_invalid(self):
+        for text in ['arma virumque', 'a1', 'wa', 'aw', 'aiw']:
+            with self.assertRaises(SoundException):
+                find_sounds_by_windows(text)
+            with self.assertRaises(SoundException):
+                SoundFactory.find_sounds_for_text(text)
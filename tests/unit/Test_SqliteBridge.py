@@ -0,0 +1,90 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from elisio.bridge import SqliteBridge
+from elisio.parser.versefactory import VerseFactory, VerseType
+from elisio.syllable import Syllable, Weight
+from elisio.word import Word
+
+
+class TestSqliteBridge(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "elisio.sqlite3")
+        self.bridge = SqliteBridge(self.path)
+
+    def tearDown(self):
+        self.bridge.close()
+        self.directory.cleanup()
+
+    def test_sqlite_dictionary(self):
+        self.assertEqual(self.bridge.use_dictionary("arma"), [])
+        self.bridge.dump([self.bridge.make_entry("arma", "23", 1), self.bridge.make_entry("arma", "23", 2),
+                          self.bridge.make_entry("arma", "21", 3)])
+        self.assertEqual(self.bridge.use_dictionary("arma"), ["21", "23"])
+        self.bridge.close()
+        with SqliteBridge(self.path) as bridge:
+            self.assertEqual(bridge.use_dictionary("arma"), ["21", "23"])
+
+    def test_sqlite_dictionary_many(self):
+        self.bridge.dump([self.bridge.make_entry("arma", "23", 1), self.bridge.make_entry("cano", "13", 1),
+                          self.bridge.make_entry("arma", "21", 2)])
+        words = ["arma", "virum", "cano", "arma"] + [f"verbum{count}" for count in range(1200)]
+        result = self.bridge.use_dictionary_many(words)
+        self.assertEqual(len(result), 1203)
+        self.assertEqual(result["arma"], ["21", "23"])
+        self.assertEqual(result["cano"], ["13"])
+        self.assertEqual(result["virum"], [])
+
+    def test_sqlite_batches(self):
+        self.bridge.batch_size = 3
+        reader = SqliteBridge(self.path)
+        self.bridge.dump([self.bridge.make_entry("arma", "23", 1), self.bridge.make_entry("cano", "13", 1)])
+        self.assertEqual(self.bridge.use_dictionary("arma"), ["23"])
+        self.assertEqual(reader.use_dictionary("arma"), [])
+        self.bridge.dump([self.bridge.make_entry("oris", "23", 1)])
+        self.assertEqual(reader.use_dictionary("arma"), ["23"])
+        self.bridge.dump([self.bridge.make_entry("ab", "1", 1)])
+        self.assertEqual(reader.use_dictionary("ab"), [])
+        self.bridge.flush()
+        self.assertEqual(reader.use_dictionary("ab"), ["1"])
+        reader.close()
+
+    def test_sqlite_deviant(self):
+        self.bridge.add_deviant("amat", [Syllable("a"), Syllable.make_empty_syllable("mat", Weight.HEAVY)])
+        self.assertEqual(self.bridge.split_from_deviant_word("arma"), [])
+        syllables = self.bridge.split_from_deviant_word("amat")
+        self.assertEqual(syllables, [Syllable("a"), Syllable("mat")])
+        self.assertEqual([syll.weight for syll in syllables], [None, Weight.HEAVY])
+        word = Word("amaturus")
+        word.split(self.bridge)
+        self.assertEqual(word.syllables, [Syllable("a"), Syllable("mat"), Syllable("u"), Syllable("rus")])
+
+    def test_sqlite_longest_deviant(self):
+        self.bridge.add_deviant("a", [Syllable("a")])
+        self.bridge.add_deviant("amat", [Syllable("a"), Syllable("mat")])
+        self.assertEqual(len(self.bridge.split_from_deviant_word("amatus")), 2)
+        self.assertEqual(len(self.bridge.split_from_deviant_word("amo")), 1)
+
+    def test_sqlite_deviant_words(self):
+        self.assertEqual(self.bridge.deviant_words(), {})
+        self.bridge.add_deviant("amat", [Syllable("a"), Syllable("mat")])
+        self.bridge.add_deviant("lavinia", [Syllable("la"), Syllable("vi"), Syllable("ni"), Syllable("a")])
+        deviants = self.bridge.deviant_words()
+        self.assertEqual(sorted(deviants), ["amat", "lavinia"])
+        self.assertEqual(deviants["amat"], [Syllable("a"), Syllable("mat")])
+
+    def test_sqlite_pickle(self):
+        self.bridge.dump([self.bridge.make_entry("arma", "23", 1)])
+        self.bridge.flush()
+        copied = pickle.loads(pickle.dumps(self.bridge))
+        self.assertIsNot(copied.connection, self.bridge.connection)
+        self.assertEqual(copied.use_dictionary("arma"), ["23"])
+        copied.close()
+
+    def test_sqlite_save_verse(self):
+        VerseFactory.create("Arma virumque cano, Troiae qui primus ab oris", 1, self.bridge, [VerseType.HEXAMETER])
+        self.assertEqual(self.bridge.use_dictionary("arma"), ["23"])
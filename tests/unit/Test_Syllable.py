@@ -1,9 +1,10 @@
 """ Test classes for Syllable """
+import pickle
 import unittest
 
 from elisio.exceptions import SyllableException
 from elisio.sound import SoundFactory
-from elisio.syllable import Syllable
+from elisio.syllable import Syllable, Weight
 
 
 class TestSyllable(unittest.TestCase):
@@ -322,3 +323,38 @@ class TestSyllable(unittest.TestCase):
         self.assertEqual(Syllable('ui').get_vowel_location(), 1)
         self.assertEqual(Syllable('ia').get_vowel_location(), 1)
         self.assertEqual(Syllable('iu').get_vowel_location(), 1)
+
+    def test_syll_compact(self):
+        """ the sounds are stored as their codes """
+        syllable = Syllable('spraux')
+        self.assertFalse(hasattr(syllable, '__dict__'))
+        self.assertEqual(syllable.codes, bytes(sound.code for sound in syllable.sounds))
+        self.assertEqual(syllable.sounds, SoundFactory.find_sounds_for_text('spraux'))
+        self.assertIsNone(syllable.get_alternative_weight())
+
+    def test_syll_sounds_assignment(self):
+        """ changing the sounds in place, or assigning them, changes the syllable """
+        syllable = Syllable('ti')
+        syllable.sounds.append(SoundFactory.create('t'))
+        self.assertEqual(syllable, Syllable('tit'))
+        syllable.sounds[0] = SoundFactory.create('d')
+        self.assertEqual(syllable, Syllable('dit'))
+        syllable.sounds.insert(0, SoundFactory.create('s'))
+        del syllable.sounds[1]
+        self.assertEqual(syllable, Syllable('sit'))
+        syllable.sounds[1:] = [SoundFactory.create('e'), SoundFactory.create('d')]
+        self.assertEqual(syllable, Syllable('sed'))
+        syllable.sounds = syllable.sounds + [SoundFactory.create('s')]
+        self.assertEqual(syllable, Syllable('seds'))
+        self.assertEqual(syllable.sounds.pop(), SoundFactory.create('s'))
+        self.assertEqual(syllable.sounds, SoundFactory.find_sounds_for_text('sed'))
+        self.assertEqual(repr(syllable), "[s, e, d]")
+
+    def test_syll_copy_pickle(self):
+        syllable = Syllable('quam')
+        syllable.weight = Weight.HEAVY
+        syllable.alternative_weight = Weight.ANCEPS
+        for copied in (syllable.copy(), pickle.loads(pickle.dumps(syllable))):
+            self.assertEqual(copied, syllable)
+            self.assertEqual(copied.weight, Weight.HEAVY)
+            self.assertEqual(copied.get_alternative_weight(), Weight.ANCEPS)
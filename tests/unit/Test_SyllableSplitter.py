@@ -1,9 +1,19 @@
+import random
 import unittest
 
+from benchmarks.reference import join_by_trial
 from elisio.exceptions import SyllableException
 from elisio.syllable import SoundFactory, Syllable, SyllableSplitter
 
 
+def outcome(function, argument):
+    """ the result of a function, or the type of the exception it raises """
+    try:
+        return function(argument)
+    except SyllableException as exc:
+        return type(exc)
+
+
 class TestSyllableSplitter(unittest.TestCase):
 
     def test_syllsplit_basic(self):
@@ -75,3 +85,25 @@ class TestSyllableSplitter(unittest.TestCase):
         syll = SyllableSplitter.redistribute(syll)
         expected = [Syllable('a'), Syllable('ë'), Syllable('ri'), Syllable('i')]
         self.assertEqual(syll, expected)
+
+    def test_syllsplit_gu(self):
+        """ a syllable that starts with GU is decided on all of its sounds """
+        for text in ['sanguis', 'lingua', 'gustus', 'augur', 'guttur', 'ingui']:
+            sounds = SoundFactory.find_sounds_for_text(text)
+            self.assertEqual(outcome(SyllableSplitter.join_into_syllables, sounds),
+                             outcome(join_by_trial, sounds), text)
+
+    def test_syllsplit_cross_check(self):
+        """ the single-pass joiner finds the same syllables as the reference implementation """
+        rnd = random.Random(20)
+        alphabet = "aeiouybcdfghklmnpqrstvxzjë"
+        texts = ['athosve', 'iit', 'volui', 'olio', 'ianus', 'aërii', 'quoque', 'iuvenem', 'sanguine', 'arma']
+        texts += [''.join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 12))) for _ in range(5000)]
+        for text in texts:
+            sounds = SoundFactory.find_sounds_for_text(text)
+            syllables = outcome(SyllableSplitter.join_into_syllables, sounds)
+            expected = outcome(join_by_trial, sounds)
+            self.assertEqual(syllables, expected, text)
+            if isinstance(expected, list):
+                self.assertEqual(outcome(SyllableSplitter.redistribute, syllables),
+                                 outcome(SyllableSplitter.redistribute, expected), text)
@@ -0,0 +1,37 @@
+import unittest
+
+from elisio.utils.trie import PrefixTrie
+
+
+class TestPrefixTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = PrefixTrie()
+        for key in ["a", "ama", "amat", "lavinia"]:
+            self.trie[key] = key.upper()
+
+    def test_trie_mapping(self):
+        self.assertEqual(len(self.trie), 4)
+        self.assertEqual(self.trie["ama"], "AMA")
+        self.assertIn("amat", self.trie)
+        self.assertNotIn("am", self.trie)
+        self.assertNotIn("amatus", self.trie)
+        self.assertEqual(sorted(self.trie), ["a", "ama", "amat", "lavinia"])
+        with self.assertRaises(KeyError):
+            self.trie["lavin"]
+        self.trie["ama"] = "again"
+        self.assertEqual(len(self.trie), 4)
+        self.assertEqual(self.trie["ama"], "again")
+
+    def test_trie_longest_prefix(self):
+        self.assertEqual(self.trie.longest_prefix("amaturus"), "AMAT")
+        self.assertEqual(self.trie.longest_prefix("amamus"), "AMA")
+        self.assertEqual(self.trie.longest_prefix("amo"), "A")
+        self.assertEqual(self.trie.longest_prefix("laviniaque"), "LAVINIA")
+        self.assertIsNone(self.trie.longest_prefix("lavi"))
+        self.assertIsNone(self.trie.longest_prefix("cano"))
+        self.assertIsNone(self.trie.longest_prefix(""))
+
+    def test_trie_empty_key(self):
+        with self.assertRaises(ValueError):
+            self.trie[""] = "nothing"
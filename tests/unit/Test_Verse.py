@@ -1,9 +1,11 @@
 """ Test classes for Verse scanning """
 import unittest
 
-from elisio.exceptions import VerseException
-from elisio.parser.verse import Verse
-from elisio.parser.versefactory import VerseFactory
+from elisio.exceptions import ScansionException, VerseCreatorException, VerseException, VerseSubtypeException
+from elisio.parser.pentameter import SpondaicPentameter
+from elisio.parser.verse import Reason, ScanFailure, Verse
+from elisio.parser.versefactory import VerseFactory, VersePreprocessor, VerseType
+from elisio.parser.weightmask import WeightMask
 from elisio.syllable import Weight
 from elisio.word import Word
 
@@ -161,3 +163,92 @@ class TestVerse(unittest.TestCase):
                            [Weight.ANCEPS, ],
                            [Weight.ANCEPS, Weight.HEAVY]]
         self.assertEqual(layers, expected_result)
+
+    def test_verse_flat_lists_lazy(self):
+        """ elision and hiatus alternatives are generated lazily, most likely first """
+        flat_lists = VersePreprocessor('multo ille et').get_flat_lists()
+        self.assertEqual(next(flat_lists), WeightMask.from_pattern("---"))
+        self.assertEqual(list(flat_lists), [WeightMask.from_pattern("-x--"), WeightMask.from_pattern("--x-"),
+                                            WeightMask.from_pattern("-x-x-")])
+
+    def test_verse_words_analyzed_once(self):
+        """ a pentameter is only found by the second creator, which must reuse the analyzed words """
+        preprocessor = VersePreprocessor("tres sumus; hoc illi praetulit auctor opus", creators=VerseType.UNKNOWN)
+        flat_lists = list(preprocessor.get_flat_lists())
+        layers = preprocessor.layer()
+        verse = preprocessor.create_verse(0)
+        self.assertEqual(len(verse.words), 7)
+        self.assertIs(preprocessor.layer(), layers)
+        self.assertEqual(list(preprocessor.get_flat_lists()), flat_lists)
+
+    def test_verse_creators_ordered(self):
+        preprocessor = VersePreprocessor(TYPICAL_VERSE, creators=[VerseType.HEXAMETER, VerseType.UNKNOWN])
+        self.assertEqual(len(preprocessor.creators), 2)
+        self.assertEqual(preprocessor.creators, VerseType.UNKNOWN.get_creators())
+
+    def test_verse_create_all(self):
+        text = "necdum etiam causae irarum saevique dolores"
+        verses = VerseFactory.create_all(text, creators=VerseType.HEXAMETER)
+        self.assertGreater(len(verses), 1)
+        self.assertEqual(verses[0].structure(), VerseFactory.create(text, creators=[VerseType.HEXAMETER]).structure())
+        scores = [verse.score for verse in verses]
+        self.assertEqual(scores, sorted(scores))
+        self.assertEqual(scores[0].hiatuses, 0)
+        self.assertEqual(scores[-1].hiatuses, 1)
+        # every verse has its own words, and the hiatus is kept in the words of the last one
+        self.assertIsNot(verses[0].words[0], verses[-1].words[0])
+        elisions = [[syll.weight for word in verse.words for syll in word.syllables].count(Weight.NONE)
+                    for verse in verses]
+        self.assertEqual(elisions[0], elisions[-1] + 1)
+
+    def test_verse_create_all_impossible(self):
+        self.assertEqual(VerseFactory.create_all("arma", creators=VerseType.UNKNOWN), [])
+
+    def test_verse_scan_result(self):
+        result = VersePreprocessor(TYPICAL_VERSE, creators=VerseType.HEXAMETER).scan()
+        self.assertTrue(result.ok)
+        self.assertEqual(result.failures, ())
+        self.assertIs(result.get_verse(), result.verse)
+
+    def test_verse_scan_result_failures(self):
+        """ failed candidates are returned as plain data, and only raised at the public API """
+        text = "necdum etiam causae irarum saevique dolores"
+        result = VersePreprocessor(text, creators=VerseType.PENTAMETER).scan()
+        self.assertFalse(result.ok)
+        self.assertTrue(result.failures)
+        self.assertTrue(all(isinstance(failure, ScanFailure) for failure in result.failures))
+        with self.assertRaises(ScansionException) as context:
+            result.get_verse()
+        with self.assertRaises(type(context.exception)) as expected:
+            VerseFactory.create(text, creators=VerseType.PENTAMETER)
+        self.assertEqual(context.exception.message, expected.exception.message)
+        self.assertEqual([str(exc) for exc in context.exception.exceptions],
+                         [str(exc) for exc in expected.exception.exceptions])
+
+    def test_verse_scan_result_creator(self):
+        """ a creator that rejects the syllable count passes the verse on to the next one """
+        result = VersePreprocessor("arma", creators=VerseType.UNKNOWN).scan()
+        self.assertEqual(len(result.failures), 2)
+        self.assertEqual([failure.reason for failure in result.failures], [Reason.SYLLABLE_COUNT] * 2)
+        self.assertEqual([failure.creator for failure in result.failures], ['get_hexa_subtype', 'get_penta_subtype'])
+        self.assertIsInstance(result.exception(), VerseCreatorException)
+
+    def test_verse_scan_failure_reason(self):
+        """ the reason of a failed candidate follows from the exception that rejected it """
+        self.assertEqual(ScanFailure.of(VerseCreatorException("too few syllables")).reason, Reason.SYLLABLE_COUNT)
+        self.assertEqual(ScanFailure.of(VerseSubtypeException("not enough information")).reason, Reason.SUBTYPE)
+        self.assertEqual(ScanFailure.of(VerseException("impossible")).reason, Reason.SCANSION)
+
+    def test_verse_scan_mixed_meters(self):
+        """ a pentameter has too few syllables for a hexameter, and is scanned by the next creator """
+        text = "sic uos non uobis mellificatis apes"
+        verse = VerseFactory.create(text, creators=VerseType.UNKNOWN)
+        self.assertIsInstance(verse, SpondaicPentameter)
+        self.assertEqual(verse.structure(), VerseFactory.create(text, creators=VerseType.PENTAMETER).structure())
+
+    def test_verse_exception_repr(self):
+        """ the problems of a failed verse are listed one per line """
+        exc = VerseException("parsing did not succeed", VerseCreatorException("too few syllables"),
+                             VerseException("weight #3 was already Weight.LIGHT"))
+        self.assertEqual(repr(exc), "parsing did not succeed\nVerseCreatorException: too few syllables"
+                                    "\nVerseException: weight #3 was already Weight.LIGHT")
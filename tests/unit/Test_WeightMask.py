@@ -0,0 +1,73 @@
+import unittest
+
+from elisio.exceptions import PentameterException
+from elisio.parser.pentameter import SpondaicPentameter
+from elisio.parser.weightmask import WeightMask
+from elisio.syllable import Weight
+
+WEIGHTS = [Weight.HEAVY, Weight.ANCEPS, Weight.LIGHT, Weight.HEAVY]
+
+
+class TestWeightMask(unittest.TestCase):
+
+    def test_mask_encode(self):
+        mask = WeightMask.from_weights(WEIGHTS)
+        self.assertEqual((mask.heavy, mask.light, mask.length), (0b1001, 0b0100, 4))
+        self.assertEqual(repr(mask), "-xu-")
+        self.assertEqual(mask.anceps_count(), 1)
+
+    def test_mask_sequence(self):
+        mask = WeightMask.from_weights(WEIGHTS)
+        self.assertEqual(len(mask), 4)
+        self.assertEqual(mask[0], Weight.HEAVY)
+        self.assertEqual(mask[-2], Weight.LIGHT)
+        self.assertEqual(mask[1:3], [Weight.ANCEPS, Weight.LIGHT])
+        self.assertEqual(list(mask), WEIGHTS)
+        self.assertEqual(mask, WEIGHTS)
+        with self.assertRaises(IndexError):
+            mask[4]
+
+    def test_mask_equal(self):
+        self.assertEqual(WeightMask.from_weights(WEIGHTS), WeightMask.from_pattern("-xu-"))
+        self.assertNotEqual(WeightMask.from_weights(WEIGHTS), WeightMask.from_pattern("-xu-x"))
+        self.assertEqual(len({WeightMask.from_weights(WEIGHTS), WeightMask.from_pattern("-xu-")}), 1)
+
+    def test_mask_of(self):
+        mask = WeightMask.from_weights(WEIGHTS)
+        self.assertIs(WeightMask.of(mask), mask)
+        self.assertEqual(WeightMask.of(WEIGHTS), mask)
+
+    def test_mask_fail(self):
+        with self.assertRaises(ValueError):
+            WeightMask.from_weights([Weight.NONE])
+        with self.assertRaises(ValueError):
+            WeightMask(1, 1, 1)
+        with self.assertRaises(ValueError):
+            WeightMask(4, 0, 2)
+
+    def test_mask_conflicts(self):
+        mask = WeightMask.from_weights(WEIGHTS)
+        self.assertFalse(mask.conflicts(WeightMask.from_pattern("-uu-")))
+        self.assertTrue(mask.conflicts(WeightMask.from_pattern("u")))
+        self.assertTrue(mask.conflicts(WeightMask.from_pattern("xx-")))
+        self.assertFalse(mask.conflicts(WeightMask.from_pattern("u-"), 2))
+        self.assertTrue(mask.conflicts(WeightMask.from_pattern("-u"), 2))
+
+    def test_mask_merge(self):
+        mask = WeightMask.from_weights(WEIGHTS)
+        self.assertEqual(repr(mask.merge(WeightMask.from_pattern("-u"))), "-uu-")
+        self.assertEqual(repr(mask.merge(WeightMask.from_pattern("x-"), 2)), "-xu-")
+
+    def test_mask_verse(self):
+        # a verse keeps its mask for the checks, and only expands it into a list to parse it
+        mask = WeightMask.from_pattern("--u---uu-uu-")
+        verse = SpondaicPentameter('', mask)
+        with self.assertRaises(PentameterException):
+            verse.scan()
+        self.assertIs(verse.get_mask(), mask)
+        self.assertEqual(verse.flat_list, list(mask))
+        verse.flat_list[2] = Weight.HEAVY
+        self.assertEqual(repr(verse.get_mask()), "------uu-uu-")
+        verse.scan()
+        verse.set_mask(mask)
+        self.assertEqual(verse.flat_list[2], Weight.LIGHT)
@@ -2,10 +2,11 @@
 
 import unittest
 
-from elisio.exceptions import WordException
+from elisio.bridge import LocalDictionaryBridge
+from elisio.exceptions import SyllableException, WordException
 from elisio.parser.verse import Weight
 from elisio.syllable import Syllable
-from elisio.word import Word
+from elisio.word import Word, get_word_template
 
 TYPICAL_WORD = "recentia"
 SYLLABLES = ['re', 'cen', 'ti', 'a']
@@ -499,3 +500,40 @@ class TestWord(unittest.TestCase):
         self.assertTrue(word.ends_in_enclitic())
         self.assertEqual('in', word.without_enclitic())
         self.assertEqual('que', word.enclitic)
+
+    def test_word_template_clone(self):
+        """ a repeated word form is cloned from its template, not shared """
+        word1 = self.construct_word()
+        word1.analyze_structure()
+        word2 = self.construct_word()
+        word2.analyze_structure()
+        self.assertEqual(word1.syllables, word2.syllables)
+        self.assertEqual(word2.get_syllable_structure(), EXPECTED_WEIGHTS)
+        self.assertIsNot(word1.syllables[0], word2.syllables[0])
+        word1.syllables[0].weight = Weight.HEAVY
+        self.assertEqual(word2.syllables[0].weight, Weight.ANCEPS)
+        self.assertIn((), get_word_template(TYPICAL_WORD).analyzed)
+
+    def test_word_copy(self):
+        word = self.construct_word()
+        word.analyze_structure()
+        copied = word.copy()
+        self.assertEqual(copied, word)
+        self.assertEqual(copied.get_syllable_structure(), EXPECTED_WEIGHTS)
+        copied.syllables[0].weight = Weight.HEAVY
+        self.assertEqual(word.syllables[0].weight, Weight.ANCEPS)
+
+    def test_word_split_unknown_fail(self):
+        """ a word that cannot be split fails as such, even if the dictionary does not know it """
+        for _ in range(2):
+            with self.assertRaises(SyllableException):
+                self.construct_word('brr').split(LocalDictionaryBridge({}))
+
+    def test_word_template_follows_bridge(self):
+        """ a changed answer of the dictionary is not hidden by the template """
+        word = self.construct_word('se')
+        word.analyze_structure(LocalDictionaryBridge({'se': ['2']}))
+        self.assertEqual(word.get_syllable_structure(), [Weight.HEAVY])
+        word = self.construct_word('se')
+        word.analyze_structure(LocalDictionaryBridge({'se': ['1']}))
+        self.assertEqual(word.get_syllable_structure(), [Weight.LIGHT])